@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from core.domain.candidate import Candidate
 from core.ports.repositories.candidate_repository import CandidateRepository
+from core.services.embedding_service import is_compatible_embedding
 from adapters.repositories.memory.memory_repository import MemoryRepository
 
 
@@ -12,4 +13,52 @@ class MemoryCandidateRepository(MemoryRepository[Candidate], CandidateRepository
         """Find candidates by location."""
         return [
             candidate for candidate in self._storage.values() if candidate.location == location
-        ]
\ No newline at end of file
+        ]
+
+    async def find_stale_embeddings(self, limit: int = 100) -> List[Candidate]:
+        """Find candidates whose embedding has to be (re)computed, oldest id first."""
+        stale = sorted(
+            (
+                candidate
+                for candidate in self._storage.values()
+                if candidate.embedding_stale
+            ),
+            key=lambda candidate: candidate.id,
+        )
+        return stale[:limit]
+
+    async def invalidate_embeddings(self, model_name: str, dimension: int) -> int:
+        """Mark candidates stale whose embedding another backend produced."""
+        invalidated = 0
+        for candidate in self._storage.values():
+            if (
+                not candidate.embedding_stale
+                and candidate.embedding is not None
+                and not is_compatible_embedding(
+                    candidate.embedding, candidate.embedding_model, model_name, dimension
+                )
+            ):
+                candidate.embedding_stale = True
+                invalidated += 1
+        return invalidated
+
+    async def save_embeddings(
+        self,
+        embeddings: Sequence[Tuple[str, str, Sequence[float]]],
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        """Store computed embeddings whose profile is unchanged."""
+        saved = []
+        for id, fingerprint, embedding in embeddings:
+            candidate = self._storage.get(id)
+            if candidate is None or candidate.embedding_fingerprint not in (
+                fingerprint,
+                None,
+            ):
+                continue
+            candidate.embedding = embedding
+            candidate.embedding_fingerprint = fingerprint
+            candidate.embedding_stale = False
+            candidate.embedding_model = model_name
+            saved.append(id)
+        return saved
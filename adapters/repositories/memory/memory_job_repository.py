@@ -1,25 +1,158 @@
-from datetime import date
-from typing import List, Optional
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from core.domain.job import Job
+from core.domain.job_filter import JobFilter
+from core.domain.job_projection import JobProjection
 from core.ports.repositories.job_repository import JobRepository
+from core.services.embedding_service import is_compatible_embedding
 from adapters.repositories.memory.memory_repository import MemoryRepository
 
 
 class MemoryJobRepository(MemoryRepository[Job], JobRepository):
     """Memory implementation of Job repository."""
 
+    def __init__(self):
+        super().__init__()
+        # Time of each job's last write, for find_index_embeddings
+        self._updated_at: Dict[str, datetime] = {}
+
+    async def create(self, entity: Job) -> Job:
+        """Create a new job."""
+        created = await super().create(entity)
+        self._updated_at[created.id] = datetime.now()
+        return created
+
+    async def create_many(self, entities: List[Job]) -> List[Job]:
+        """Create many jobs at once."""
+        created = await super().create_many(entities)
+        now = datetime.now()
+        for job in created:
+            self._updated_at[job.id] = now
+        return created
+
+    async def update(self, id: str, entity: Job) -> Optional[Job]:
+        """Update a job."""
+        updated = await super().update(id, entity)
+        if updated is not None:
+            self._updated_at[id] = datetime.now()
+        return updated
+
+    async def delete(self, id: str) -> bool:
+        """Delete a job."""
+        self._updated_at.pop(id, None)
+        return await super().delete(id)
+
     async def find_by_category(self, category: str) -> List[Job]:
         """Find jobs by category."""
         return [job for job in self._storage.values() if job.category == category]
 
-    async def find_available(self, current_date: Optional[date] = None) -> List[Job]:
+    async def find_available(
+        self, current_date: Optional[date] = None, filters: Optional[JobFilter] = None
+    ) -> List[Job]:
         """Find jobs that are still available for application."""
         if current_date is None:
             current_date = date.today()
         return [
             job
             for job in self._storage.values()
-            if job.application_end_date is None
-            or job.application_end_date >= current_date
-        ]
\ No newline at end of file
+            if job.is_available(current_date)
+            and (filters is None or filters.matches(job))
+        ]
+
+    async def find_available_for_scoring(
+        self,
+        current_date: Optional[date] = None,
+        filters: Optional[JobFilter] = None,
+        ids: Optional[List[str]] = None,
+    ) -> List[JobProjection]:
+        """Find the scoring projections of available jobs."""
+        jobs = await self.find_available(current_date, filters)
+        if ids is not None:
+            wanted = set(ids)
+            jobs = [job for job in jobs if job.id in wanted]
+        return [JobProjection.from_job(job) for job in jobs]
+
+    async def corpus_state(self) -> Tuple[int, Optional[datetime]]:
+        """Number of jobs and the time of the latest job write."""
+        return len(self._storage), max(self._updated_at.values(), default=None)
+
+    async def find_index_embeddings(
+        self,
+        after: Optional[str] = None,
+        limit: int = 1000,
+        updated_since: Optional[datetime] = None,
+        current_date: Optional[date] = None,
+        model_name: Optional[str] = None,
+        dimension: Optional[int] = None,
+    ) -> List[Tuple[str, Optional[np.ndarray]]]:
+        """(id, embedding) of jobs ordered by id, starting after id ``after``."""
+        if current_date is None:
+            current_date = date.today()
+        start = bisect_right(self._ids, after) if after is not None else 0
+        items = []
+        for id in self._ids[start:]:
+            if len(items) == limit:
+                break
+            if updated_since is not None and self._updated_at[id] < updated_since:
+                continue
+            job = self._storage[id]
+            usable = job.is_available(current_date) and (
+                model_name is None
+                or is_compatible_embedding(
+                    job.embedding, job.embedding_model, model_name, dimension
+                )
+            )
+            items.append((id, job.embedding if usable else None))
+        return items
+
+    async def list_ids_after(self, after: Optional[str] = None, limit: int = 1000) -> List[str]:
+        """Ids of all jobs ordered by id, starting after id ``after``."""
+        start = bisect_right(self._ids, after) if after is not None else 0
+        return self._ids[start : start + limit]
+
+    async def find_stale_embeddings(self, limit: int = 100) -> List[Job]:
+        """Find jobs whose embedding has to be (re)computed, oldest id first."""
+        stale = sorted(
+            (job for job in self._storage.values() if job.embedding_stale),
+            key=lambda job: job.id,
+        )
+        return stale[:limit]
+
+    async def invalidate_embeddings(self, model_name: str, dimension: int) -> int:
+        """Mark jobs stale whose embedding another backend produced."""
+        invalidated = 0
+        for job in self._storage.values():
+            if (
+                not job.embedding_stale
+                and job.embedding is not None
+                and not is_compatible_embedding(
+                    job.embedding, job.embedding_model, model_name, dimension
+                )
+            ):
+                job.embedding_stale = True
+                self._updated_at[job.id] = datetime.now()
+                invalidated += 1
+        return invalidated
+
+    async def save_embeddings(
+        self,
+        embeddings: Sequence[Tuple[str, str, Sequence[float]]],
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        """Store computed embeddings whose job text is unchanged."""
+        saved = []
+        for id, fingerprint, embedding in embeddings:
+            job = self._storage.get(id)
+            if job is None or job.embedding_fingerprint not in (fingerprint, None):
+                continue
+            job.embedding = embedding
+            job.embedding_fingerprint = fingerprint
+            job.embedding_stale = False
+            job.embedding_model = model_name
+            self._updated_at[id] = datetime.now()
+            saved.append(id)
+        return saved
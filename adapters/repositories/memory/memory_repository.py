@@ -1,3 +1,4 @@
+from bisect import bisect_left, bisect_right, insort
 from datetime import date
 from typing import Dict, Generic, List, Optional, TypeVar
 import uuid
@@ -12,22 +13,45 @@ class MemoryRepository(BaseRepository[T], Generic[T]):
 
     def __init__(self):
         self._storage: Dict[str, T] = {}
+        # Sorted ids, so list_after can seek to a cursor
+        self._ids: List[str] = []
 
     async def get(self, id: str) -> Optional[T]:
         """Get an entity by id."""
         return self._storage.get(id)
 
+    async def get_many(self, ids: List[str]) -> List[T]:
+        """Get the entities for the given ids; missing ids are skipped."""
+        return [self._storage[id] for id in ids if id in self._storage]
+
     async def list(self, skip: int = 0, limit: int = 100) -> List[T]:
         """List entities with pagination."""
         return list(self._storage.values())[skip : skip + limit]
 
+    async def list_after(self, after: Optional[str] = None, limit: int = 100) -> List[T]:
+        """List entities ordered by id, starting after id ``after``."""
+        start = bisect_right(self._ids, after) if after is not None else 0
+        return [self._storage[id] for id in self._ids[start : start + limit]]
+
     async def create(self, entity: T) -> T:
         """Create a new entity."""
         if not getattr(entity, "id", None):
             setattr(entity, "id", str(uuid.uuid4()))
+        if entity.id not in self._storage:
+            insort(self._ids, entity.id)
         self._storage[entity.id] = entity
         return entity
 
+    async def create_many(self, entities: List[T]) -> List[T]:
+        """Create many entities at once."""
+        for entity in entities:
+            if not getattr(entity, "id", None):
+                setattr(entity, "id", str(uuid.uuid4()))
+            if entity.id not in self._storage:
+                insort(self._ids, entity.id)
+            self._storage[entity.id] = entity
+        return list(entities)
+
     async def update(self, id: str, entity: T) -> Optional[T]:
         """Update an entity."""
         if id not in self._storage:
@@ -42,4 +66,5 @@ class MemoryRepository(BaseRepository[T], Generic[T]):
         if id not in self._storage:
             return False
         del self._storage[id]
+        del self._ids[bisect_left(self._ids, id)]
         return True
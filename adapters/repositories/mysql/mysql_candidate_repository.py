@@ -1,12 +1,13 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import or_, update
 
 from core.domain.candidate import Candidate
 from core.ports.repositories.candidate_repository import CandidateRepository
 from adapters.repositories.mysql.mysql_repository import MySQLRepository
-from infrastructure.db.models import CandidateModel
+from infrastructure.db.models import CandidateModel, embedding_metadata, incompatible_embedding
 
 
 class MySQLCandidateRepository(MySQLRepository[Candidate, CandidateModel], CandidateRepository):
@@ -21,4 +22,73 @@ class MySQLCandidateRepository(MySQLRepository[Candidate, CandidateModel], Candi
             select(CandidateModel).where(CandidateModel.location == location)
         )
         models = result.scalars().all()
-        return [model.to_domain() for model in models]
\ No newline at end of file
+        return [model.to_domain() for model in models]
+
+    async def find_stale_embeddings(self, limit: int = 100) -> List[Candidate]:
+        """Find candidates whose embedding has to be (re)computed, oldest id first.
+
+        The rows are locked until save_embeddings commits, and rows locked
+        by another process's worker are skipped, so each stale row is
+        encoded once however many API processes run a worker.
+        """
+        result = await self.session.execute(
+            select(CandidateModel)
+            .where(CandidateModel.embedding_stale.is_(True))
+            .order_by(CandidateModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        models = result.scalars().all()
+        return [model.to_domain() for model in models]
+
+    async def invalidate_embeddings(self, model_name: str, dimension: int) -> int:
+        """Mark candidates stale whose embedding another backend produced.
+
+        One UPDATE over the whole table, so it is meant to run when the
+        backend changes, not on every poll for stale candidates.
+        """
+        result = await self.session.execute(
+            update(CandidateModel)
+            .where(
+                CandidateModel.embedding_stale.is_(False),
+                incompatible_embedding(CandidateModel, model_name, dimension),
+            )
+            .values(embedding_stale=True)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def save_embeddings(
+        self,
+        embeddings: Sequence[Tuple[str, str, Sequence[float]]],
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        """Store computed embeddings whose profile is unchanged, in one transaction.
+
+        The fingerprint check is part of each UPDATE, so a candidate edited
+        while its embedding was computed keeps its stale flag.
+        """
+        saved = []
+        for id, fingerprint, embedding in embeddings:
+            result = await self.session.execute(
+                update(CandidateModel)
+                .where(
+                    CandidateModel.id == id,
+                    or_(
+                        CandidateModel.embedding_fingerprint == fingerprint,
+                        CandidateModel.embedding_fingerprint.is_(None),
+                    ),
+                )
+                .values(
+                    embedding=embedding,
+                    **embedding_metadata(embedding, model_name),
+                    embedding_fingerprint=fingerprint,
+                    embedding_stale=False,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                saved.append(id)
+        await self.session.commit()
+        return saved
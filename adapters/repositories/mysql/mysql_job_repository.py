@@ -1,13 +1,18 @@
-from typing import List, Optional
-from datetime import date
+from typing import List, Optional, Sequence, Tuple
+from datetime import date, datetime
+
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import or_
+from sqlalchemy import func, or_, update
 
 from core.domain.job import Job
+from core.domain.job_filter import JobFilter
+from core.domain.job_projection import JobProjection
 from core.ports.repositories.job_repository import JobRepository
+from core.services.embedding_service import is_compatible_embedding
 from adapters.repositories.mysql.mysql_repository import MySQLRepository
-from infrastructure.db.models import JobModel
+from infrastructure.db.models import JobModel, embedding_metadata, incompatible_embedding
 
 
 class MySQLJobRepository(MySQLRepository[Job, JobModel], JobRepository):
@@ -24,17 +29,243 @@ class MySQLJobRepository(MySQLRepository[Job, JobModel], JobRepository):
         models = result.scalars().all()
         return [model.to_domain() for model in models]
 
-    async def find_available(self, current_date: Optional[date] = None) -> List[Job]:
-        """Find jobs that are still available for application."""
+    async def find_available(
+        self, current_date: Optional[date] = None, filters: Optional[JobFilter] = None
+    ) -> List[Job]:
+        """Find jobs that are still available for application.
+
+        Filters are applied in SQL so only eligible rows are loaded.
+        """
+        result = await self.session.execute(
+            select(JobModel).where(*self._available_clauses(current_date, filters))
+        )
+        models = result.scalars().all()
+        return [model.to_domain() for model in models]
+
+    async def find_available_for_scoring(
+        self,
+        current_date: Optional[date] = None,
+        filters: Optional[JobFilter] = None,
+        ids: Optional[List[str]] = None,
+    ) -> List[JobProjection]:
+        """Find the scoring projections of available jobs.
+
+        Selects only the scoring columns, with the education and experience
+        requirements extracted from the JSON in SQL.
+        """
+        clauses = self._available_clauses(current_date, filters)
+        if ids is not None:
+            if not ids:
+                return []
+            clauses.append(JobModel.id.in_(ids))
+        result = await self.session.execute(
+            select(
+                JobModel.id,
+                JobModel.embedding,
+                JobModel.location,
+                JobModel.category,
+                JobModel.requirements["education"].as_string(),
+                JobModel.requirements["experience"].as_string(),
+                JobModel.application_end_date,
+                JobModel.keywords,
+                JobModel.embedding_model,
+            ).where(*clauses)
+        )
+        return [
+            JobProjection(
+                id=id,
+                embedding=embedding,
+                location=location,
+                category=category,
+                requirements={
+                    key: value
+                    for key, value in (("education", education), ("experience", experience))
+                    if value
+                },
+                application_end_date=application_end_date,
+                keywords=frozenset(keywords.split()) if keywords else frozenset(),
+                embedding_model=embedding_model,
+            )
+            for (
+                id,
+                embedding,
+                location,
+                category,
+                education,
+                experience,
+                application_end_date,
+                keywords,
+                embedding_model,
+            ) in result.all()
+        ]
+
+    async def corpus_state(self) -> Tuple[int, Optional[datetime]]:
+        """Number of jobs and the time of the latest job write.
+
+        Both aggregates are read from the ``updated_at`` index. Deletes
+        only show in the count.
+        """
+        result = await self.session.execute(
+            select(func.count(), func.max(JobModel.updated_at)).select_from(JobModel)
+        )
+        count, updated_at = result.one()
+        return count, updated_at
+
+    async def find_index_embeddings(
+        self,
+        after: Optional[str] = None,
+        limit: int = 1000,
+        updated_since: Optional[datetime] = None,
+        current_date: Optional[date] = None,
+        model_name: Optional[str] = None,
+        dimension: Optional[int] = None,
+    ) -> List[Tuple[str, Optional[np.ndarray]]]:
+        """(id, embedding) of jobs ordered by id, starting after id ``after``.
+
+        Seeks on the primary key like list_after; availability is
+        evaluated in SQL, and unavailable jobs come back without their
+        embedding, like jobs embedded by another backend than
+        ``model_name``.
+        """
         if current_date is None:
             current_date = date.today()
-        result = await self.session.execute(
-            select(JobModel).where(
-                or_(
-                    JobModel.application_end_date.is_(None),
-                    JobModel.application_end_date >= current_date
-                )
+        query = (
+            select(
+                JobModel.id,
+                JobModel.embedding,
+                JobModel.embedding_model,
+                JobModel.available_until >= current_date,
             )
+            .order_by(JobModel.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(JobModel.id > after)
+        if updated_since is not None:
+            query = query.where(JobModel.updated_at >= updated_since)
+        result = await self.session.execute(query)
+        items = []
+        for id, embedding, embedding_model, available in result.all():
+            if model_name is not None and not is_compatible_embedding(
+                embedding, embedding_model, model_name, dimension
+            ):
+                available = False
+            items.append((id, embedding if available else None))
+        return items
+
+    async def list_ids_after(self, after: Optional[str] = None, limit: int = 1000) -> List[str]:
+        """Ids of all jobs ordered by id, read from the primary key only."""
+        query = select(JobModel.id).order_by(JobModel.id).limit(limit)
+        if after is not None:
+            query = query.where(JobModel.id > after)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def find_stale_embeddings(self, limit: int = 100) -> List[Job]:
+        """Find jobs whose embedding has to be (re)computed, oldest id first.
+
+        The rows are locked until save_embeddings commits, and rows locked
+        by another process's worker are skipped, so each stale row is
+        encoded once however many API processes run a worker.
+        """
+        result = await self.session.execute(
+            select(JobModel)
+            .where(JobModel.embedding_stale.is_(True))
+            .order_by(JobModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
         models = result.scalars().all()
-        return [model.to_domain() for model in models]
\ No newline at end of file
+        return [model.to_domain() for model in models]
+
+    async def invalidate_embeddings(self, model_name: str, dimension: int) -> int:
+        """Mark jobs stale whose embedding another backend produced.
+
+        One UPDATE over the whole table, so it is meant to run when the
+        backend changes, not on every poll for stale jobs.
+        """
+        result = await self.session.execute(
+            update(JobModel)
+            .where(
+                JobModel.embedding_stale.is_(False),
+                incompatible_embedding(JobModel, model_name, dimension),
+            )
+            .values(embedding_stale=True)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def save_embeddings(
+        self,
+        embeddings: Sequence[Tuple[str, str, Sequence[float]]],
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        """Store computed embeddings whose job text is unchanged, in one transaction.
+
+        The fingerprint check is part of each UPDATE, so a job edited while
+        its embedding was computed keeps its stale flag.
+        """
+        saved = []
+        for id, fingerprint, embedding in embeddings:
+            result = await self.session.execute(
+                update(JobModel)
+                .where(
+                    JobModel.id == id,
+                    or_(
+                        JobModel.embedding_fingerprint == fingerprint,
+                        JobModel.embedding_fingerprint.is_(None),
+                    ),
+                )
+                .values(
+                    embedding=embedding,
+                    **embedding_metadata(embedding, model_name),
+                    embedding_fingerprint=fingerprint,
+                    embedding_stale=False,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                saved.append(id)
+        await self.session.commit()
+        return saved
+
+    def _available_clauses(
+        self, current_date: Optional[date], filters: Optional[JobFilter]
+    ) -> list:
+        """WHERE conditions for jobs open for application and matching filters.
+
+        ``available_until`` is the end date with open-ended jobs mapped to
+        9999-12-31, so availability is one range condition an index can
+        serve instead of an OR with ``IS NULL``.
+        """
+        if current_date is None:
+            current_date = date.today()
+        return [
+            JobModel.available_until >= current_date,
+            *self._filter_clauses(filters),
+        ]
+
+    @staticmethod
+    def _filter_clauses(filters: Optional[JobFilter]) -> list:
+        """SQL conditions equivalent to JobFilter.matches.
+
+        String columns use MySQL's case-insensitive default collation, so
+        plain comparisons stay index-friendly. The experience level is
+        compared with its generated, lower-cased and indexed column rather
+        than extracted from the JSON per row.
+        """
+        if filters is None:
+            return []
+        clauses = []
+        if filters.category:
+            clauses.append(JobModel.category == filters.category)
+        if filters.company:
+            clauses.append(JobModel.company == filters.company)
+        if filters.location:
+            clauses.append(JobModel.location.contains(filters.location, autoescape=True))
+        if filters.min_salary is not None:
+            clauses.append(JobModel.salary >= filters.min_salary)
+        if filters.experience_level:
+            clauses.append(JobModel.experience_level == filters.experience_level.lower())
+        return clauses
\ No newline at end of file
@@ -1,6 +1,9 @@
-from typing import Dict, Generic, List, Optional, Type, TypeVar
+import copy
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 import uuid
 
+import numpy as np
+from sqlalchemy import delete, inspect, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -20,6 +23,16 @@ class MySQLRepository(BaseRepository[T], Generic[T, M]):
         self.session = session
         self.model_class = model_class
         self.domain_class = domain_class
+        # Columns written from the domain; generated columns and columns
+        # maintained on every write (such as updated_at) are left out
+        self._column_keys = [
+            attr.key
+            for attr in inspect(model_class).column_attrs
+            if attr.columns[0].computed is None and attr.columns[0].onupdate is None
+        ]
+        # Column values of the rows loaded by get/get_many, by id, which
+        # update diffs against to write only the changed columns
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
 
     async def get(self, id: str) -> Optional[T]:
         """Get an entity by id."""
@@ -31,7 +44,18 @@ class MySQLRepository(BaseRepository[T], Generic[T, M]):
         if model is None:
             return None
 
-        return model.to_domain()
+        return self._to_domain(model)
+
+    async def get_many(self, ids: List[str]) -> List[T]:
+        """Get the entities for the given ids in one IN (...) query."""
+        if not ids:
+            return []
+        result = await self.session.execute(
+            select(self.model_class).where(self.model_class.id.in_(ids))
+        )
+        models = result.scalars().all()
+
+        return [self._to_domain(model) for model in models]
 
     async def list(self, skip: int = 0, limit: int = 100) -> List[T]:
         """List entities with pagination."""
@@ -42,6 +66,20 @@ class MySQLRepository(BaseRepository[T], Generic[T, M]):
 
         return [model.to_domain() for model in models]
 
+    async def list_after(self, after: Optional[str] = None, limit: int = 100) -> List[T]:
+        """List entities ordered by id, starting after id ``after``.
+
+        Seeks on the primary key (``WHERE id > :after ORDER BY id``), so
+        deep pages don't scan the rows before them like OFFSET does.
+        """
+        query = select(self.model_class).order_by(self.model_class.id).limit(limit)
+        if after is not None:
+            query = query.where(self.model_class.id > after)
+        result = await self.session.execute(query)
+        models = result.scalars().all()
+
+        return [model.to_domain() for model in models]
+
     async def create(self, entity: T) -> T:
         """Create a new entity."""
         if not getattr(entity, "id", None):
@@ -49,45 +87,119 @@ class MySQLRepository(BaseRepository[T], Generic[T, M]):
 
         model = self.model_class.from_domain(entity)
         self.session.add(model)
-        await self.session.commit()
-
+        try:
+            await self.session.commit()
+        except Exception:
+            # Leave the session usable for the next write
+            await self.session.rollback()
+            raise
+
+        self._snapshots[entity.id] = self._snapshot(model)
         return entity
 
-    async def update(self, id: str, entity: T) -> Optional[T]:
-        """Update an entity."""
-        result = await self.session.execute(
-            select(self.model_class).where(self.model_class.id == id)
-        )
-        model = result.scalars().first()
+    async def create_many(self, entities: List[T]) -> List[T]:
+        """Create many entities in one transaction.
 
-        if model is None:
-            return None
+        The rows are flushed together as one batched INSERT, which the
+        MySQL driver sends as multi-row INSERTs. If any row fails, none is
+        created and the error is raised.
+        """
+        for entity in entities:
+            if not getattr(entity, "id", None):
+                setattr(entity, "id", str(uuid.uuid4()))
+
+        self.session.add_all([self.model_class.from_domain(entity) for entity in entities])
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return list(entities)
+
+    async def update(self, id: str, entity: T) -> Optional[T]:
+        """Update an entity with one ``UPDATE ... WHERE id = :id``.
 
+        Only the columns that differ from the row as this repository loaded
+        it (with get or get_many) are written, so e.g. storing an embedding
+        doesn't rewrite the description; for an entity not loaded here every
+        column is written. Returns None if the row doesn't exist.
+        """
         # Ensure entity has id
         if not getattr(entity, "id", None):
             setattr(entity, "id", id)
 
-        # Update model
-        updated_model = self.model_class.from_domain(entity)
-        for key, value in updated_model.__dict__.items():
-            if key != "_sa_instance_state":
-                setattr(model, key, value)
-
-        await self.session.commit()
-
+        model = self.model_class.from_domain(entity)
+        snapshot = self._snapshots.get(id)
+        changes = {
+            key: getattr(model, key)
+            for key in self._column_keys
+            if key != "id"
+            and (snapshot is None or not _same_value(snapshot[key], getattr(model, key)))
+        }
+
+        try:
+            if changes:
+                result = await self.session.execute(
+                    update(self.model_class)
+                    .where(self.model_class.id == id)
+                    .values(**changes)
+                )
+                # Matched rows: the MySQL dialect connects with FOUND_ROWS
+                if result.rowcount == 0:
+                    await self.session.rollback()
+                    return None
+            if await self._update_related(id, model) or changes:
+                await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        self._snapshots[id] = self._snapshot(model)
         return entity
 
     async def delete(self, id: str) -> bool:
-        """Delete an entity."""
-        result = await self.session.execute(
-            select(self.model_class).where(self.model_class.id == id)
-        )
-        model = result.scalars().first()
+        """Delete an entity with one ``DELETE ... WHERE id = :id``."""
+        try:
+            result = await self.session.execute(
+                delete(self.model_class).where(self.model_class.id == id)
+            )
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        self._snapshots.pop(id, None)
+        return result.rowcount > 0
+
+    def _to_domain(self, model: M) -> T:
+        """Domain entity of a loaded row, remembering its column values."""
+        self._snapshots[model.id] = self._snapshot(model)
+        return model.to_domain()
 
-        if model is None:
-            return False
+    def _snapshot(self, model: M) -> Dict[str, Any]:
+        """Column values of a model to diff later updates against."""
+        return {
+            key: _copy_value(getattr(model, key)) for key in self._column_keys
+        }
+
+    async def _update_related(self, id: str, model: M) -> bool:
+        """Write rows related to an updated entity; returns whether it wrote any.
+
+        Called in the update's transaction once the entity's row is known
+        to exist.
+        """
+        return False
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy of JSON column values, which callers may change in place."""
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
 
-        await self.session.delete(model)
-        await self.session.commit()
 
-        return True
+def _same_value(old: Any, new: Any) -> bool:
+    if isinstance(old, np.ndarray) or isinstance(new, np.ndarray):
+        return old is not None and new is not None and np.array_equal(old, new)
+    return old == new
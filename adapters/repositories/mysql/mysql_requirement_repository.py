@@ -1,12 +1,13 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import asc
+from sqlalchemy import asc, delete, insert
 
 from core.domain.requirement import Requirement
 from core.ports.repositories.requirement_repository import RequirementRepository
 from adapters.repositories.mysql.mysql_repository import MySQLRepository
-from infrastructure.db.models import RequirementModel
+from infrastructure.db.models import ChoiceModel, RequirementModel
 
 
 class MySQLRequirementRepository(
@@ -23,4 +24,45 @@ class MySQLRequirementRepository(
             select(RequirementModel).order_by(asc(RequirementModel.order))
         )
         models = result.scalars().all()
-        return [model.to_domain() for model in models]
\ No newline at end of file
+        return [model.to_domain() for model in models]
+
+    async def delete(self, id: str) -> bool:
+        """Delete a requirement and its choices."""
+        await self.session.execute(
+            delete(ChoiceModel).where(ChoiceModel.requirement_id == id)
+        )
+        return await super().delete(id)
+
+    def _snapshot(self, model: RequirementModel) -> Dict[str, Any]:
+        snapshot = super()._snapshot(model)
+        snapshot["choices"] = _choice_rows(model)
+        return snapshot
+
+    async def _update_related(self, id: str, model: RequirementModel) -> bool:
+        """Replace the requirement's choices if they changed."""
+        choices = _choice_rows(model)
+        snapshot = self._snapshots.get(id)
+        if snapshot is not None and snapshot["choices"] == choices:
+            return False
+
+        await self.session.execute(
+            delete(ChoiceModel).where(ChoiceModel.requirement_id == id)
+        )
+        if choices:
+            await self.session.execute(
+                insert(ChoiceModel),
+                [
+                    {
+                        "id": choice_id or str(uuid.uuid4()),
+                        "requirement_id": id,
+                        "text": text,
+                        "value": value,
+                    }
+                    for choice_id, text, value in choices
+                ],
+            )
+        return True
+
+
+def _choice_rows(model: RequirementModel) -> List[tuple]:
+    return [(choice.id, choice.text, choice.value) for choice in model.choices]
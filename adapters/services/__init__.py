@@ -0,0 +1 @@
+# Service implementations package
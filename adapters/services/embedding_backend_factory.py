@@ -0,0 +1,40 @@
+from typing import Optional
+
+from core.ports.services.embedding_backend import EmbeddingBackend
+
+SENTENCE_TRANSFORMERS = "sentence-transformers"
+QUANTIZED = "quantized"
+HASHING = "hashing"
+
+BACKENDS = (SENTENCE_TRANSFORMERS, QUANTIZED, HASHING)
+
+
+def create_embedding_backend(
+    backend: str, model_name: str, model_path: Optional[str] = None
+) -> EmbeddingBackend:
+    """Create the embedding backend configured by name.
+
+    ``model_path`` is a local model directory; it takes precedence over
+    ``model_name`` and is required by the quantized backend.
+    """
+    if backend == SENTENCE_TRANSFORMERS:
+        from adapters.services.sentence_transformer_backend import (
+            SentenceTransformerBackend,
+        )
+
+        return SentenceTransformerBackend(model_path or model_name)
+    if backend == QUANTIZED:
+        from adapters.services.quantized_backend import (
+            QuantizedSentenceTransformerBackend,
+        )
+
+        if not model_path:
+            raise ValueError("The quantized embedding backend needs a local model path")
+        return QuantizedSentenceTransformerBackend(model_path)
+    if backend == HASHING:
+        from adapters.services.hashing_backend import HashingBackend
+
+        return HashingBackend()
+    raise ValueError(
+        f"Unknown embedding backend: {backend} (expected one of {', '.join(BACKENDS)})"
+    )
@@ -0,0 +1,40 @@
+import hashlib
+from typing import Sequence
+
+import numpy as np
+
+from core.ports.services.embedding_backend import EmbeddingBackend
+from core.services.keyword_matcher import tokenize
+
+DEFAULT_DIMENSION = 384
+
+
+class HashingBackend(EmbeddingBackend):
+    """Deterministic bag-of-words encoder, for tests and benchmarks.
+
+    Every token and token bigram is hashed into one of ``dimension`` signed
+    buckets, so texts sharing words get similar vectors. No model is
+    loaded and the output is the same in every process and on every run.
+    """
+
+    def __init__(self, dimension: int = DEFAULT_DIMENSION):
+        self.name = f"hashing-{dimension}"
+        self._dimension = dimension
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def encode(self, texts: Sequence[str], batch_size: int) -> np.ndarray:
+        embeddings = np.zeros((len(texts), self._dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for feature in features:
+                digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                sign = 1.0 if value & 1 else -1.0
+                embeddings[row, (value >> 1) % self._dimension] += sign
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, norms, out=embeddings, where=norms > 0)
+        return embeddings
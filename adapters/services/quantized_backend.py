@@ -0,0 +1,22 @@
+from adapters.services.sentence_transformer_backend import SentenceTransformerBackend
+
+
+class QuantizedSentenceTransformerBackend(SentenceTransformerBackend):
+    """Sentence-transformers model with int8 dynamically quantized linear layers.
+
+    Loaded from a local model directory (for example one written with
+    ``SentenceTransformer.save``) and run on the CPU. The transformer's
+    linear layers use int8 weights with activations quantized on the fly,
+    which is typically 2-3x faster on CPU at a small accuracy cost; run
+    scripts/compare_backends.py to measure the drift for a model.
+    """
+
+    def __init__(self, model_path: str):
+        import torch
+
+        super().__init__(model_path, device="cpu")
+        self.name = f"int8:{model_path}"
+        self.model = torch.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        self.model.eval()
@@ -0,0 +1,29 @@
+from typing import Sequence
+
+import numpy as np
+
+from core.ports.services.embedding_backend import EmbeddingBackend
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """Full-precision sentence-transformers model."""
+
+    def __init__(self, model_name_or_path: str, device: str = None):
+        # Imported here so other backends don't need torch installed
+        from sentence_transformers import SentenceTransformer
+
+        self.name = model_name_or_path
+        self.model = SentenceTransformer(model_name_or_path, device=device)
+
+    @property
+    def dimension(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: Sequence[str], batch_size: int) -> np.ndarray:
+        return self.model.encode(
+            list(texts),
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
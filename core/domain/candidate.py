@@ -1,9 +1,31 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.domain.embedding import to_embedding
 
 
 class Candidate:
-    """Candidate profile entity."""
-    
+    """Candidate profile entity.
+
+    Slotted, with the embedding held as a float32 array like Job's.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "email",
+        "education",
+        "location",
+        "skills",
+        "experience",
+        "answers",
+        "_embedding",
+        "embedding_fingerprint",
+        "embedding_stale",
+        "embedding_model",
+    )
+
     def __init__(
         self,
         id: Optional[str] = None,
@@ -14,7 +36,10 @@ class Candidate:
         skills: Optional[List[str]] = None,
         experience: Optional[str] = None,
         answers: Optional[Dict[str, str]] = None,
-        embedding: Optional[List[float]] = None,  # ← NY RAD!
+        embedding: Optional[Sequence[float]] = None,  # ← NY RAD!
+        embedding_fingerprint: Optional[str] = None,
+        embedding_stale: bool = False,
+        embedding_model: Optional[str] = None,
     ):
         self.id = id
         self.name = name
@@ -24,4 +49,18 @@ class Candidate:
         self.skills = skills or []
         self.experience = experience
         self.answers = answers or {}
-        self.embedding = embedding  # ← NY RAD!
\ No newline at end of file
+        self.embedding = embedding  # ← NY RAD!
+        # Fingerprint of the profile's embedding text as of its last write,
+        # and whether the embedding still has to be (re)computed for that text
+        self.embedding_fingerprint = embedding_fingerprint
+        self.embedding_stale = embedding_stale
+        # Backend that produced the embedding (None if unknown)
+        self.embedding_model = embedding_model
+
+    @property
+    def embedding(self) -> Optional[np.ndarray]:
+        return self._embedding
+
+    @embedding.setter
+    def embedding(self, value: Optional[Sequence[float]]) -> None:
+        self._embedding = to_embedding(value)
@@ -0,0 +1,20 @@
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+# Embeddings are held as 1-D float32 arrays, 4 bytes per dimension
+EMBEDDING_DTYPE = np.float32
+
+
+def to_embedding(
+    value: Optional[Union[Sequence[float], np.ndarray]]
+) -> Optional[np.ndarray]:
+    """Convert an embedding to a 1-D float32 array; ``None`` stays ``None``.
+
+    float32 arrays (e.g. decoded straight from the database) are kept
+    as they are, without a copy.
+    """
+    if value is None:
+        return None
+    embedding = np.asarray(value, dtype=EMBEDDING_DTYPE)
+    return embedding if embedding.ndim == 1 else embedding.reshape(-1)
@@ -1,10 +1,36 @@
 from datetime import date
-from typing import Dict, Optional, List  # ← Lägg till List här!
+from typing import Dict, FrozenSet, Optional, Sequence
+
+import numpy as np
+
+from core.domain.embedding import to_embedding
 
 
 class Job:
-    """Job posting entity."""
-    
+    """Job posting entity.
+
+    Slotted, with the embedding held as a float32 array (lists assigned to
+    ``embedding`` are converted), since the match path loads many jobs.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "responsibilities",
+        "requirements",
+        "salary",
+        "application_end_date",
+        "company",
+        "category",
+        "location",
+        "_embedding",
+        "keywords",
+        "embedding_fingerprint",
+        "embedding_stale",
+        "embedding_model",
+    )
+
     def __init__(
         self,
         id: Optional[str] = None,
@@ -17,7 +43,11 @@ class Job:
         company: Optional[str] = None,
         category: Optional[str] = None,
         location: Optional[str] = None,
-        embedding: Optional[List[float]] = None, 
+        embedding: Optional[Sequence[float]] = None,
+        keywords: Optional[FrozenSet[str]] = None,
+        embedding_fingerprint: Optional[str] = None,
+        embedding_stale: bool = False,
+        embedding_model: Optional[str] = None,
     ):
         self.id = id
         self.title = title
@@ -29,4 +59,25 @@ class Job:
         self.company = company
         self.category = category
         self.location = location
-        self.embedding = embedding 
\ No newline at end of file
+        self.embedding = embedding
+        self.keywords = keywords  # Normalized title/description tokens
+        # Fingerprint of the job's embedding text as of its last write, and
+        # whether the embedding still has to be (re)computed for that text
+        self.embedding_fingerprint = embedding_fingerprint
+        self.embedding_stale = embedding_stale
+        # Backend that produced the embedding (None if unknown)
+        self.embedding_model = embedding_model
+
+    @property
+    def embedding(self) -> Optional[np.ndarray]:
+        return self._embedding
+
+    @embedding.setter
+    def embedding(self, value: Optional[Sequence[float]]) -> None:
+        self._embedding = to_embedding(value)
+
+    def is_available(self, current_date: Optional[date] = None) -> bool:
+        """Check whether applications are still open on the given date."""
+        if self.application_end_date is None:
+            return True
+        return self.application_end_date >= (current_date or date.today())
@@ -0,0 +1,58 @@
+from typing import Optional
+
+
+class JobFilter:
+    """Optional constraints on which jobs are eligible for matching.
+
+    Text comparisons are case-insensitive. ``location`` matches any job
+    location containing it; ``experience_level`` is compared with the
+    job's ``requirements["experience"]``.
+    """
+
+    def __init__(
+        self,
+        category: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        min_salary: Optional[float] = None,
+        experience_level: Optional[str] = None,
+    ):
+        self.category = category
+        self.location = location
+        self.company = company
+        self.min_salary = min_salary
+        self.experience_level = experience_level
+
+    def is_empty(self) -> bool:
+        """True when no constraint is set."""
+        return (
+            not self.category
+            and not self.location
+            and not self.company
+            and self.min_salary is None
+            and not self.experience_level
+        )
+
+    def matches(self, job) -> bool:
+        """Check a job against every constraint that is set."""
+        if self.category and not _same(job.category, self.category):
+            return False
+        if self.company and not _same(job.company, self.company):
+            return False
+        if self.location and (
+            not job.location or self.location.lower() not in job.location.lower()
+        ):
+            return False
+        if self.min_salary is not None and (
+            job.salary is None or job.salary < self.min_salary
+        ):
+            return False
+        if self.experience_level and not _same(
+            (job.requirements or {}).get("experience"), self.experience_level
+        ):
+            return False
+        return True
+
+
+def _same(value: Optional[str], expected: str) -> bool:
+    return value is not None and value.lower() == expected.lower()
@@ -0,0 +1,65 @@
+from datetime import date
+from typing import Dict, FrozenSet, Optional, Sequence
+
+from core.domain.embedding import to_embedding
+
+
+class JobProjection:
+    """The fields of a job needed to score a match.
+
+    Loaded instead of full Job entities in the match path, so the large
+    description and responsibilities texts are only read for the few jobs
+    that are returned. ``requirements`` holds only the normalized
+    ``education`` and ``experience`` entries.
+    """
+
+    __slots__ = (
+        "id",
+        "embedding",
+        "location",
+        "category",
+        "requirements",
+        "application_end_date",
+        "keywords",
+        "embedding_model",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        embedding: Optional[Sequence[float]] = None,
+        location: Optional[str] = None,
+        category: Optional[str] = None,
+        requirements: Optional[Dict[str, str]] = None,
+        application_end_date: Optional[date] = None,
+        keywords: Optional[FrozenSet[str]] = None,
+        embedding_model: Optional[str] = None,
+    ):
+        self.id = id
+        self.embedding = to_embedding(embedding)
+        self.location = location
+        self.category = category
+        self.requirements = requirements or {}
+        self.application_end_date = application_end_date
+        self.keywords = keywords if keywords is not None else frozenset()
+        self.embedding_model = embedding_model
+
+    @classmethod
+    def from_job(cls, job) -> "JobProjection":
+        """Project a full Job entity."""
+        from core.services.keyword_matcher import job_keywords
+
+        return cls(
+            id=job.id,
+            embedding=job.embedding,
+            location=job.location,
+            category=job.category,
+            requirements={
+                key: job.requirements[key]
+                for key in ("education", "experience")
+                if job.requirements.get(key)
+            },
+            application_end_date=job.application_end_date,
+            keywords=job_keywords(job),
+            embedding_model=job.embedding_model,
+        )
@@ -12,16 +12,34 @@ class BaseRepository(Generic[T], ABC):
         """Get an entity by id."""
         pass
 
+    @abstractmethod
+    async def get_many(self, ids: List[str]) -> List[T]:
+        """Get the entities for the given ids; missing ids are skipped."""
+        pass
+
     @abstractmethod
     async def list(self, skip: int = 0, limit: int = 100) -> List[T]:
         """List entities with pagination."""
         pass
 
+    @abstractmethod
+    async def list_after(self, after: Optional[str] = None, limit: int = 100) -> List[T]:
+        """List up to ``limit`` entities ordered by id, starting after id ``after``.
+
+        Keyset pagination: a page costs the same however deep it is.
+        """
+        pass
+
     @abstractmethod
     async def create(self, entity: T) -> T:
         """Create a new entity."""
         pass
 
+    @abstractmethod
+    async def create_many(self, entities: List[T]) -> List[T]:
+        """Create many entities at once, all or none of them."""
+        pass
+
     @abstractmethod
     async def update(self, id: str, entity: T) -> Optional[T]:
         """Update an entity."""
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from core.domain.candidate import Candidate
 from core.ports.repositories.base_repository import BaseRepository
@@ -9,4 +9,35 @@ class CandidateRepository(BaseRepository[Candidate]):
 
     async def find_by_location(self, location: str) -> List[Candidate]:
         """Find candidates by location."""
-        pass
\ No newline at end of file
+        pass
+
+    async def find_stale_embeddings(self, limit: int = 100) -> List[Candidate]:
+        """Find candidates whose embedding has to be (re)computed, oldest id first.
+
+        Concurrent callers get disjoint candidates: the ones returned are held
+        until ``save_embeddings`` (or the end of the session) releases them.
+        """
+        pass
+
+    async def save_embeddings(
+        self,
+        embeddings: Sequence[Tuple[str, str, Sequence[float]]],
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        """Store computed embeddings given as (candidate id, fingerprint, embedding).
+
+        An embedding is only stored, and the candidate marked fresh, if the
+        profile still has the fingerprint it was computed for, tagged with
+        the ``model_name`` of the backend that produced it. Returns the ids
+        of the candidates that were updated.
+        """
+        pass
+
+    async def invalidate_embeddings(self, model_name: str, dimension: int) -> int:
+        """Mark candidates stale whose embedding another backend produced.
+
+        Embeddings that ``is_compatible_embedding`` rejects for the backend
+        ``model_name`` of ``dimension`` are recomputed like edited candidates.
+        Returns how many candidates were marked.
+        """
+        pass
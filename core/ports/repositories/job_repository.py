@@ -1,7 +1,11 @@
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from core.domain.job import Job
+from core.domain.job_filter import JobFilter
+from core.domain.job_projection import JobProjection
 from core.ports.repositories.base_repository import BaseRepository
 
 
@@ -12,6 +16,86 @@ class JobRepository(BaseRepository[Job]):
         """Find jobs by category."""
         pass
 
-    async def find_available(self, current_date: date = None) -> List[Job]:
-        """Find jobs that are still available for application."""
+    async def find_available(
+        self, current_date: date = None, filters: Optional[JobFilter] = None
+    ) -> List[Job]:
+        """Find jobs that are still available for application.
+
+        Only jobs matching ``filters`` are returned, if given.
+        """
+        pass
+
+    async def find_available_for_scoring(
+        self,
+        current_date: date = None,
+        filters: Optional[JobFilter] = None,
+        ids: Optional[List[str]] = None,
+    ) -> List[JobProjection]:
+        """Find the scoring projections of available jobs.
+
+        Same eligibility as find_available, optionally restricted to
+        ``ids``, but only the fields needed for scoring are loaded.
+        """
+        pass
+
+    async def corpus_state(self) -> Tuple[int, Optional[datetime]]:
+        """Number of jobs and the time of the latest job write.
+
+        Changes whenever a job is created, updated or deleted (by any
+        process), so it tells whether a copy of the corpus is out of date.
+        """
+        pass
+
+    async def find_index_embeddings(
+        self,
+        after: Optional[str] = None,
+        limit: int = 1000,
+        updated_since: Optional[datetime] = None,
+        current_date: date = None,
+        model_name: Optional[str] = None,
+        dimension: Optional[int] = None,
+    ) -> List[Tuple[str, Optional[np.ndarray]]]:
+        """(id, embedding) of jobs ordered by id, starting after id ``after``.
+
+        Only loads the id and the embedding, for keeping the job index in
+        step; the embedding is None for jobs that have none or are no
+        longer available. With ``updated_since``, only jobs written at or
+        after that time are returned. With ``model_name`` and
+        ``dimension``, embeddings another backend produced are None too.
+        """
+        pass
+
+    async def list_ids_after(self, after: Optional[str] = None, limit: int = 1000) -> List[str]:
+        """Ids of all jobs ordered by id, starting after id ``after``."""
+        pass
+
+    async def find_stale_embeddings(self, limit: int = 100) -> List[Job]:
+        """Find jobs whose embedding has to be (re)computed, oldest id first.
+
+        Concurrent callers get disjoint jobs: the ones returned are held
+        until ``save_embeddings`` (or the end of the session) releases them.
+        """
+        pass
+
+    async def save_embeddings(
+        self,
+        embeddings: Sequence[Tuple[str, str, Sequence[float]]],
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        """Store computed embeddings given as (job id, fingerprint, embedding).
+
+        An embedding is only stored, and the job marked fresh, if the job's
+        text still has the fingerprint it was computed for, tagged with the
+        ``model_name`` of the backend that produced it. Returns the ids of
+        the jobs that were updated.
+        """
+        pass
+
+    async def invalidate_embeddings(self, model_name: str, dimension: int) -> int:
+        """Mark jobs stale whose embedding another backend produced.
+
+        Embeddings that ``is_compatible_embedding`` rejects for the backend
+        ``model_name`` of ``dimension`` are recomputed like edited jobs.
+        Returns how many jobs were marked.
+        """
         pass
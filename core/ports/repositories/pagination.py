@@ -0,0 +1,35 @@
+import base64
+import binascii
+import json
+from typing import List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """A cursor that wasn't issued by ``encode_cursor``."""
+
+
+def encode_cursor(last_id: str) -> str:
+    """Opaque cursor for the page after the entity with id ``last_id``."""
+    payload = json.dumps({"after": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """The id a cursor continues after."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after = json.loads(base64.urlsafe_b64decode(padded.encode()))["after"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as error:
+        raise InvalidCursorError("Invalid cursor") from error
+    if not isinstance(after, str):
+        raise InvalidCursorError("Invalid cursor")
+    return after
+
+
+def next_cursor(page: List[T], limit: int) -> Optional[str]:
+    """Cursor for the page after ``page``, or None if it was the last one."""
+    if not page or len(page) < limit:
+        return None
+    return encode_cursor(page[-1].id)
@@ -0,0 +1 @@
+# Service interfaces package
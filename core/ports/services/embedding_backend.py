@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+import numpy as np
+
+
+class EmbeddingBackend(ABC):
+    """Interface for the model that turns texts into embeddings."""
+
+    # Identifies the backend and model; part of embedding cache keys, so
+    # backends that produce different vectors must have different names
+    name: str
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Number of dimensions of the produced embeddings."""
+        pass
+
+    @abstractmethod
+    def encode(self, texts: Sequence[str], batch_size: int) -> np.ndarray:
+        """Encode texts into an (n, dimension) array of unit-normalized rows."""
+        pass
@@ -0,0 +1,452 @@
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Container, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.services.quantization import int8_scores, quantize_int8
+from core.services.scoring_engine import normalize_rows, top_k
+
+logger = logging.getLogger(__name__)
+
+# Number of first-pass results rescored in full precision
+DEFAULT_RESCORE_SIZE = 256
+
+
+class _InvertedList:
+    """Growable block of int8-quantized vectors with parallel ids.
+
+    ``rows`` holds each vector's row in the full-precision vector store.
+    """
+
+    def __init__(self, dim: int, capacity: int = 16):
+        self.ids: List[str] = []
+        self.codes = np.empty((capacity, dim), dtype=np.int8)
+        self.scales = np.empty(capacity, dtype=np.float32)
+        self.rows = np.empty(capacity, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, id: str, code: np.ndarray, scale: float, row: int) -> int:
+        """Append a quantized vector and return its position."""
+        position = len(self.ids)
+        if position == len(self.codes):
+            capacity = max(16, position * 2)
+            self.codes = _grown(self.codes, capacity)
+            self.scales = _grown(self.scales, capacity)
+            self.rows = _grown(self.rows, capacity)
+        self.codes[position] = code
+        self.scales[position] = scale
+        self.rows[position] = row
+        self.ids.append(id)
+        return position
+
+    def remove(self, position: int) -> Optional[str]:
+        """Remove by swapping in the last vector; returns the id that moved."""
+        last = len(self.ids) - 1
+        moved = None
+        if position != last:
+            self.codes[position] = self.codes[last]
+            self.scales[position] = self.scales[last]
+            self.rows[position] = self.rows[last]
+            self.ids[position] = self.ids[last]
+            moved = self.ids[position]
+        self.ids.pop()
+        return moved
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = len(self.ids)
+        return self.codes[:n], self.scales[:n], self.rows[:n]
+
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.scales.nbytes + self.rows.nbytes
+
+
+def _grown(array: np.ndarray, capacity: int) -> np.ndarray:
+    grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+class _VectorStore:
+    """Full-precision float32 vectors in a memory-mapped scratch file.
+
+    The file is unlinked as soon as it is created, so it never outlives
+    the process, and the OS only pages in the rows that are rescored
+    instead of keeping every vector on the heap. Freed rows are reused.
+    """
+
+    def __init__(self, dim: int, directory: Optional[str] = None, capacity: int = 1024):
+        self.dim = dim
+        self._file = tempfile.TemporaryFile(suffix=".f32", dir=directory)
+        self._vectors: Optional[np.memmap] = None
+        self._size = 0
+        self._free: List[int] = []
+        self._resize(capacity)
+
+    @property
+    def nbytes(self) -> int:
+        return self._vectors.nbytes
+
+    def add(self, vector: np.ndarray) -> int:
+        """Store a vector and return its row."""
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._size == len(self._vectors):
+                self._resize(2 * len(self._vectors))
+            row = self._size
+            self._size += 1
+        self._vectors[row] = vector
+        return row
+
+    def free(self, row: int) -> None:
+        self._free.append(int(row))
+
+    def get(self, rows: np.ndarray) -> np.ndarray:
+        """Copy of the given rows."""
+        return self._vectors[rows]
+
+    def _resize(self, capacity: int) -> None:
+        self._file.truncate(capacity * self.dim * np.dtype(np.float32).itemsize)
+        self._vectors = np.memmap(
+            self._file, dtype=np.float32, mode="r+", shape=(capacity, self.dim)
+        )
+
+
+class IVFIndex:
+    """In-process approximate nearest-neighbour index over job embeddings.
+
+    Vectors are unit-normalized and bucketed by their nearest k-means
+    centroid (an inverted file). A search only scans the ``n_probe`` lists
+    whose centroids are closest to the query, so ``n_probe`` trades recall
+    for latency. Until enough vectors exist to train centroids, everything
+    lives in one list.
+
+    The lists hold int8 codes with a per-vector scale (about a quarter of
+    the float32 size) and are scanned for a first pass; the best
+    ``rescore_size`` results are then rescored exactly against the float32
+    vectors, which live in a memory-mapped scratch file in
+    ``vectors_dir`` (the system temp directory by default).
+    """
+
+    def __init__(
+        self,
+        n_lists: Optional[int] = None,
+        train_threshold: int = 1024,
+        seed: int = 0,
+        rescore_size: int = DEFAULT_RESCORE_SIZE,
+        vectors_dir: Optional[str] = None,
+    ):
+        self.n_lists = n_lists
+        self.train_threshold = train_threshold
+        self.seed = seed
+        self.rescore_size = rescore_size
+        self.vectors_dir = vectors_dir
+        self.dim: Optional[int] = None
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: List[_InvertedList] = []
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._store: Optional[_VectorStore] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._positions
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def add(self, id: str, embedding: Sequence[float]) -> None:
+        """Insert or replace the vector for an id."""
+        with self._lock:
+            self._add(id, self._prepare(embedding))
+            self._train_if_needed()
+
+    def add_many(self, items: Sequence[Tuple[str, Sequence[float]]]) -> None:
+        """Insert or replace many vectors, training at most once at the end."""
+        with self._lock:
+            for id, embedding in items:
+                self._add(id, self._prepare(embedding))
+            self._train_if_needed()
+
+    def remove(self, id: str) -> bool:
+        """Remove the vector for an id; returns False if it was not indexed."""
+        with self._lock:
+            return self._remove(id)
+
+    def sync(self, items: Sequence[Tuple[str, Sequence[float]]]) -> Tuple[int, int]:
+        """Make the index hold exactly ``items``, keeping trained centroids.
+
+        Ids that are missing or whose vector differs are (re)added and ids
+        not in ``items`` are removed; returns how many were added and
+        removed.
+        """
+        with self._lock:
+            removed = self.retain({id for id, _ in items})
+            added, _ = self.update_many(items)
+            return added, removed
+
+    def update_many(
+        self, items: Sequence[Tuple[str, Optional[Sequence[float]]]]
+    ) -> Tuple[int, int]:
+        """Apply (id, embedding) changes, keeping trained centroids.
+
+        Ids that are missing or whose vector differs are (re)added, and ids
+        without an embedding are removed; other ids are left alone. Returns
+        how many were added and removed.
+        """
+        with self._lock:
+            added = removed = 0
+            for id, embedding in items:
+                if embedding is None or len(embedding) == 0:
+                    removed += self._remove(id)
+                    continue
+                vector = self._prepare(embedding)
+                current = self._vector(id)
+                if current is None or not np.allclose(current, vector, atol=1e-6):
+                    self._add(id, vector)
+                    added += 1
+            self._train_if_needed()
+            return added, removed
+
+    def retain(self, ids: Container[str]) -> int:
+        """Remove every id not in ``ids``; returns how many were removed."""
+        with self._lock:
+            removed = [id for id in self._positions if id not in ids]
+            for id in removed:
+                self._remove(id)
+            return len(removed)
+
+    def clear(self) -> None:
+        """Remove every vector and the trained centroids."""
+        with self._lock:
+            self.dim = None
+            self.centroids = None
+            self._lists = []
+            self._positions = {}
+            self._store = None
+
+    def train(self, n_lists: Optional[int] = None, iterations: int = 10) -> None:
+        """Fit k-means centroids on the indexed vectors and re-bucket them."""
+        with self._lock:
+            if len(self) == 0:
+                return
+            ids, codes, scales, rows = self._all()
+            vectors = self._store.get(rows)
+            n_lists = n_lists or self.n_lists or max(1, int(np.sqrt(len(ids))))
+            n_lists = min(n_lists, len(ids))
+
+            rng = np.random.default_rng(self.seed)
+            # A few dozen points per centroid is enough to place it well
+            sample_size = min(len(ids), 64 * n_lists)
+            sample = vectors[rng.choice(len(ids), sample_size, replace=False)]
+            centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+            for _ in range(iterations):
+                assignment = np.argmax(sample @ centroids.T, axis=1)
+                for c in range(n_lists):
+                    members = sample[assignment == c]
+                    if len(members):
+                        centroids[c] = members.sum(axis=0)
+                normalize_rows(centroids)
+
+            self.centroids = centroids
+            self._lists = [_InvertedList(self.dim) for _ in range(n_lists)]
+            self._positions = {}
+            for i, list_no in enumerate(self._assign(vectors)):
+                self._positions[ids[i]] = (
+                    list_no,
+                    self._lists[list_no].add(ids[i], codes[i], scales[i], rows[i]),
+                )
+            logger.info(f"✅ Trained job index: {len(ids)} vectors in {n_lists} lists")
+
+    def search(
+        self, embedding: Sequence[float], k: int, n_probe: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """Approximate top-k ids by cosine similarity, best first.
+
+        ``n_probe`` is the number of lists scanned; ``None`` scans all of
+        them. The returned scores are exact; only the first pass that picks
+        which vectors to rescore is approximate.
+        """
+        query = self._prepare(embedding)
+        with self._lock:
+            if len(self) == 0:
+                return []
+            if self.is_trained and n_probe is not None and n_probe < len(self._lists):
+                probes = top_k(self.centroids @ query, max(1, n_probe))
+            else:
+                probes = range(len(self._lists))
+
+            ids: List[str] = []
+            scores = []
+            rows = []
+            for list_no in probes:
+                inverted = self._lists[list_no]
+                if len(inverted):
+                    codes, scales, list_rows = inverted.view()
+                    ids.extend(inverted.ids)
+                    scores.append(int8_scores(codes, scales, query))
+                    rows.append(list_rows)
+            if not ids:
+                return []
+
+            # Rescore the best of the first pass in full precision
+            pool = top_k(np.concatenate(scores), max(k, self.rescore_size))
+            exact = self._store.get(np.concatenate(rows)[pool]) @ query
+            return [(ids[pool[i]], float(exact[i])) for i in top_k(exact, k)]
+
+    def stats(self) -> Dict[str, Any]:
+        """Size counters, for metrics.
+
+        ``heap_bytes`` is what the index keeps in memory (quantized lists
+        and centroids, without the ids); ``mapped_bytes`` is the size of
+        the memory-mapped full-precision vectors.
+        """
+        with self._lock:
+            heap_bytes = sum(inverted.nbytes() for inverted in self._lists)
+            if self.is_trained:
+                heap_bytes += self.centroids.nbytes
+            return {
+                "vectors": len(self),
+                "lists": len(self._lists),
+                "trained": self.is_trained,
+                "heap_bytes": heap_bytes,
+                "mapped_bytes": self._store.nbytes if self._store is not None else 0,
+            }
+
+    def save(self, path: str) -> None:
+        """Write the index to a .npz file, atomically replacing any old one."""
+        with self._lock:
+            ids, _, _, rows = self._all()
+            vectors = (
+                self._store.get(rows)
+                if ids
+                else np.empty((0, self.dim or 0), dtype=np.float32)
+            )
+            list_nos = np.array(
+                [self._positions[id][0] for id in ids], dtype=np.int32
+            )
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Unique per writer, so processes saving at once can't mix files
+            fd, tmp_path = tempfile.mkstemp(dir=directory or ".", suffix=".npz")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    np.savez(
+                        file,
+                        ids=np.array(ids, dtype=str),
+                        vectors=vectors,
+                        list_nos=list_nos,
+                        centroids=(
+                            self.centroids
+                            if self.is_trained
+                            else np.empty((0, 0), dtype=np.float32)
+                        ),
+                    )
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+    def load(self, path: str) -> None:
+        """Replace the index contents with those saved at ``path``."""
+        with np.load(path) as data:
+            ids = data["ids"].tolist()
+            vectors = data["vectors"].astype(np.float32, copy=False)
+            list_nos = data["list_nos"]
+            centroids = data["centroids"]
+
+        with self._lock:
+            self.dim = vectors.shape[1] if len(ids) else None
+            self.centroids = centroids if centroids.size else None
+            n_lists = len(centroids) if centroids.size else 1
+            self._lists = (
+                [_InvertedList(self.dim) for _ in range(n_lists)] if self.dim else []
+            )
+            self._store = (
+                _VectorStore(self.dim, self.vectors_dir, capacity=max(1024, len(ids)))
+                if self.dim
+                else None
+            )
+            self._positions = {}
+            for id, vector, list_no in zip(ids, vectors, list_nos):
+                self._insert(id, vector, int(list_no))
+
+    def _prepare(self, embedding: Sequence[float]) -> np.ndarray:
+        vector = np.array(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _add(self, id: str, vector: np.ndarray) -> None:
+        if self.dim is None:
+            self.dim = len(vector)
+            self._lists = [_InvertedList(self.dim)]
+            self._store = _VectorStore(self.dim, self.vectors_dir)
+        elif len(vector) != self.dim:
+            raise ValueError(
+                f"Embedding has dimension {len(vector)}, index expects {self.dim}"
+            )
+
+        self._remove(id)
+        self._insert(id, vector, self._assign(vector[None, :])[0])
+
+    def _insert(self, id: str, vector: np.ndarray, list_no: int) -> None:
+        codes, scales = quantize_int8(vector)
+        row = self._store.add(vector)
+        self._positions[id] = (
+            list_no,
+            self._lists[list_no].add(id, codes[0], scales[0], row),
+        )
+
+    def _train_if_needed(self) -> None:
+        if not self.is_trained and len(self) >= self.train_threshold:
+            self.train()
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        if not self.is_trained:
+            return np.zeros(len(vectors), dtype=np.intp)
+        return np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def _remove(self, id: str) -> bool:
+        location = self._positions.pop(id, None)
+        if location is None:
+            return False
+        list_no, position = location
+        self._store.free(self._lists[list_no].rows[position])
+        moved = self._lists[list_no].remove(position)
+        if moved is not None:
+            self._positions[moved] = (list_no, position)
+        return True
+
+    def _vector(self, id: str) -> Optional[np.ndarray]:
+        """The stored float32 vector of an id, or None if it isn't indexed."""
+        location = self._positions.get(id)
+        if location is None:
+            return None
+        list_no, position = location
+        return self._store.get(self._lists[list_no].rows[position : position + 1])[0]
+
+    def _all(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Ids, codes, scales and store rows of every indexed vector."""
+        ids: List[str] = []
+        views = []
+        for inverted in self._lists:
+            ids.extend(inverted.ids)
+            views.append(inverted.view())
+        if not ids:
+            return (
+                [],
+                np.empty((0, self.dim or 0), dtype=np.int8),
+                np.empty(0, dtype=np.float32),
+                np.empty(0, dtype=np.int32),
+            )
+        codes, scales, rows = (np.concatenate(parts) for parts in zip(*views))
+        return ids, codes, scales, rows
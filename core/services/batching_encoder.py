@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.services.embedding_service import (
+    EmbeddingService,
+    build_candidate_text,
+    build_job_text,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_MS = 5.0
+
+
+class BatchingEncoder:
+    """Async front-end that encodes off the event loop, in micro-batches.
+
+    Encode requests are queued; a collector task takes the first waiting
+    request, gathers whatever else arrives within ``max_wait_ms`` (up to
+    ``max_batch_size`` texts) and encodes them with one batched call on a
+    dedicated thread pool. The event loop never runs the model, and
+    concurrent requests share one forward pass.
+
+    ``service_factory`` is called on the encoding thread, so a model that
+    is still loading doesn't block the loop either.
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[], EmbeddingService],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        workers: int = 1,
+    ):
+        self.service_factory = service_factory
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="embedding"
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending: set = set()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.encoded = 0
+        self.max_seen_batch_size = 0
+        self.last_batch_size = 0
+        self.encode_seconds = 0.0
+
+    async def encode_text(self, text: str) -> np.ndarray:
+        """Embedding of one text, batched with concurrent requests."""
+        self._start()
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        self.requests += 1
+        return await future
+
+    async def encode_candidate(self, candidate) -> np.ndarray:
+        """Embedding of a candidate profile."""
+        return await self.encode_text(build_candidate_text(candidate))
+
+    async def encode_job(self, job) -> np.ndarray:
+        """Embedding of a job posting."""
+        return await self.encode_text(build_job_text(job))
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and batch size counters, for metrics."""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": self.encoded / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_seen_batch_size,
+            "last_batch_size": self.last_batch_size,
+            "encode_seconds": self.encode_seconds,
+        }
+
+    async def close(self) -> None:
+        """Stop the collector and the encoding threads."""
+        if self._collector is not None:
+            self._collector.cancel()
+            self._collector = None
+        self._executor.shutdown(wait=False)
+
+    def _start(self) -> None:
+        """Start the collector on the running loop (again, if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._collector is not None and not self._collector.done():
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._collector = loop.create_task(self._collect())
+
+    async def _collect(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Keep collecting while earlier batches encode, one per thread
+            await self._slots.acquire()
+            task = self._loop.create_task(self._encode(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _encode(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            texts = [text for text, _ in batch]
+            embeddings = await self._loop.run_in_executor(
+                self._executor, self._encode_texts, texts
+            )
+        except Exception as error:
+            logger.exception("❌ Batched embedding failed")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+        finally:
+            self._slots.release()
+
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        start = time.perf_counter()
+        embeddings = self.service_factory().encode_texts(texts)
+        with self._lock:
+            self.batches += 1
+            self.encoded += len(texts)
+            self.last_batch_size = len(texts)
+            self.max_seen_batch_size = max(self.max_seen_batch_size, len(texts))
+            self.encode_seconds += time.perf_counter() - start
+        return embeddings
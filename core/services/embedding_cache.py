@@ -0,0 +1,131 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+# Cached vectors are stored as raw little-endian float32
+VECTOR_DTYPE = np.dtype("<f4")
+
+
+class EmbeddingCache:
+    """Persistent text-embedding cache: an in-memory LRU over a SQLite file.
+
+    Keys are opaque strings (EmbeddingService hashes the model name, the
+    text builder version and the text into them). Lookups hit the LRU
+    first and fall through to the on-disk store, which survives restarts
+    and is shared by processes on the same host. ``path=None`` keeps the
+    cache in memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Look up many keys; missing keys are left out of the result."""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            missing = []
+            for key in dict.fromkeys(keys):
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                else:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+            self.hits += len(found)
+
+            loaded = {}
+            if missing and self.path is not None:
+                loaded = self._load(missing)
+                for key, vector in loaded.items():
+                    self._remember(key, vector)
+                found.update(loaded)
+            self.disk_hits += len(loaded)
+            self.misses += len(missing) - len(loaded)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Store vectors in memory and on disk."""
+        if not items:
+            return
+        with self._lock:
+            vectors = {}
+            for key, vector in items.items():
+                vector = np.array(vector, dtype=VECTOR_DTYPE)
+                vector.flags.writeable = False
+                self._remember(key, vector)
+                vectors[key] = vector
+            if self.path is not None:
+                connection = self._connect()
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [(key, vector.tobytes()) for key, vector in vectors.items()],
+                    )
+
+    def stats(self) -> Dict[str, float]:
+        """Counters and current usage, for metrics."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the disk store is kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, keys: list) -> Dict[str, np.ndarray]:
+        connection = self._connect()
+        loaded = {}
+        # Stay below SQLite's bound parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = connection.execute(
+                "SELECT key, vector FROM embeddings WHERE key IN "
+                f"({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for key, blob in rows:
+                loaded[key] = np.frombuffer(blob, dtype=VECTOR_DTYPE)
+        return loaded
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
@@ -0,0 +1,191 @@
+import logging
+import math
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.ports.services.embedding_backend import EmbeddingBackend
+from core.services.embedding_service import (
+    DEFAULT_BATCH_SIZE,
+    EmbeddingService,
+    build_candidate_text,
+    build_job_text,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_SIZE = 1024
+
+# The EmbeddingService of the current worker process, loaded once by the
+# pool initializer
+_worker_service: Optional[EmbeddingService] = None
+
+
+def _init_worker(
+    model_name: str,
+    threads: int,
+    batch_size: int,
+    backend_factory: Optional[Callable[[], EmbeddingBackend]],
+) -> None:
+    """Pin the worker's math library threads and load its model."""
+    global _worker_service
+    for variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[variable] = str(threads)
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    _worker_service = EmbeddingService(
+        model_name,
+        batch_size=batch_size,
+        backend=backend_factory() if backend_factory else None,
+    )
+
+
+def _worker_dimension() -> int:
+    return _worker_service.dimension
+
+
+def _worker_backend_name() -> str:
+    return _worker_service.backend_name
+
+
+def _encode_shard(
+    output_path: str, shape: Tuple[int, int], start: int, texts: Sequence[str]
+) -> int:
+    """Encode one shard straight into its rows of the shared output file."""
+    output = np.memmap(output_path, dtype=np.float32, mode="r+", shape=shape)
+    output[start:start + len(texts)] = _worker_service.encode_texts(texts)
+    output.flush()
+    del output
+    return len(texts)
+
+
+class EmbeddingPool:
+    """Encode a large corpus on several processes, one model per worker.
+
+    Each worker loads the model once and limits torch to
+    ``threads_per_worker`` threads, so workers don't oversubscribe the
+    cores. Texts are split into shards and every worker writes its
+    embeddings directly into a memory-mapped float32 output file, so only
+    the input texts cross process boundaries.
+
+    ``backend_factory`` creates each worker's backend (it must be
+    picklable, e.g. a functools.partial); by default the
+    sentence-transformer model ``model_name`` is loaded.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        backend_factory: Optional[Callable[[], EmbeddingBackend]] = None,
+    ):
+        cpus = os.cpu_count() or 1
+        self.workers = workers or cpus
+        self.threads_per_worker = threads_per_worker or max(1, cpus // self.workers)
+        self.shard_size = shard_size
+        # Spawn rather than fork: forking a process with torch loaded can hang
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_name, self.threads_per_worker, batch_size, backend_factory),
+        )
+        self._dim: Optional[int] = None
+        logger.info(
+            f"🤖 Embedding pool: {self.workers} workers x "
+            f"{self.threads_per_worker} threads ({model_name})"
+        )
+
+    def __enter__(self) -> "EmbeddingPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def dim(self) -> int:
+        """Embedding dimension, asked from a worker on first use."""
+        if self._dim is None:
+            self._dim = self._executor.submit(_worker_dimension).result()
+        return self._dim
+
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension, named like EmbeddingService.dimension."""
+        return self.dim
+
+    @property
+    def backend_name(self) -> str:
+        """Name of the workers' embedding backend, asked from a worker."""
+        return self._executor.submit(_worker_backend_name).result()
+
+    def encode_texts(
+        self, texts: Sequence[str], output_path: Optional[str] = None
+    ) -> np.ndarray:
+        """Encode texts in parallel into an (n, dim) float32 array.
+
+        With ``output_path``, the embeddings are left in that file and a
+        read-only memmap of it is returned. Otherwise they are copied into
+        memory and the temporary file is removed.
+        """
+        shape = (len(texts), self.dim)
+        if len(texts) == 0:
+            return np.empty(shape, dtype=np.float32)
+
+        keep_file = output_path is not None
+        if not keep_file:
+            fd, output_path = tempfile.mkstemp(suffix=".f32")
+            os.close(fd)
+        np.memmap(output_path, dtype=np.float32, mode="w+", shape=shape).flush()
+
+        try:
+            # Spread the texts over all workers, in shards of at most shard_size
+            shard_size = min(self.shard_size, math.ceil(len(texts) / self.workers))
+            futures = [
+                self._executor.submit(
+                    _encode_shard,
+                    output_path,
+                    shape,
+                    start,
+                    list(texts[start:start + shard_size]),
+                )
+                for start in range(0, len(texts), shard_size)
+            ]
+            wait(futures)
+            for future in futures:
+                future.result()
+
+            output = np.memmap(output_path, dtype=np.float32, mode="r", shape=shape)
+            return output if keep_file else np.array(output)
+        finally:
+            if not keep_file:
+                os.remove(output_path)
+
+    def encode_jobs(
+        self, jobs: Sequence, output_path: Optional[str] = None
+    ) -> np.ndarray:
+        """Generate embeddings for many job postings, one row per job."""
+        return self.encode_texts([build_job_text(job) for job in jobs], output_path)
+
+    def encode_candidates(
+        self, candidates: Sequence, output_path: Optional[str] = None
+    ) -> np.ndarray:
+        """Generate embeddings for many candidate profiles, one row per candidate."""
+        return self.encode_texts(
+            [build_candidate_text(candidate) for candidate in candidates], output_path
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown()
@@ -1,75 +1,196 @@
-from sentence_transformers import SentenceTransformer
-from typing import List
+from typing import List, Optional, Sequence
+import hashlib
 import numpy as np
 
+from core.ports.services.embedding_backend import EmbeddingBackend
+from core.services.embedding_cache import EmbeddingCache
+
+DEFAULT_BATCH_SIZE = 32
+
+# Part of every embedding cache key: bump whenever build_job_text or
+# build_candidate_text changes what text gets embedded
+TEXT_BUILDER_VERSION = 1
+
+
+def build_job_text(job) -> str:
+    """Combine the text fields of a job posting into the text to embed."""
+    # Combine relevant text fields
+    text_parts = [
+        job.title,
+        job.description[:500] if job.description else "",  # Limit description length
+        job.responsibilities or "",
+        job.category or "",
+        job.location or "",
+    ]
+
+    # Add requirements
+    if job.requirements:
+        req_text = " ".join([f"{k}: {v}" for k, v in job.requirements.items()])
+        text_parts.append(req_text)
+
+    return " ".join(text_parts)
+
+
+def text_fingerprint(text: str) -> str:
+    """Fingerprint of a text to embed, under the current text builder."""
+    return hashlib.sha256(f"{TEXT_BUILDER_VERSION}\0{text}".encode()).hexdigest()
+
+
+def job_embedding_fingerprint(job) -> str:
+    """Fingerprint of the text a job's embedding is computed from."""
+    return text_fingerprint(build_job_text(job))
+
+
+def candidate_embedding_fingerprint(candidate) -> str:
+    """Fingerprint of the text a candidate's embedding is computed from."""
+    return text_fingerprint(build_candidate_text(candidate))
+
+
+def is_compatible_embedding(
+    embedding: Optional[Sequence[float]],
+    embedding_model: Optional[str],
+    backend_name: str,
+    dimension: int,
+) -> bool:
+    """Whether a stored embedding lives in the active backend's vector space.
+
+    Embeddings tagged with another backend never do, whatever their size.
+    Untagged ones (given by clients, or stored before embeddings were
+    tagged) are taken as compatible if they have the backend's dimension.
+    """
+    if embedding is None or len(embedding) == 0:
+        return False
+    if embedding_model is not None:
+        return embedding_model == backend_name
+    return len(embedding) == dimension
+
+
+def build_candidate_text(candidate) -> str:
+    """Combine the text fields of a candidate profile into the text to embed."""
+    # Combine relevant text fields
+    text_parts = [
+        candidate.name,
+        candidate.education or "",
+        candidate.location or "",
+        candidate.experience or "",
+    ]
+
+    # Add skills
+    if candidate.skills:
+        skills_text = " ".join(candidate.skills)
+        text_parts.append(skills_text)
+
+    # Add answers
+    if candidate.answers:
+        answers_text = " ".join([f"{k}: {v}" for k, v in candidate.answers.items()])
+        text_parts.append(answers_text)
+
+    return " ".join(text_parts)
+
 
 class EmbeddingService:
-    """Service for generating text embeddings using sentence-transformers."""
+    """Service for generating text embeddings with a pluggable backend."""
     
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
-        """Initialize with a sentence-transformer model.
+    def __init__(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        cache: Optional[EmbeddingCache] = None,
+        backend: Optional[EmbeddingBackend] = None,
+    ):
+        """Initialize with an embedding backend.
         
-        'all-MiniLM-L6-v2' is a good balance of speed and quality:
+        Without a ``backend``, the sentence-transformer model
+        ``model_name`` is loaded. 'all-MiniLM-L6-v2' is a good balance of
+        speed and quality:
         - Fast inference
         - 384 dimensions
         - Good for semantic similarity
+
+        ``batch_size`` is the default number of texts per model call.
+        With a ``cache``, texts that were embedded before are not encoded
+        again.
         """
-        print(f"🤖 Loading embedding model: {model_name}...")
-        self.model = SentenceTransformer(model_name)
-        print(f"✅ Model loaded!")
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache = cache
+        if backend is None:
+            from adapters.services.sentence_transformer_backend import (
+                SentenceTransformerBackend,
+            )
+
+            print(f"🤖 Loading embedding model: {model_name}...")
+            backend = SentenceTransformerBackend(model_name)
+            print(f"✅ Model loaded!")
+        self.backend = backend
+
+    @property
+    def dimension(self) -> int:
+        """Number of dimensions of the produced embeddings."""
+        return self.backend.dimension
+
+    @property
+    def backend_name(self) -> str:
+        """Name of the backend producing the embeddings, stored with them."""
+        return self.backend.name
     
+    def encode_texts(
+        self, texts: Sequence[str], batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """Encode many texts into a contiguous (n, dim) float32 array.
+
+        Texts are fed to the model ``batch_size`` at a time and the
+        embeddings come back unit-normalized. Cached texts skip the model.
+        """
+        if len(texts) == 0:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        if self.cache is None:
+            return self._encode(texts, batch_size)
+
+        keys = [self.cache_key(text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        # Encode each distinct uncached text once
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if missing:
+            encoded = self._encode(list(missing.values()), batch_size)
+            fresh = dict(zip(missing, encoded))
+            self.cache.put_many(fresh)
+            cached.update(fresh)
+        return np.stack([cached[key] for key in keys]).astype(np.float32, copy=False)
+
+    def cache_key(self, text: str) -> str:
+        """Embedding cache key for a text under this backend and text builder."""
+        digest = hashlib.sha256(
+            f"{self.backend.name}\0{TEXT_BUILDER_VERSION}\0".encode()
+        )
+        digest.update(text.encode())
+        return digest.hexdigest()
+
+    def _encode(self, texts: Sequence[str], batch_size: Optional[int]) -> np.ndarray:
+        embeddings = self.backend.encode(texts, batch_size or self.batch_size)
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    def encode_jobs(self, jobs: Sequence, batch_size: Optional[int] = None) -> np.ndarray:
+        """Generate embeddings for many job postings, one row per job."""
+        return self.encode_texts([build_job_text(job) for job in jobs], batch_size)
+
+    def encode_candidates(
+        self, candidates: Sequence, batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """Generate embeddings for many candidate profiles, one row per candidate."""
+        return self.encode_texts(
+            [build_candidate_text(candidate) for candidate in candidates], batch_size
+        )
+
     def generate_job_embedding(self, job) -> List[float]:
         """Generate embedding for a job posting."""
-        # Combine relevant text fields
-        text_parts = [
-            job.title,
-            job.description[:500] if job.description else "",  # Limit description length
-            job.responsibilities or "",
-            job.category or "",
-            job.location or "",
-        ]
-        
-        # Add requirements
-        if job.requirements:
-            req_text = " ".join([f"{k}: {v}" for k, v in job.requirements.items()])
-            text_parts.append(req_text)
-        
-        # Combine into single text
-        combined_text = " ".join(text_parts)
-        
-        # Generate embedding
-        embedding = self.model.encode(combined_text, convert_to_numpy=True)
-        
-        return embedding.tolist()
-    
+        return self.encode_jobs([job])[0].tolist()
+
     def generate_candidate_embedding(self, candidate) -> List[float]:
         """Generate embedding for a candidate profile."""
-        # Combine relevant text fields
-        text_parts = [
-            candidate.name,
-            candidate.education or "",
-            candidate.location or "",
-            candidate.experience or "",
-        ]
-        
-        # Add skills
-        if candidate.skills:
-            skills_text = " ".join(candidate.skills)
-            text_parts.append(skills_text)
-        
-        # Add answers
-        if candidate.answers:
-            answers_text = " ".join([f"{k}: {v}" for k, v in candidate.answers.items()])
-            text_parts.append(answers_text)
-        
-        # Combine into single text
-        combined_text = " ".join(text_parts)
-        
-        # Generate embedding
-        embedding = self.model.encode(combined_text, convert_to_numpy=True)
-        
-        return embedding.tolist()
-    
+        return self.encode_candidates([candidate])[0].tolist()
+
     def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """Calculate cosine similarity between two embeddings."""
         # Convert to numpy arrays
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.ports.repositories.job_repository import JobRepository
+from core.services.ann_index import IVFIndex
+from core.services.embedding_service import (
+    EmbeddingService,
+    candidate_embedding_fingerprint,
+    job_embedding_fingerprint,
+)
+from core.services.match_cache import CorpusVersion
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_POLL_INTERVAL = 30.0
+
+
+class EmbeddingWorker:
+    """Background task that embeds jobs whose embedding is stale.
+
+    JobManagement marks a job stale when it is created without an embedding
+    or its text changes, and calls ``notify``; the worker then encodes the
+    stale jobs in batches on a thread, stores the embeddings, updates this
+    process's job index and bumps its corpus version; other processes see
+    the new embeddings through their job index sync. It also polls every
+    ``poll_interval`` seconds, for stale jobs nobody notified it about:
+    written by other processes or left over from a restart. Every API
+    process runs a worker; ``find_stale_embeddings`` locks the rows it
+    returns until ``save_embeddings`` commits, so the workers embed
+    disjoint batches.
+
+    Before its first batch, and whenever the configured backend changes,
+    the worker marks stale the items whose stored embedding another
+    backend produced, so a model switch re-embeds the whole corpus.
+
+    The repository opened by ``repository_scope`` provides
+    ``invalidate_embeddings``, ``find_stale_embeddings`` and
+    ``save_embeddings``; subclasses embed other entities by overriding
+    ``_encode``, ``_fingerprint`` and ``_on_saved``.
+    """
+
+    entity_name = "jobs"
+
+    def __init__(
+        self,
+        service_factory: Callable[[], EmbeddingService],
+        job_index: Optional[IVFIndex] = None,
+        corpus_version: Optional[CorpusVersion] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        repository_scope: Optional[
+            Callable[[], AsyncContextManager[JobRepository]]
+        ] = None,
+    ):
+        self.service_factory = service_factory
+        self.job_index = job_index
+        self.corpus_version = corpus_version
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        # Opens a job repository with its own session for each batch
+        self.repository_scope = repository_scope
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        # (backend name, dimension) the stored embeddings were last checked against
+        self._invalidated_for: Optional[Tuple[str, int]] = None
+        self.embedded = 0
+        self.batches = 0
+        self.errors = 0
+
+    def start(
+        self,
+        repository_scope: Optional[
+            Callable[[], AsyncContextManager[JobRepository]]
+        ] = None,
+    ) -> None:
+        """Start the worker on the running loop."""
+        if repository_scope is not None:
+            self.repository_scope = repository_scope
+        self._wake = asyncio.Event()
+        self._wake.set()  # Catch up on jobs left stale by the last run
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("✅ Embedding worker started")
+
+    async def stop(self) -> None:
+        """Stop the worker; a batch in progress is abandoned and redone later."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self) -> None:
+        """Wake the worker because jobs were marked stale."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def run_once(self) -> int:
+        """Embed stale items until none are left; returns how many were stored."""
+        await self._invalidate_other_backends()
+        total = 0
+        while True:
+            async with self.repository_scope() as repository:
+                items = await repository.find_stale_embeddings(self.batch_size)
+                if not items:
+                    return total
+
+                # Encoding is CPU-bound and must not block the event loop
+                embeddings, model_name = await asyncio.to_thread(
+                    self._encode_with_name, items
+                )
+                # Saved against the fingerprint the item had when loaded, so
+                # items edited in the meantime stay stale
+                saved = set(
+                    await repository.save_embeddings(
+                        [
+                            (
+                                item.id,
+                                item.embedding_fingerprint or self._fingerprint(item),
+                                embedding,
+                            )
+                            for item, embedding in zip(items, embeddings)
+                        ],
+                        model_name=model_name,
+                    )
+                )
+
+            self._on_saved(
+                [
+                    (item, embedding)
+                    for item, embedding in zip(items, embeddings)
+                    if item.id in saved
+                ]
+            )
+
+            self.batches += 1
+            self.embedded += len(saved)
+            total += len(saved)
+            logger.info(f"✅ Embedded {len(saved)} stale {self.entity_name}")
+            if len(items) < self.batch_size:
+                return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, for metrics."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "embedded": self.embedded,
+            "batches": self.batches,
+            "errors": self.errors,
+        }
+
+    async def _invalidate_other_backends(self) -> None:
+        """Mark stale the items embedded by another backend than the active one.
+
+        A single UPDATE over the table, so it only runs when the backend
+        isn't the one checked last time, not on every poll.
+        """
+        # Creating the service may load the model: off the event loop
+        service = await asyncio.to_thread(self.service_factory)
+        space = (service.backend_name, service.dimension)
+        if space == self._invalidated_for:
+            return
+        async with self.repository_scope() as repository:
+            invalidated = await repository.invalidate_embeddings(*space)
+        self._invalidated_for = space
+        if invalidated:
+            logger.info(
+                f"⚠️ Marked {invalidated} {self.entity_name} embedded by another "
+                f"backend than {space[0]} stale"
+            )
+
+    def _encode_with_name(self, items: List[Any]) -> Tuple[np.ndarray, str]:
+        """Encode the items and name the backend that produced the vectors."""
+        service = self.service_factory()
+        return self._encode(service, items), service.backend_name
+
+    def _encode(self, service: EmbeddingService, items: List[Any]) -> np.ndarray:
+        return service.encode_jobs(items)
+
+    def _fingerprint(self, item: Any) -> str:
+        return job_embedding_fingerprint(item)
+
+    def _on_saved(self, saved: List[Any]) -> None:
+        """Index the (job, embedding) pairs stored by a batch."""
+        if self.job_index is not None:
+            for job, embedding in saved:
+                self.job_index.add(job.id, embedding)
+        if saved and self.corpus_version is not None:
+            self.corpus_version.bump()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.errors += 1
+                logger.exception(f"❌ Embedding stale {self.entity_name} failed")
+
+
+class CandidateEmbeddingWorker(EmbeddingWorker):
+    """Background task that embeds candidates whose profile changed.
+
+    CandidateManagement marks a candidate stale when it is created or its
+    embedded fields change, so match requests never encode and save the
+    profile themselves. Candidates aren't indexed, so nothing else has to
+    be kept in step.
+    """
+
+    entity_name = "candidates"
+
+    def __init__(
+        self,
+        service_factory: Callable[[], EmbeddingService],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        repository_scope: Optional[Callable[[], AsyncContextManager[Any]]] = None,
+    ):
+        super().__init__(
+            service_factory,
+            batch_size=batch_size,
+            poll_interval=poll_interval,
+            repository_scope=repository_scope,
+        )
+
+    def _encode(self, service: EmbeddingService, items: List[Any]) -> np.ndarray:
+        return service.encode_candidates(items)
+
+    def _fingerprint(self, item: Any) -> str:
+        return candidate_embedding_fingerprint(item)
+
+    def _on_saved(self, saved: List[Any]) -> None:
+        pass
@@ -0,0 +1,288 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+from core.ports.repositories.job_repository import JobRepository
+from core.services.ann_index import IVFIndex
+from core.services.embedding_service import EmbeddingService
+from core.services.match_cache import CorpusVersion
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 10.0
+DEFAULT_CHUNK_SIZE = 1000
+
+# Jobs written up to this long before the latest write already seen are
+# read again, so writes that committed late, or came from a host whose
+# clock lags, aren't missed
+SYNC_OVERLAP = timedelta(minutes=1)
+
+
+class JobIndexSync:
+    """Background task that keeps the job index in step with the database.
+
+    Jobs are also written by other API processes, on this host or others,
+    and by the backfill script; this process's index never hears about
+    those writes. Every ``interval`` seconds the task reads the jobs
+    table's state (job count and latest write time). When it changed, the
+    jobs written since the last sync are read again, id and embedding
+    only, and applied to the index; when the count shows that jobs were
+    deleted, the ids of all jobs are read and the others are dropped. The state is also the database
+    version of ``corpus_version``, so cached match results of this process
+    expire with other processes' writes.
+
+    The first sync loads the index saved at ``index_path`` and reconciles
+    it with every job (or builds the index if that fails). Until a sync
+    has succeeded recently, ``is_current`` is False and matching scores
+    the jobs from the database instead of trusting the index.
+
+    With ``service_factory``, only embeddings of the active backend are
+    indexed; jobs embedded by another one stay out until re-embedded, and
+    a saved index of another dimension is rebuilt.
+    """
+
+    def __init__(
+        self,
+        job_index: IVFIndex,
+        corpus_version: Optional[CorpusVersion] = None,
+        index_path: Optional[str] = None,
+        interval: float = DEFAULT_INTERVAL,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        repository_scope: Optional[
+            Callable[[], AsyncContextManager[JobRepository]]
+        ] = None,
+        clock: Callable[[], float] = time.monotonic,
+        service_factory: Optional[Callable[[], EmbeddingService]] = None,
+    ):
+        self.job_index = job_index
+        self.corpus_version = corpus_version
+        self.index_path = index_path
+        self.interval = interval
+        self.chunk_size = chunk_size
+        # Opens a job repository with its own session for each sync
+        self.repository_scope = repository_scope
+        self._clock = clock
+        self.service_factory = service_factory
+        # (backend name, dimension) of the active backend, once resolved
+        self._space: Optional[Tuple[str, int]] = None
+        # Jobs table state at the last sync, None until the first one
+        self._state: Optional[Tuple[int, Optional[datetime]]] = None
+        # Ids of all jobs at the last sync, to tell new jobs from updated ones
+        self._ids: Set[str] = set()
+        self._synced_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self.syncs = 0
+        self.added = 0
+        self.removed = 0
+        self.errors = 0
+
+    def is_current(self) -> bool:
+        """Whether the index reflects the database of at most two intervals ago."""
+        return (
+            self._synced_at is not None
+            and self._clock() - self._synced_at <= 2 * self.interval
+        )
+
+    def start(
+        self,
+        repository_scope: Optional[
+            Callable[[], AsyncContextManager[JobRepository]]
+        ] = None,
+    ) -> None:
+        """Start syncing on the running loop, beginning with the initial load."""
+        if repository_scope is not None:
+            self.repository_scope = repository_scope
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("✅ Job index sync started")
+
+    async def stop(self) -> None:
+        """Stop syncing; a sync in progress is abandoned."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def load(self) -> None:
+        """Load the saved index, to be reconciled by the first sync."""
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+        try:
+            self.job_index.load(self.index_path)
+            logger.info(f"✅ Loaded job index with {len(self.job_index)} jobs")
+        except Exception:
+            self.job_index.clear()
+            logger.exception("⚠️ Saved job index can't be loaded, rebuilding it")
+
+    def save(self) -> None:
+        """Persist the index so the next start only has to reconcile it.
+
+        An index that was never synced isn't saved over the last good one.
+        """
+        if not self.index_path or self._state is None:
+            return
+        self.job_index.save(self.index_path)
+        logger.info(f"✅ Saved job index with {len(self.job_index)} jobs")
+
+    async def run_once(self) -> bool:
+        """Bring the index up to date; returns whether the database changed."""
+        if self.service_factory is not None and self._space is None:
+            # Creating the service may load the model: off the event loop
+            service = await asyncio.to_thread(self.service_factory)
+            self._space = (service.backend_name, service.dimension)
+        async with self.repository_scope() as repository:
+            # Read before the jobs, so writes made meanwhile are read again
+            state = await repository.corpus_state()
+            if self._state is None:
+                added, removed = await self._sync_all(repository)
+            elif state != self._state:
+                added, removed = await self._sync_changes(repository, state)
+            else:
+                added = removed = 0
+
+        changed = state != self._state
+        self._state = state
+        self._synced_at = self._clock()
+        self.syncs += 1
+        self.added += added
+        self.removed += removed
+        if self.corpus_version is not None:
+            count, updated_at = state
+            self.corpus_version.database_version = (
+                f"{count}@{updated_at.isoformat() if updated_at else '-'}"
+            )
+        if added or removed:
+            logger.info(
+                f"✅ Synced job index with the database: {added} added, "
+                f"{removed} removed, {len(self.job_index)} jobs"
+            )
+        return changed
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, for metrics."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "current": self.is_current(),
+            "syncs": self.syncs,
+            "added": self.added,
+            "removed": self.removed,
+            "errors": self.errors,
+        }
+
+    async def _sync_all(self, repository: JobRepository) -> Tuple[int, int]:
+        """Make the index hold exactly the database's indexable jobs."""
+        try:
+            return await self._reconcile_all(repository)
+        except Exception:
+            if len(self.job_index) == 0:
+                raise
+            logger.exception("⚠️ Saved job index can't be synced, rebuilding it")
+            self.job_index.clear()
+            return await self._reconcile_all(repository)
+
+    async def _reconcile_all(self, repository: JobRepository) -> Tuple[int, int]:
+        if (
+            self._space is not None
+            and self.job_index.dim not in (None, self._space[1])
+            and len(self.job_index) > 0
+        ):
+            logger.info("⚠️ Saved job index has another dimension, rebuilding it")
+            self.job_index.clear()
+        added = removed = 0
+        seen: Set[str] = set()
+        async for chunk in self._chunks(repository):
+            chunk_added, chunk_removed = await self._apply(chunk)
+            added += chunk_added
+            removed += chunk_removed
+            seen.update(id for id, _ in chunk)
+        removed += await asyncio.to_thread(self.job_index.retain, seen)
+        self._ids = seen
+        return added, removed
+
+    async def _sync_changes(
+        self, repository: JobRepository, state: Tuple[int, Optional[datetime]]
+    ) -> Tuple[int, int]:
+        """Apply the jobs written since the last sync, and drop deleted ones."""
+        _, last_updated_at = self._state
+        if last_updated_at is None:
+            return await self._sync_all(repository)
+
+        added = removed = created = 0
+        async for chunk in self._chunks(repository, last_updated_at - SYNC_OVERLAP):
+            chunk_added, chunk_removed = await self._apply(chunk)
+            added += chunk_added
+            removed += chunk_removed
+            for id, _ in chunk:
+                if id not in self._ids:
+                    self._ids.add(id)
+                    created += 1
+
+        # Deletes leave no row to find; they show as fewer jobs than the
+        # previous count plus the ones created since
+        if state[0] != self._state[0] + created:
+            self._ids = await self._all_ids(repository)
+            removed += await asyncio.to_thread(self.job_index.retain, self._ids)
+        return added, removed
+
+    async def _apply(self, chunk: List[Tuple[str, Optional[np.ndarray]]]) -> Tuple[int, int]:
+        # Quantizing (and training, once) is CPU-bound: off the event loop
+        return await asyncio.to_thread(self.job_index.update_many, chunk)
+
+    async def _chunks(
+        self, repository: JobRepository, updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[List[Tuple[str, Optional[np.ndarray]]]]:
+        """The indexable jobs' (id, embedding), in chunks of ``chunk_size``."""
+        model_name, dimension = self._space or (None, None)
+        after = None
+        while True:
+            chunk = await repository.find_index_embeddings(
+                after=after,
+                limit=self.chunk_size,
+                updated_since=updated_since,
+                model_name=model_name,
+                dimension=dimension,
+            )
+            if chunk:
+                yield chunk
+            if len(chunk) < self.chunk_size:
+                return
+            after = chunk[-1][0]
+
+    async def _all_ids(self, repository: JobRepository) -> Set[str]:
+        ids = set()
+        after = None
+        while True:
+            chunk = await repository.list_ids_after(after, self.chunk_size)
+            ids.update(chunk)
+            if len(chunk) < self.chunk_size:
+                return ids
+            after = chunk[-1]
+
+    async def _run(self) -> None:
+        await asyncio.to_thread(self.load)
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.errors += 1
+                logger.exception("❌ Syncing the job index with the database failed")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,129 @@
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Words plus the punctuation that is part of common skill names
+# (c++, c#, node.js, ci/cd is split into two tokens)
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:[.\-][a-z0-9+#]+)*")
+
+LOCATION_WEIGHT = 10.0
+SKILL_WEIGHT = 5.0
+EDUCATION_WEIGHT = 8.0
+EXPERIENCE_WEIGHT = 6.0
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case word tokens of a text."""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def build_keywords(job) -> FrozenSet[str]:
+    """Normalized token set of a job's title and description."""
+    return frozenset(tokenize(f"{job.title} {job.description}"))
+
+
+def refresh_keywords(job) -> FrozenSet[str]:
+    """Recompute and store a job's keywords after its text was written."""
+    job.keywords = build_keywords(job)
+    return job.keywords
+
+
+def job_keywords(job) -> FrozenSet[str]:
+    """A job's keywords, computed once and then kept on the job."""
+    if job.keywords is None:
+        refresh_keywords(job)
+    return job.keywords
+
+
+class KeywordHits:
+    """Rule-based hits of one candidate against one job."""
+
+    def __init__(
+        self,
+        location: bool = False,
+        skills: Optional[List[str]] = None,
+        education: bool = False,
+        experience: bool = False,
+    ):
+        self.location = location
+        self.skills = skills or []
+        self.education = education
+        self.experience = experience
+
+    @property
+    def score(self) -> float:
+        """Traditional match score for these hits."""
+        return (
+            (LOCATION_WEIGHT if self.location else 0.0)
+            + SKILL_WEIGHT * len(self.skills)
+            + (EDUCATION_WEIGHT if self.education else 0.0)
+            + (EXPERIENCE_WEIGHT if self.experience else 0.0)
+        )
+
+
+class KeywordMatcher:
+    """A candidate's match terms, compiled once per request.
+
+    Skills are matched by token-set intersection against the job's
+    pre-computed keywords: a skill hits when all of its tokens occur in the
+    job's title or description. Location, education and experience are
+    substring checks against the job's short fields, with the candidate
+    side lower-cased only once.
+    """
+
+    def __init__(self, candidate):
+        self._location = candidate.location.lower() if candidate.location else None
+        self._education = candidate.education.lower() if candidate.education else None
+        self._experience = (
+            candidate.experience.lower() if candidate.experience else None
+        )
+
+        self._skills: List[Tuple[str, FrozenSet[str]]] = []
+        self._skills_by_token: Dict[str, List[int]] = {}
+        for skill in candidate.skills:
+            tokens = frozenset(tokenize(skill))
+            if not tokens:
+                continue
+            self._skills.append((skill, tokens))
+            # Index each skill under one of its tokens; the rest are checked
+            # only when that token is present
+            self._skills_by_token.setdefault(min(tokens), []).append(
+                len(self._skills) - 1
+            )
+        self._tokens = frozenset(self._skills_by_token)
+
+    @property
+    def max_score(self) -> float:
+        """Highest traditional score any job could give this candidate."""
+        return KeywordHits(
+            location=self._location is not None,
+            skills=[skill for skill, _ in self._skills],
+            education=self._education is not None,
+            experience=self._experience is not None,
+        ).score
+
+    def match(self, job) -> KeywordHits:
+        """Find all rule-based hits for a job in one pass."""
+        keywords = job_keywords(job)
+
+        matched = []
+        for token in self._tokens & keywords:
+            for i in self._skills_by_token[token]:
+                if self._skills[i][1] <= keywords:
+                    matched.append(i)
+        matched.sort()
+
+        requirements = job.requirements or {}
+        return KeywordHits(
+            location=bool(
+                self._location and job.location and self._location in job.location.lower()
+            ),
+            skills=[self._skills[i][0] for i in matched],
+            education=self._contains(self._education, requirements.get("education")),
+            experience=self._contains(self._experience, requirements.get("experience")),
+        )
+
+    @staticmethod
+    def _contains(needle: Optional[str], haystack: Optional[str]) -> bool:
+        return bool(needle and haystack and needle in haystack.lower())
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class CorpusVersion:
+    """Version of the job corpus, for keying cached match results.
+
+    Combines the database version, which JobIndexSync sets from the jobs
+    table's state whenever it reads it, with a per-process counter that
+    every job write made by this process bumps. Cached results computed
+    against an older corpus are never served again: this process's own
+    writes invalidate them at once, other processes' writes as soon as the
+    next sync sees them.
+    """
+
+    def __init__(self):
+        self._value = 0
+        self.database_version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> Tuple[Optional[str], int]:
+        return self.database_version, self._value
+
+    def bump(self) -> int:
+        """Advance the process counter and return its new value."""
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+def match_cache_key(candidate, corpus_version: Any, **params: Any) -> str:
+    """Fingerprint of everything a match result depends on.
+
+    Covers the candidate's embedding and rule-based fields, the request
+    parameters (limit, filters, ...) and the job corpus version.
+    """
+    digest = hashlib.sha256()
+    if candidate.embedding is not None:
+        digest.update(np.asarray(candidate.embedding, dtype="<f4").tobytes())
+    digest.update(
+        json.dumps(
+            {
+                "skills": candidate.skills,
+                "location": candidate.location,
+                "education": candidate.education,
+                "experience": candidate.experience,
+                "corpus_version": corpus_version,
+                "params": params,
+            },
+            sort_keys=True,
+            default=_jsonable,
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+def _jsonable(value: Any) -> Any:
+    """JSON fallback for parameter objects such as JobFilter."""
+    return vars(value) if hasattr(value, "__dict__") else str(value)
+
+
+class MatchCache:
+    """Thread-safe LRU cache with per-entry TTL and a memory cap.
+
+    Entries are evicted least-recently-used first whenever the entry count
+    or the estimated total size exceeds its limit, and expire ``ttl_seconds``
+    after they were stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on a miss or an expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, expires_at = entry
+            if expires_at <= self._clock():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any, size: int) -> None:
+        """Store a value with its estimated size in bytes."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, size, self._clock() + self.ttl_seconds)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current usage, for metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _drop(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
@@ -0,0 +1,85 @@
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Optional
+
+from core.ports.services.embedding_backend import EmbeddingBackend
+from core.services.embedding_cache import EmbeddingCache
+from core.services.embedding_service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+class ModelRegistry:
+    """Process-wide registry that loads each embedding model at most once.
+
+    Loading a SentenceTransformer takes seconds and hundreds of MB, so the
+    API shares one EmbeddingService per model name across all requests.
+    """
+
+    def __init__(
+        self,
+        default_model: str = DEFAULT_MODEL_NAME,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        backend_factory: Optional[Callable[[str], EmbeddingBackend]] = None,
+    ):
+        self.default_model = default_model
+        # Shared by every loaded model; cache keys include the backend name
+        self.embedding_cache = embedding_cache
+        # Creates the backend for a model name; None loads sentence-transformers
+        self.backend_factory = backend_factory
+        self._services: Dict[str, EmbeddingService] = {}
+        self._ready: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_name: Optional[str] = None) -> EmbeddingService:
+        """Get the shared EmbeddingService for a model, loading it on first use."""
+        name = model_name or self.default_model
+        service = self._services.get(name)
+        if service is not None:
+            return service
+
+        # Hold the lock while loading so concurrent callers wait for the
+        # first load instead of loading the same weights twice.
+        with self._lock:
+            service = self._services.get(name)
+            if service is None:
+                backend = self.backend_factory(name) if self.backend_factory else None
+                service = EmbeddingService(
+                    name, cache=self.embedding_cache, backend=backend
+                )
+                self._services[name] = service
+                self._ready.setdefault(name, False)
+        return service
+
+    def warm_up(self, model_names: Optional[Iterable[str]] = None) -> None:
+        """Load the given models and run a dummy encode so the first request is fast."""
+        for name in model_names or [self.default_model]:
+            try:
+                service = self.get(name)
+                # Straight to the backend: a cache hit would skip the model
+                service.backend.encode(["warm-up"], 1)
+            except Exception:
+                logger.exception(f"❌ Failed to warm up embedding model: {name}")
+                continue
+            self._ready[name] = True
+            logger.info(f"✅ Embedding model warmed up: {name}")
+
+    def is_ready(self, model_name: Optional[str] = None) -> bool:
+        """Check whether a model has been loaded and warmed up."""
+        return self._ready.get(model_name or self.default_model, False)
+
+    def status(self) -> Dict[str, bool]:
+        """Readiness per registered model."""
+        return dict(self._ready)
+
+    def clear(self) -> None:
+        """Drop all loaded models (useful for testing)."""
+        with self._lock:
+            self._services = {}
+            self._ready = {}
+
+
+# Create a global instance for easy import
+model_registry = ModelRegistry()
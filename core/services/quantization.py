@@ -0,0 +1,34 @@
+from typing import Tuple
+
+import numpy as np
+
+# Largest magnitude of an int8 code; -128 is left unused so codes are symmetric
+INT8_MAX = 127
+
+# Rows are dequantized in chunks, bounding the float32 scratch memory
+SCORE_CHUNK_ROWS = 4096
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantize float vectors to int8 codes with one float32 scale per row.
+
+    Row ``i`` is approximated by ``codes[i] * scales[i]``; the scale maps
+    the row's largest absolute component to 127.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    scales = np.abs(vectors).max(axis=1) / INT8_MAX
+    scales[scales == 0] = 1.0
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def int8_scores(codes: np.ndarray, scales: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Approximate dot products of quantized rows with a float32 query."""
+    scores = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), SCORE_CHUNK_ROWS):
+        chunk = slice(start, start + SCORE_CHUNK_ROWS)
+        scores[chunk] = codes[chunk].astype(np.float32) @ query
+    scores *= scales
+    return scores
@@ -0,0 +1,99 @@
+from typing import Any, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row in place; all-zero rows are left as zeros."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first.
+
+    Uses argpartition so only the selected k are fully sorted.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        selected = np.argpartition(-scores, k - 1)[:k]
+    else:
+        selected = np.arange(n)
+    return selected[np.argsort(-scores[selected], kind="stable")]
+
+
+class ScoringEngine:
+    """Cosine scoring of one embedding against a pre-normalized job matrix.
+
+    Rows of ``matrix`` are float32 and unit length, and ``ids[i]`` /
+    ``items[i]`` describe row ``i``, so a candidate is scored against the
+    whole corpus with a single matrix-vector product.
+    """
+
+    def __init__(self, ids: np.ndarray, matrix: np.ndarray, items: Sequence[Any]):
+        self.ids = ids
+        self.matrix = matrix
+        self.items = items
+
+    @classmethod
+    def from_items(cls, items: Sequence[Any]) -> "ScoringEngine":
+        """Build an engine from objects with ``id`` and ``embedding``.
+
+        Items without an embedding are skipped.
+        """
+        with_embedding = [
+            item
+            for item in items
+            if item.embedding is not None and len(item.embedding) > 0
+        ]
+        if not with_embedding:
+            return cls(np.empty(0, dtype=object), np.empty((0, 0), np.float32), [])
+
+        matrix = np.asarray(
+            [item.embedding for item in with_embedding], dtype=np.float32
+        )
+        ids = np.array([item.id for item in with_embedding], dtype=object)
+        return cls(ids, normalize_rows(matrix), with_embedding)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def score(self, embedding: Sequence[float]) -> np.ndarray:
+        """Cosine similarity between an embedding and every row."""
+        if len(self) == 0:
+            return np.empty(0, dtype=np.float32)
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return np.zeros(len(self), dtype=np.float32)
+        return self.matrix @ (query / norm)
+
+    def score_blocks(
+        self, embeddings: Sequence[Sequence[float]], max_block_bytes: int
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Score many embeddings in row blocks of bounded size.
+
+        Yields ``(start, scores)`` where ``scores[i]`` holds the cosine
+        similarities of ``embeddings[start + i]`` against every row. Each
+        block is one matrix-matrix product of at most ``max_block_bytes``.
+        Yields nothing for no embeddings.
+        """
+        if len(embeddings) == 0:
+            return
+        queries = normalize_rows(np.array(embeddings, dtype=np.float32, ndmin=2))
+        row_bytes = max(1, len(self)) * np.dtype(np.float32).itemsize
+        block_rows = max(1, max_block_bytes // row_bytes)
+        for start in range(0, len(queries), block_rows):
+            block = queries[start : start + block_rows]
+            if len(self) == 0:
+                yield start, np.empty((len(block), 0), dtype=np.float32)
+            else:
+                yield start, block @ self.matrix.T
+
+    def top_k(self, embedding: Sequence[float], k: int) -> List[int]:
+        """Row indices of the k most similar rows, best first."""
+        return top_k(self.score(embedding), k).tolist()
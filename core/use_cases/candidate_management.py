@@ -1,32 +1,70 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from core.domain.candidate import Candidate
 from core.ports.repositories.candidate_repository import CandidateRepository
+from core.ports.repositories.pagination import decode_cursor, next_cursor
+from core.services.embedding_service import candidate_embedding_fingerprint
+from core.services.embedding_worker import CandidateEmbeddingWorker
 
 
 class CandidateManagement:
     """Use case for managing candidates."""
 
-    def __init__(self, candidate_repository: CandidateRepository):
+    def __init__(
+        self,
+        candidate_repository: CandidateRepository,
+        embedding_worker: Optional[CandidateEmbeddingWorker] = None,
+    ):
         self.candidate_repository = candidate_repository
+        self.embedding_worker = embedding_worker
 
     async def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
         """Get a Candidate by id."""
         return await self.candidate_repository.get(candidate_id)
 
+    async def get_candidates(self, candidate_ids: List[str]) -> List[Candidate]:
+        """Get the Candidates for the given ids; unknown ids are skipped."""
+        return await self.candidate_repository.get_many(candidate_ids)
+
     async def list_candidates(self, skip: int = 0, limit: int = 100) -> List[Candidate]:
         """List candidates with pagination."""
         return await self.candidate_repository.list(skip, limit)
 
+    async def list_candidates_page(
+        self, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """List candidates ordered by id from a cursor; returns the page and the next cursor.
+
+        Raises InvalidCursorError for a cursor that wasn't issued by this API.
+        """
+        candidates = await self.candidate_repository.list_after(
+            decode_cursor(cursor) if cursor else None, limit
+        )
+        return candidates, next_cursor(candidates, limit)
+
     async def create_candidate(self, candidate: Candidate) -> Candidate:
-        """Create a new Candidate."""
-        return await self.candidate_repository.create(candidate)
+        """Create a new Candidate.
+
+        A candidate created without an embedding is embedded in the background.
+        """
+        self._track_embedding(candidate)
+        created = await self.candidate_repository.create(candidate)
+        self._notify_embedding_worker(created)
+        return created
 
     async def update_candidate(
         self, candidate_id: str, candidate: Candidate
     ) -> Optional[Candidate]:
-        """Update a Candidate."""
-        return await self.candidate_repository.update(candidate_id, candidate)
+        """Update a Candidate.
+
+        If the profile fields the embedding is computed from changed, the
+        embedding is recomputed in the background.
+        """
+        self._track_embedding(candidate)
+        updated = await self.candidate_repository.update(candidate_id, candidate)
+        if updated is not None:
+            self._notify_embedding_worker(updated)
+        return updated
 
     async def delete_candidate(self, candidate_id: str) -> bool:
         """Delete a Candidate."""
@@ -34,4 +72,24 @@ class CandidateManagement:
 
     async def get_candidates_by_location(self, location: str) -> List[Candidate]:
         """Get candidates by location."""
-        return await self.candidate_repository.find_by_location(location)
\ No newline at end of file
+        return await self.candidate_repository.find_by_location(location)
+
+    @staticmethod
+    def _track_embedding(candidate: Candidate) -> None:
+        """Record the profile's embedding text and whether its embedding is stale.
+
+        The embedding is stale if the candidate has none, or its text differs
+        from the text at the last write.
+        """
+        fingerprint = candidate_embedding_fingerprint(candidate)
+        candidate.embedding_stale = (
+            candidate.embedding_stale
+            or candidate.embedding is None
+            or len(candidate.embedding) == 0
+            or fingerprint != candidate.embedding_fingerprint
+        )
+        candidate.embedding_fingerprint = fingerprint
+
+    def _notify_embedding_worker(self, candidate: Candidate) -> None:
+        if candidate.embedding_stale and self.embedding_worker is not None:
+            self.embedding_worker.notify()
\ No newline at end of file
@@ -1,15 +1,30 @@
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from core.domain.job import Job
 from core.ports.repositories.job_repository import JobRepository
+from core.ports.repositories.pagination import decode_cursor, next_cursor
+from core.services.ann_index import IVFIndex
+from core.services.embedding_service import job_embedding_fingerprint
+from core.services.embedding_worker import EmbeddingWorker
+from core.services.keyword_matcher import refresh_keywords
+from core.services.match_cache import CorpusVersion
 
 
 class JobManagement:
     """Use case for managing jobs."""
 
-    def __init__(self, job_repository: JobRepository):
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        job_index: Optional[IVFIndex] = None,
+        corpus_version: Optional[CorpusVersion] = None,
+        embedding_worker: Optional[EmbeddingWorker] = None,
+    ):
         self.job_repository = job_repository
+        self.job_index = job_index
+        self.corpus_version = corpus_version
+        self.embedding_worker = embedding_worker
 
     async def get_job(self, job_id: str) -> Optional[Job]:
         """Get a Job by id."""
@@ -19,17 +34,105 @@ class JobManagement:
         """List jobs with pagination."""
         return await self.job_repository.list(skip, limit)
 
+    async def list_jobs_page(
+        self, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[Job], Optional[str]]:
+        """List jobs ordered by id from a cursor; returns the page and the next cursor.
+
+        Raises InvalidCursorError for a cursor that wasn't issued by this API.
+        """
+        jobs = await self.job_repository.list_after(
+            decode_cursor(cursor) if cursor else None, limit
+        )
+        return jobs, next_cursor(jobs, limit)
+
     async def create_job(self, job: Job) -> Job:
-        """Create a new Job."""
-        return await self.job_repository.create(job)
+        """Create a new Job.
+
+        A job created without an embedding is embedded in the background.
+        """
+        refresh_keywords(job)
+        self._track_embedding(job, embedding_provided=self._has_embedding(job))
+        created = await self.job_repository.create(job)
+        self._index_job(created)
+        self._bump_corpus_version()
+        self._notify_embedding_worker(created)
+        return created
+
+    async def create_jobs(self, jobs: List[Job]) -> Tuple[List[Job], Dict[int, str]]:
+        """Create many jobs, in one transaction when possible.
+
+        If the batch insert fails, the jobs are created one by one, so one
+        bad job doesn't fail the others. Returns the created jobs and the
+        errors by position in ``jobs``.
+        """
+        for job in jobs:
+            refresh_keywords(job)
+            self._track_embedding(job, embedding_provided=self._has_embedding(job))
+
+        errors: Dict[int, str] = {}
+        try:
+            created = await self.job_repository.create_many(jobs)
+        except Exception:
+            created = []
+            for position, job in enumerate(jobs):
+                try:
+                    created.append(await self.job_repository.create(job))
+                except Exception as error:
+                    errors[position] = self._error_message(error)
+
+        for job in created:
+            self._index_job(job)
+        if created:
+            self._bump_corpus_version()
+        if any(job.embedding_stale for job in created) and self.embedding_worker is not None:
+            self.embedding_worker.notify()
+        return created, errors
 
     async def update_job(self, job_id: str, job: Job) -> Optional[Job]:
-        """Update a Job."""
-        return await self.job_repository.update(job_id, job)
+        """Update a Job.
+
+        If the text the embedding is computed from changed, the embedding
+        is recomputed in the background.
+        """
+        refresh_keywords(job)
+        self._track_embedding(job)
+        updated = await self.job_repository.update(job_id, job)
+        if updated is not None:
+            self._index_job(updated)
+            self._bump_corpus_version()
+            self._notify_embedding_worker(updated)
+        return updated
+
+    async def set_job_embedding(
+        self,
+        job_id: str,
+        job: Job,
+        embedding: Sequence[float],
+        model_name: Optional[str] = None,
+    ) -> Optional[Job]:
+        """Store an embedding computed elsewhere for the job's current text.
+
+        ``model_name`` names the backend that produced it, if known.
+        """
+        job.embedding = embedding
+        job.embedding_model = model_name
+        refresh_keywords(job)
+        self._track_embedding(job, embedding_provided=True)
+        updated = await self.job_repository.update(job_id, job)
+        if updated is not None:
+            self._index_job(updated)
+            self._bump_corpus_version()
+        return updated
 
     async def delete_job(self, job_id: str) -> bool:
         """Delete a Job."""
-        return await self.job_repository.delete(job_id)
+        deleted = await self.job_repository.delete(job_id)
+        if deleted:
+            if self.job_index is not None:
+                self.job_index.remove(job_id)
+            self._bump_corpus_version()
+        return deleted
 
     async def get_jobs_by_category(self, category: str) -> List[Job]:
         """Get jobs by category."""
@@ -37,4 +140,49 @@ class JobManagement:
 
     async def get_available_jobs(self) -> List[Job]:
         """Get available jobs."""
-        return await self.job_repository.find_available()
\ No newline at end of file
+        return await self.job_repository.find_available()
+
+    @staticmethod
+    def _error_message(error: Exception) -> str:
+        """One-line error description (database errors add the statement below)."""
+        lines = str(error).splitlines()
+        return lines[0] if lines else type(error).__name__
+
+    @staticmethod
+    def _has_embedding(job: Job) -> bool:
+        return job.embedding is not None and len(job.embedding) > 0
+
+    def _track_embedding(self, job: Job, embedding_provided: bool = False) -> None:
+        """Record the job's embedding text and whether its embedding is stale.
+
+        The embedding is stale if the job has none, or its text differs from
+        the text at the last write (and no new embedding came with it).
+        """
+        fingerprint = job_embedding_fingerprint(job)
+        if embedding_provided:
+            job.embedding_stale = False
+        else:
+            job.embedding_stale = (
+                job.embedding_stale
+                or not self._has_embedding(job)
+                or fingerprint != job.embedding_fingerprint
+            )
+        job.embedding_fingerprint = fingerprint
+
+    def _notify_embedding_worker(self, job: Job) -> None:
+        if job.embedding_stale and self.embedding_worker is not None:
+            self.embedding_worker.notify()
+
+    def _index_job(self, job: Job) -> None:
+        """Keep the job index in step with a written job."""
+        if self.job_index is None:
+            return
+        if self._has_embedding(job):
+            self.job_index.add(job.id, job.embedding)
+        else:
+            self.job_index.remove(job.id)
+
+    def _bump_corpus_version(self) -> None:
+        """Invalidate cached match results computed before this write."""
+        if self.corpus_version is not None:
+            self.corpus_version.bump()
@@ -1,9 +1,40 @@
-from typing import List, Dict, Any, Optional
+import asyncio
+import copy
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
 from core.domain.candidate import Candidate
 from core.domain.job import Job
+from core.domain.job_filter import JobFilter
+from core.domain.job_projection import JobProjection
 from core.ports.repositories.candidate_repository import CandidateRepository
 from core.ports.repositories.job_repository import JobRepository
-from core.services.embedding_service import EmbeddingService
+from core.services.embedding_service import (
+    EmbeddingService,
+    candidate_embedding_fingerprint,
+    is_compatible_embedding,
+)
+from core.services.ann_index import IVFIndex
+from core.services.batching_encoder import BatchingEncoder
+from core.services.job_index_sync import JobIndexSync
+from core.services.keyword_matcher import KeywordHits, KeywordMatcher
+from core.services.match_cache import CorpusVersion, MatchCache, match_cache_key
+from core.services.model_registry import model_registry
+from core.services.scoring_engine import ScoringEngine, top_k
+
+# Combined score: 70% semantic, 30% traditional
+SEMANTIC_WEIGHT = 0.7
+TRADITIONAL_WEIGHT = 0.3
+MIN_COMBINED_SCORE = 30
+
+# Semantic candidate generation through the job index
+DEFAULT_CANDIDATE_POOL_SIZE = 200
+DEFAULT_N_PROBE = 8
+
+# Upper bound on the score block held in memory by batch matching
+DEFAULT_MAX_BLOCK_BYTES = 64 * 1024 * 1024
 
 
 class MatchJobs:
@@ -13,99 +44,359 @@ class MatchJobs:
         self,
         job_repository: JobRepository,
         candidate_repository: CandidateRepository,
-        embedding_service: Optional[EmbeddingService] = None
+        embedding_service: Optional[EmbeddingService] = None,
+        job_index: Optional[IVFIndex] = None,
+        candidate_pool_size: int = DEFAULT_CANDIDATE_POOL_SIZE,
+        default_n_probe: int = DEFAULT_N_PROBE,
+        match_cache: Optional[MatchCache] = None,
+        corpus_version: Optional[CorpusVersion] = None,
+        embedding_encoder: Optional[BatchingEncoder] = None,
+        job_index_sync: Optional[JobIndexSync] = None,
     ):
         self.job_repository = job_repository
         self.candidate_repository = candidate_repository
-        self.embedding_service = embedding_service or EmbeddingService()
+        self._embedding_service = embedding_service
+        self.job_index = job_index
+        self.candidate_pool_size = candidate_pool_size
+        self.default_n_probe = default_n_probe
+        self.match_cache = match_cache
+        self.corpus_version = corpus_version or CorpusVersion()
+        self.embedding_encoder = embedding_encoder
+        # Without a sync the index is trusted as is
+        self.job_index_sync = job_index_sync
+        # (backend name, dimension) of the active backend, once resolved
+        self._space: Optional[Tuple[str, int]] = None
+
+    @property
+    def embedding_service(self) -> EmbeddingService:
+        """Embedding service, resolved from the shared registry on first use.
+
+        Resolving lazily keeps rule-based paths such as fallback_match from
+        ever loading the model.
+        """
+        if self._embedding_service is None:
+            self._embedding_service = model_registry.get()
+        return self._embedding_service
 
     async def match_jobs_for_profile(
-        self, candidate: Candidate, limit: int = 10
+        self,
+        candidate: Candidate,
+        limit: int = 10,
+        n_probe: Optional[int] = None,
+        filters: Optional[JobFilter] = None,
     ) -> List[Dict[str, Any]]:
         """Match jobs for a candidate using semantic similarity.
 
+        With ``filters``, only the eligible jobs are loaded (the filtering
+        happens in the repository) and all of them are scored. Otherwise,
+        when a job index in step with the database is available, only its
+        nearest jobs are scored; ``n_probe`` sets how many index lists are searched (higher is more
+        accurate and slower, ``None`` uses ``default_n_probe``).
+
         Returns a list of matches with structure:
         [{"job": Job, "score": float, "match_reasons": List[str]}]
         """
-        # Generate candidate embedding if not exists
-        if not candidate.embedding:
-            candidate.embedding = self.embedding_service.generate_candidate_embedding(candidate)
-            if candidate.id:
-                await self.candidate_repository.update(candidate.id, candidate)
-
-        # Get all available jobs
-        available_jobs = await self.job_repository.find_available()
-
-        # Calculate match scores
-        matches = []
-        for job in available_jobs:
-            # Skip jobs without embeddings
-            if not job.embedding:
-                continue
-
-            # Calculate semantic similarity
-            similarity = self.embedding_service.calculate_similarity(
-                candidate.embedding,
-                job.embedding
+        # Use the stored embedding, or compute one if the profile changed
+        [candidate] = await self._with_current_embeddings([candidate])
+
+        # Serve repeated requests from the cache while the corpus is unchanged
+        cache_key = None
+        if self.match_cache is not None:
+            cache_key = match_cache_key(
+                candidate,
+                self.corpus_version.value,
+                limit=limit,
+                n_probe=n_probe,
+                filters=filters,
+                today=date.today().isoformat(),
             )
+            cached = self.match_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
 
-            # Convert to percentage score (0-100)
-            semantic_score = similarity * 100
+        matches = await self._match(candidate, limit, n_probe, filters)
 
-            # Traditional matching factors
-            traditional_score = self._calculate_traditional_score(candidate, job)
+        if cache_key is not None:
+            self.match_cache.put(cache_key, matches, self._estimate_size(matches))
+        return list(matches)
 
-            # Combined score: 70% semantic, 30% traditional
-            combined_score = (semantic_score * 0.7) + (traditional_score * 0.3)
-
-            # Only include matches with reasonable scores
-            if combined_score > 30:
-                match_reasons = self._get_match_reasons(candidate, job, semantic_score, traditional_score)
-                matches.append({
-                    "job": job,
-                    "score": combined_score,
-                    "match_reasons": match_reasons
-                })
-
-        # Sort by score (descending)
-        matches.sort(key=lambda x: x["score"], reverse=True)
+    async def _match(
+        self,
+        candidate: Candidate,
+        limit: int,
+        n_probe: Optional[int],
+        filters: Optional[JobFilter],
+    ) -> List[Dict[str, Any]]:
+        """Score and rank jobs for a candidate that has an embedding."""
+        space = await self._embedding_space()
+        # Get candidate jobs: the eligible jobs for a filtered search, the
+        # semantic neighbours from the index, or every available job. Only
+        # their scoring projections are loaded.
+        if filters is not None and not filters.is_empty():
+            available_jobs = await self.job_repository.find_available_for_scoring(
+                filters=filters
+            )
+        elif self._index_is_usable(space):
+            available_jobs = await self._nearest_available_jobs(
+                candidate.embedding, max(limit, self.candidate_pool_size), n_probe
+            )
+        else:
+            available_jobs = await self.job_repository.find_available_for_scoring()
 
-        # Return top matches
-        return matches[:limit]
+        # Score every job with one matrix-vector product
+        engine = ScoringEngine.from_items(self._compatible(available_jobs, space))
+        semantic_scores = engine.score(candidate.embedding) * 100
 
-    def _calculate_traditional_score(self, candidate: Candidate, job: Job) -> float:
-        """Calculate traditional rule-based match score."""
-        score = 0.0
+        matches = self._rank(candidate, engine.items, semantic_scores, limit)
+        return self._attach_jobs(matches, await self._load_jobs(matches))
 
-        # Match based on location (weight: 10)
-        if candidate.location and job.location:
-            if candidate.location.lower() in job.location.lower():
-                score += 10.0
+    async def match_jobs_for_profiles(
+        self,
+        candidates: List[Candidate],
+        limit: int = 10,
+        filters: Optional[JobFilter] = None,
+        max_block_bytes: int = DEFAULT_MAX_BLOCK_BYTES,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Match jobs for many candidates at once.
+
+        The job corpus is loaded and normalized once, and candidates are
+        scored against it with candidate-by-job matrix products in blocks of
+        at most ``max_block_bytes`` of scores.
+
+        Returns the matches for each candidate, keyed by candidate id.
+        """
+        candidates = await self._with_current_embeddings(candidates)
+        if not candidates:
+            return {}
+
+        available_jobs = await self.job_repository.find_available_for_scoring(
+            filters=filters
+        )
+        engine = ScoringEngine.from_items(
+            self._compatible(available_jobs, await self._embedding_space())
+        )
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        embeddings = [candidate.embedding for candidate in candidates]
+        for start, block in engine.score_blocks(embeddings, max_block_bytes):
+            for offset, similarities in enumerate(block):
+                candidate = candidates[start + offset]
+                results[candidate.id] = self._rank(
+                    candidate, engine.items, similarities * 100, limit
+                )
+
+        # Load the full jobs once for all candidates' matches
+        jobs = await self._load_jobs(
+            [match for matches in results.values() for match in matches]
+        )
+        return {
+            candidate_id: self._attach_jobs(matches, jobs)
+            for candidate_id, matches in results.items()
+        }
+
+    async def _load_jobs(self, matches: List[Dict[str, Any]]) -> Dict[str, Job]:
+        """Load the full jobs of ranked matches in one query, keyed by id."""
+        ids = list(dict.fromkeys(match["job"].id for match in matches))
+        if not ids:
+            return {}
+        return {job.id: job for job in await self.job_repository.get_many(ids)}
+
+    @staticmethod
+    def _attach_jobs(
+        matches: List[Dict[str, Any]], jobs: Dict[str, Job]
+    ) -> List[Dict[str, Any]]:
+        """Replace the matches' job projections with the full jobs.
 
-        # Match based on skills (weight: 5 per skill)
-        job_text = f"{job.title} {job.description}".lower()
-        for skill in candidate.skills:
-            if skill.lower() in job_text:
-                score += 5.0
+        Matches whose job was deleted since it was scored are dropped.
+        """
+        hydrated = []
+        for match in matches:
+            job = jobs.get(match["job"].id)
+            if job is not None:
+                hydrated.append({**match, "job": job})
+        return hydrated
+
+    @staticmethod
+    def _estimate_size(matches: List[Dict[str, Any]]) -> int:
+        """Rough number of bytes a cached match list keeps alive."""
+        size = 64
+        for match in matches:
+            job = match["job"]
+            size += 512 + len(job.title) + len(job.description)
+            size += len(job.responsibilities or "")
+            size += sum(len(reason) for reason in match["match_reasons"])
+        return size
+
+    async def _with_current_embeddings(
+        self, candidates: List[Candidate]
+    ) -> List[Candidate]:
+        """The candidates, each with an embedding of its current profile.
+
+        Stored embeddings are used as long as they were computed for the
+        current profile by the active backend. Otherwise (the background
+        worker hasn't caught up yet) the embedding is computed for this
+        request only, on a copy of the candidate: saving it is left to the
+        worker.
+
+        Encoding never runs on the event loop: it goes through the batching
+        encoder when there is one, or a worker thread otherwise.
+        """
+        space = await self._embedding_space() if candidates else None
+        outdated = [
+            index
+            for index, candidate in enumerate(candidates)
+            if not self._has_current_embedding(candidate, space)
+        ]
+        if not outdated:
+            return candidates
+
+        profiles = [candidates[index] for index in outdated]
+        if self.embedding_encoder is not None:
+            embeddings = await asyncio.gather(
+                *(self.embedding_encoder.encode_candidate(c) for c in profiles)
+            )
+        else:
+            embeddings = await asyncio.to_thread(
+                lambda: self.embedding_service.encode_candidates(profiles)
+            )
 
-        # Match based on education (weight: 8)
-        if candidate.education and job.requirements.get("education"):
-            if candidate.education.lower() in job.requirements.get("education", "").lower():
-                score += 8.0
+        current = list(candidates)
+        for index, embedding in zip(outdated, embeddings):
+            candidate = copy.copy(candidates[index])
+            candidate.embedding = embedding
+            current[index] = candidate
+        return current
+
+    @staticmethod
+    def _has_current_embedding(candidate: Candidate, space: Tuple[str, int]) -> bool:
+        if not is_compatible_embedding(
+            candidate.embedding, candidate.embedding_model, *space
+        ):
+            return False
+        if candidate.embedding_stale:
+            return False
+        # Profiles that never went through CandidateManagement carry no
+        # fingerprint; their embedding is taken as is
+        return (
+            candidate.embedding_fingerprint is None
+            or candidate.embedding_fingerprint == candidate_embedding_fingerprint(candidate)
+        )
+
+    async def _embedding_space(self) -> Tuple[str, int]:
+        """(backend name, dimension) of the backend that embeds candidates."""
+        if self._space is None:
+            # Resolving the service may load the model: off the event loop
+            if self.embedding_encoder is not None:
+                service = await asyncio.to_thread(self.embedding_encoder.service_factory)
+            else:
+                service = await asyncio.to_thread(lambda: self.embedding_service)
+            self._space = (service.backend_name, service.dimension)
+        return self._space
+
+    @staticmethod
+    def _compatible(
+        jobs: List[JobProjection], space: Tuple[str, int]
+    ) -> List[JobProjection]:
+        """The jobs whose embedding the active backend produced.
+
+        Jobs embedded by another backend can't be compared with the
+        candidate's embedding; they are left out until re-embedded.
+        """
+        return [
+            job
+            for job in jobs
+            if is_compatible_embedding(job.embedding, job.embedding_model, *space)
+        ]
+
+    def _index_is_usable(self, space: Tuple[str, int]) -> bool:
+        """Whether the job index can stand in for the available jobs.
+
+        An index that isn't in step with the database (still loading, or
+        its syncs failing) would silently leave jobs out of every match,
+        and one of another dimension can't be searched with the
+        candidate's embedding.
+        """
+        if self.job_index is None or len(self.job_index) == 0:
+            return False
+        if self.job_index.dim != space[1]:
+            return False
+        return self.job_index_sync is None or self.job_index_sync.is_current()
+
+    async def _nearest_available_jobs(
+        self, embedding: List[float], pool_size: int, n_probe: Optional[int]
+    ) -> List[JobProjection]:
+        """Load the available jobs among the index's nearest neighbours."""
+        neighbours = self.job_index.search(
+            embedding, pool_size, n_probe if n_probe is not None else self.default_n_probe
+        )
+        return await self.job_repository.find_available_for_scoring(
+            ids=[id for id, _ in neighbours]
+        )
+
+    def _rank(
+        self,
+        candidate: Candidate,
+        jobs: List[JobProjection],
+        semantic_scores: np.ndarray,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Combine semantic and traditional scores and return the top matches.
 
-        # Match based on experience (weight: 6)
-        if candidate.experience and job.requirements.get("experience"):
-            if candidate.experience.lower() in job.requirements.get("experience", "").lower():
-                score += 6.0
+        The traditional score is bounded, so jobs whose best possible
+        combined score cannot reach the threshold or the current top-k are
+        pruned before any per-job Python work is done.
+        """
+        if len(jobs) == 0 or limit <= 0:
+            return []
+
+        # Compile the candidate's skills once for all jobs in this request
+        matcher = KeywordMatcher(candidate)
+        upper_bounds = (
+            semantic_scores * SEMANTIC_WEIGHT + matcher.max_score * TRADITIONAL_WEIGHT
+        )
+        candidates = np.flatnonzero(upper_bounds > MIN_COMBINED_SCORE)
+
+        # The semantic part alone is a lower bound on the combined score, so
+        # the k-th best lower bound rules out every job whose upper bound is
+        # below it.
+        if len(candidates) > limit:
+            lower_bounds = semantic_scores[candidates] * SEMANTIC_WEIGHT
+            kth_lower = np.partition(lower_bounds, len(lower_bounds) - limit)[
+                len(lower_bounds) - limit
+            ]
+            candidates = candidates[upper_bounds[candidates] >= kth_lower]
+
+        # One keyword pass per job, shared by the score and the reasons
+        hits = [matcher.match(jobs[index]) for index in candidates]
+        traditional_scores = np.array([job_hits.score for job_hits in hits])
+        combined_scores = (
+            semantic_scores[candidates] * SEMANTIC_WEIGHT
+            + traditional_scores * TRADITIONAL_WEIGHT
+        )
+
+        # Only include matches with reasonable scores
+        eligible = np.flatnonzero(combined_scores > MIN_COMBINED_SCORE)
 
-        return score
+        matches = []
+        for position in eligible[top_k(combined_scores[eligible], limit)]:
+            job = jobs[candidates[position]]
+            semantic_score = float(semantic_scores[candidates[position]])
+            matches.append({
+                "job": job,
+                "score": float(combined_scores[position]),
+                "match_reasons": self._get_match_reasons(
+                    candidate, job, semantic_score, hits[position]
+                ),
+            })
+
+        return matches
 
     def _get_match_reasons(
-        self, 
-        candidate: Candidate, 
-        job: Job, 
+        self,
+        candidate: Candidate,
+        job: JobProjection,
         semantic_score: float,
-        traditional_score: float
+        hits: KeywordHits,
     ) -> List[str]:
         """Get the reasons for a match."""
         reasons = []
@@ -119,28 +410,23 @@ class MatchJobs:
             reasons.append(f"👍 Moderate semantic match ({semantic_score:.1f}%)")
 
         # Location match
-        if candidate.location and job.location:
-            if candidate.location.lower() in job.location.lower():
-                reasons.append(f"📍 Location match: {job.location}")
+        if hits.location:
+            reasons.append(f"📍 Location match: {job.location}")
 
         # Skills match
-        job_text = f"{job.title} {job.description}".lower()
-        matched_skills = [s for s in candidate.skills if s.lower() in job_text]
-        if matched_skills:
-            skills_str = ", ".join(matched_skills[:3])
-            if len(matched_skills) > 3:
-                skills_str += f" (+{len(matched_skills) - 3} more)"
+        if hits.skills:
+            skills_str = ", ".join(hits.skills[:3])
+            if len(hits.skills) > 3:
+                skills_str += f" (+{len(hits.skills) - 3} more)"
             reasons.append(f"💡 Matching skills: {skills_str}")
 
         # Education match
-        if candidate.education and job.requirements.get("education"):
-            if candidate.education.lower() in job.requirements.get("education", "").lower():
-                reasons.append(f"🎓 Education match: {candidate.education}")
+        if hits.education:
+            reasons.append(f"🎓 Education match: {candidate.education}")
 
         # Experience match
-        if candidate.experience and job.requirements.get("experience"):
-            if candidate.experience.lower() in job.requirements.get("experience", "").lower():
-                reasons.append(f"💼 Experience level matches")
+        if hits.experience:
+            reasons.append(f"💼 Experience level matches")
 
         return reasons
 
@@ -155,23 +441,22 @@ class MatchJobs:
         all_jobs = await self.job_repository.list()
 
         # Basic matching based on simple rules
+        matcher = KeywordMatcher(candidate)
         matches = []
         for job in all_jobs:
+            hits = matcher.match(job)
             match_score = 0
             match_reasons = []
 
             # Check for skill matches in title and description
-            job_text = f"{job.title} {job.description}".lower()
-            for skill in candidate.skills:
-                if skill.lower() in job_text:
-                    match_score += 10
-                    match_reasons.append(f"Your skill '{skill}' matches this job")
+            for skill in hits.skills:
+                match_score += 10
+                match_reasons.append(f"Your skill '{skill}' matches this job")
 
             # Location match
-            if candidate.location and job.location:
-                if candidate.location.lower() in job.location.lower():
-                    match_score += 15
-                    match_reasons.append(f"Location match: {job.location}")
+            if hits.location:
+                match_score += 15
+                match_reasons.append(f"Location match: {job.location}")
 
             # If we have any match at all, include it
             if match_score > 0:
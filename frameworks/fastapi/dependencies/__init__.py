@@ -10,6 +10,16 @@ from frameworks.fastapi.dependencies.use_cases import (
     get_job_management,
     get_requirement_management,
     get_match_jobs,
+    get_fallback_match_jobs,
+)
+from frameworks.fastapi.dependencies.services import (
+    get_candidate_embedding_worker,
+    get_corpus_version,
+    get_embedding_encoder,
+    get_embedding_service,
+    get_embedding_worker,
+    get_job_index,
+    get_match_cache,
 )
 from frameworks.fastapi.dependencies.database import get_db_session
 
@@ -22,5 +32,13 @@ __all__ = [
     "get_job_management",
     "get_requirement_management",
     "get_match_jobs",
+    "get_fallback_match_jobs",
+    "get_embedding_service",
+    "get_embedding_encoder",
+    "get_embedding_worker",
+    "get_candidate_embedding_worker",
+    "get_job_index",
+    "get_match_cache",
+    "get_corpus_version",
     "get_db_session",
 ]
\ No newline at end of file
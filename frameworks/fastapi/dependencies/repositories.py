@@ -1,18 +1,11 @@
-from typing import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.ports.repositories.candidate_repository import CandidateRepository
 from core.ports.repositories.job_repository import JobRepository
 from core.ports.repositories.requirement_repository import RequirementRepository
+from frameworks.fastapi.dependencies.database import get_db_session
 from repository_factory import repository_factory
-from infrastructure.db.database import get_db
-
-
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session dependency."""
-    async for session in get_db():
-        yield session
 
 
 def get_candidate_repository(
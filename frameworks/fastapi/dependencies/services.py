@@ -0,0 +1,120 @@
+import logging
+
+from adapters.services.embedding_backend_factory import create_embedding_backend
+from config import config
+from core.ports.services.embedding_backend import EmbeddingBackend
+from core.services.ann_index import IVFIndex
+from core.services.batching_encoder import BatchingEncoder
+from core.services.embedding_cache import EmbeddingCache
+from core.services.embedding_worker import CandidateEmbeddingWorker, EmbeddingWorker
+from core.services.embedding_service import EmbeddingService
+from core.services.job_index_sync import JobIndexSync
+from core.services.match_cache import CorpusVersion, MatchCache
+from core.services.model_registry import model_registry
+
+logger = logging.getLogger(__name__)
+
+# Process-wide index over job embeddings, kept in step by JobManagement with
+# this process's writes and by job_index_sync with everyone else's
+job_index = IVFIndex(
+    rescore_size=config.ANN_RESCORE_SIZE,
+    vectors_dir=config.ANN_VECTORS_DIR or None,
+)
+
+# Process-wide embedding cache, shared by all models in the registry
+embedding_cache = EmbeddingCache(
+    config.EMBEDDING_CACHE_PATH or None,
+    max_entries=config.EMBEDDING_CACHE_MAX_ENTRIES,
+)
+
+# Process-wide match result cache, invalidated by job corpus writes
+corpus_version = CorpusVersion()
+match_cache = MatchCache(
+    max_entries=config.MATCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.MATCH_CACHE_TTL_SECONDS,
+    max_bytes=config.MATCH_CACHE_MAX_BYTES,
+)
+
+
+def create_configured_backend(model_name: str) -> EmbeddingBackend:
+    """Create the configured embedding backend for a model."""
+    return create_embedding_backend(
+        config.EMBEDDING_BACKEND, model_name, config.EMBEDDING_MODEL_PATH or None
+    )
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get the process-wide EmbeddingService for the configured model."""
+    return model_registry.get(config.EMBEDDING_MODEL)
+
+
+# Process-wide request-time encoder; resolves the model on its own thread
+embedding_encoder = BatchingEncoder(
+    get_embedding_service,
+    max_batch_size=config.EMBEDDING_BATCH_MAX_SIZE,
+    max_wait_ms=config.EMBEDDING_BATCH_MAX_WAIT_MS,
+    workers=config.EMBEDDING_THREADS,
+)
+
+
+def get_embedding_encoder() -> BatchingEncoder:
+    """Get the process-wide micro-batching embedding encoder."""
+    return embedding_encoder
+
+
+# Process-wide background worker embedding new and edited jobs
+embedding_worker = EmbeddingWorker(
+    get_embedding_service,
+    job_index=job_index,
+    corpus_version=corpus_version,
+    batch_size=config.EMBEDDING_WORKER_BATCH_SIZE,
+    poll_interval=config.EMBEDDING_WORKER_POLL_SECONDS,
+)
+
+
+def get_embedding_worker() -> EmbeddingWorker:
+    """Get the process-wide background embedding worker."""
+    return embedding_worker
+
+
+# Process-wide background worker embedding new and edited candidate profiles
+candidate_embedding_worker = CandidateEmbeddingWorker(
+    get_embedding_service,
+    batch_size=config.EMBEDDING_WORKER_BATCH_SIZE,
+    poll_interval=config.EMBEDDING_WORKER_POLL_SECONDS,
+)
+
+
+def get_candidate_embedding_worker() -> CandidateEmbeddingWorker:
+    """Get the process-wide background candidate embedding worker."""
+    return candidate_embedding_worker
+
+
+def get_job_index() -> IVFIndex:
+    """Get the process-wide job embedding index."""
+    return job_index
+
+
+def get_corpus_version() -> CorpusVersion:
+    """Get the process-wide job corpus version."""
+    return corpus_version
+
+
+def get_match_cache() -> MatchCache:
+    """Get the process-wide match result cache."""
+    return match_cache
+
+
+# Process-wide background sync of the job index with the database
+job_index_sync = JobIndexSync(
+    job_index,
+    corpus_version=corpus_version,
+    index_path=config.ANN_INDEX_PATH,
+    interval=config.ANN_SYNC_SECONDS,
+    service_factory=get_embedding_service,
+)
+
+
+def get_job_index_sync() -> JobIndexSync:
+    """Get the process-wide job index sync."""
+    return job_index_sync
@@ -1,31 +1,51 @@
 from fastapi import Depends
 
+from config import config
+
 from core.use_cases.candidate_management import CandidateManagement
 from core.use_cases.job_management import JobManagement
 from core.use_cases.requirement_management import RequirementManagement
 from core.use_cases.match_jobs import MatchJobs 
 from core.ports.repositories.candidate_repository import CandidateRepository
 from core.ports.repositories.job_repository import JobRepository 
+from core.services.ann_index import IVFIndex
+from core.services.batching_encoder import BatchingEncoder
+from core.services.embedding_worker import CandidateEmbeddingWorker, EmbeddingWorker
+from core.services.job_index_sync import JobIndexSync
+from core.services.match_cache import CorpusVersion, MatchCache
 
 from frameworks.fastapi.dependencies.repositories import (
     get_candidate_repository,
     get_job_repository,
     get_requirement_repository,
 )
+from frameworks.fastapi.dependencies.services import (
+    get_candidate_embedding_worker,
+    get_corpus_version,
+    get_embedding_encoder,
+    get_embedding_worker,
+    get_job_index,
+    get_job_index_sync,
+    get_match_cache,
+)
 
 
 def get_candidate_management(
     candidate_repository=Depends(get_candidate_repository),
+    embedding_worker: CandidateEmbeddingWorker = Depends(get_candidate_embedding_worker),
 ) -> CandidateManagement:
     """Get Candidate management use case dependency."""
-    return CandidateManagement(candidate_repository)
+    return CandidateManagement(candidate_repository, embedding_worker)
 
 
 def get_job_management(
     job_repository=Depends(get_job_repository),
+    job_index: IVFIndex = Depends(get_job_index),
+    corpus_version: CorpusVersion = Depends(get_corpus_version),
+    embedding_worker: EmbeddingWorker = Depends(get_embedding_worker),
 ) -> JobManagement:
     """Get Job management use case dependency."""
-    return JobManagement(job_repository)
+    return JobManagement(job_repository, job_index, corpus_version, embedding_worker)
 
 
 def get_requirement_management(
@@ -38,7 +58,38 @@ def get_requirement_management(
 def get_match_jobs(
     job_repo: JobRepository = Depends(get_job_repository),
     candidate_repo: CandidateRepository = Depends(get_candidate_repository),
+    embedding_encoder: BatchingEncoder = Depends(get_embedding_encoder),
+    job_index: IVFIndex = Depends(get_job_index),
+    match_cache: MatchCache = Depends(get_match_cache),
+    corpus_version: CorpusVersion = Depends(get_corpus_version),
+    job_index_sync: JobIndexSync = Depends(get_job_index_sync),
 ) -> MatchJobs:
-    from core.services.embedding_service import EmbeddingService
-    embedding_service = EmbeddingService()
-    return MatchJobs(job_repo, candidate_repo, embedding_service)
\ No newline at end of file
+    """Get Match jobs use case dependency backed by the shared embedding model.
+
+    Candidate embeddings are kept up to date by the background worker;
+    profiles it hasn't caught up with yet are encoded through the
+    micro-batching encoder, off the event loop, without being saved.
+    """
+    return MatchJobs(
+        job_repo,
+        candidate_repo,
+        embedding_encoder=embedding_encoder,
+        job_index=job_index,
+        candidate_pool_size=config.ANN_CANDIDATE_POOL_SIZE,
+        default_n_probe=config.ANN_N_PROBE,
+        match_cache=match_cache,
+        corpus_version=corpus_version,
+        job_index_sync=job_index_sync,
+    )
+
+
+def get_fallback_match_jobs(
+    job_repo: JobRepository = Depends(get_job_repository),
+    candidate_repo: CandidateRepository = Depends(get_candidate_repository),
+) -> MatchJobs:
+    """Get Match jobs use case dependency for rule-based matching only.
+
+    The fallback path never touches the embedding model, so it keeps
+    working while the model is loading or unavailable.
+    """
+    return MatchJobs(job_repo, candidate_repo)
\ No newline at end of file
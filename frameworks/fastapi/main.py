@@ -1,16 +1,33 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import config
-from frameworks.fastapi.routes import candidates, jobs, match, requirements
+from core.services.model_registry import model_registry
+from frameworks.fastapi.dependencies.services import (
+    candidate_embedding_worker,
+    create_configured_backend,
+    embedding_cache,
+    embedding_encoder,
+    embedding_worker,
+    job_index,
+    job_index_sync,
+    match_cache,
+)
+from frameworks.fastapi.routes import NEXT_CURSOR_HEADER, candidates, jobs, match, requirements
 
 logger = logging.getLogger(__name__)
 
 
 def register_memory_repositories(app: FastAPI):
-    """Register memory repositories (data in RAM - resets on restart)."""
-    from repository_factory import repository_factory
+    """Register memory repositories (data in RAM - resets on restart).
+
+    Shared by all requests, since each instance holds its own data.
+    """
+    from repository_factory import SINGLETON, repository_factory
     from core.ports.repositories.candidate_repository import CandidateRepository
     from core.ports.repositories.job_repository import JobRepository
     from core.ports.repositories.requirement_repository import RequirementRepository
@@ -18,14 +35,17 @@ def register_memory_repositories(app: FastAPI):
     from adapters.repositories.memory.memory_job_repository import MemoryJobRepository
     from adapters.repositories.memory.memory_requirement_repository import MemoryRequirementRepository
     
-    repository_factory.register(CandidateRepository, MemoryCandidateRepository)
-    repository_factory.register(JobRepository, MemoryJobRepository)
-    repository_factory.register(RequirementRepository, MemoryRequirementRepository)
+    repository_factory.register(CandidateRepository, MemoryCandidateRepository, scope=SINGLETON)
+    repository_factory.register(JobRepository, MemoryJobRepository, scope=SINGLETON)
+    repository_factory.register(RequirementRepository, MemoryRequirementRepository, scope=SINGLETON)
     logger.info("✅ Using Memory repositories (data will reset on restart)")
 
 
 def register_mysql_repositories(app: FastAPI):
-    """Register MySQL repositories (data persists in MySQL database)."""
+    """Register MySQL repositories (data persists in MySQL database).
+
+    A new repository is created for every request, on the request's session.
+    """
     from repository_factory import repository_factory
     from core.ports.repositories.candidate_repository import CandidateRepository
     from core.ports.repositories.job_repository import JobRepository
@@ -55,6 +75,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
     # Register repositories - Production setup with MySQL
@@ -68,6 +89,51 @@ def create_app() -> FastAPI:
         await init_db()
         logger.info("✅ Database tables initialized")
 
+        # Repositories outside requests come from the factory too, each
+        # on its own session
+        from infrastructure.db.database import AsyncSessionLocal
+        from repository_factory import repository_factory
+        from core.ports.repositories.candidate_repository import CandidateRepository
+        from core.ports.repositories.job_repository import JobRepository
+
+        @asynccontextmanager
+        async def job_repository_scope():
+            async with AsyncSessionLocal() as session:
+                yield repository_factory.get(JobRepository, session=session)
+
+        # Loads the saved job index and keeps it in step with jobs written
+        # by other processes; matching scores from the database until then
+        job_index_sync.start(job_repository_scope)
+
+        @asynccontextmanager
+        async def candidate_repository_scope():
+            async with AsyncSessionLocal() as session:
+                yield repository_factory.get(CandidateRepository, session=session)
+
+        if config.EMBEDDING_WORKER_ENABLED:
+            embedding_worker.start(job_repository_scope)
+            candidate_embedding_worker.start(candidate_repository_scope)
+
+        # Load and warm the embedding model once per process, in the
+        # background so the app can report readiness while it loads.
+        model_registry.default_model = config.EMBEDDING_MODEL
+        model_registry.embedding_cache = embedding_cache
+        model_registry.backend_factory = create_configured_backend
+        if config.EMBEDDING_WARMUP:
+            app.state.model_warmup = asyncio.create_task(
+                asyncio.to_thread(model_registry.warm_up, [config.EMBEDDING_MODEL])
+            )
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Persist the job index for a fast restart."""
+        await embedding_worker.stop()
+        await candidate_embedding_worker.stop()
+        await job_index_sync.stop()
+        job_index_sync.save()
+        await embedding_encoder.close()
+        embedding_cache.close()
+
     # Include routers
     app.include_router(candidates.router, prefix=config.API_PREFIX)
     app.include_router(jobs.router, prefix=config.API_PREFIX)
@@ -80,7 +146,32 @@ def create_app() -> FastAPI:
 
     @app.get("/healthz")
     async def health_check():
-        return {"status": "healthy"}
+        ready = not config.EMBEDDING_WARMUP or model_registry.is_ready(
+            config.EMBEDDING_MODEL
+        )
+        return JSONResponse(
+            status_code=200 if ready else 503,
+            content={
+                "status": "healthy" if ready else "starting",
+                "ready": ready,
+                "models": model_registry.status(),
+            },
+        )
+
+    @app.get("/metrics")
+    async def metrics():
+        from infrastructure.db.database import pool_stats
+
+        return {
+            "db_pool": pool_stats(),
+            "job_index": job_index.stats(),
+            "job_index_sync": job_index_sync.stats(),
+            "match_cache": match_cache.stats(),
+            "embedding_cache": embedding_cache.stats(),
+            "embedding_encoder": embedding_encoder.stats(),
+            "embedding_worker": embedding_worker.stats(),
+            "candidate_embedding_worker": candidate_embedding_worker.stats(),
+        }
 
     return app
 
@@ -1 +1,4 @@
 # Routes package
+
+# Response header carrying the cursor of the next page of a listing
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
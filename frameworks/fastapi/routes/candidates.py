@@ -1,9 +1,11 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from core.domain.candidate import Candidate
+from core.ports.repositories.pagination import InvalidCursorError
 from core.use_cases.candidate_management import CandidateManagement
 from frameworks.fastapi.dependencies import get_candidate_management
+from frameworks.fastapi.routes import NEXT_CURSOR_HEADER
 from frameworks.fastapi.schemas.candidate import CandidateCreate, CandidateRead, CandidateUpdate
 
 router = APIRouter(
@@ -15,12 +17,30 @@ router = APIRouter(
 
 @router.get("", response_model=List[CandidateRead])
 async def list_candidates(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     candidate_management: CandidateManagement = Depends(get_candidate_management),
 ):
-    """List candidates."""
-    return await candidate_management.list_candidates(skip, limit)
+    """List candidates.
+
+    Pages are ordered by id. The ``X-Next-Cursor`` response header holds
+    the ``cursor`` of the next page and is left out on the last one; a
+    deep page costs the same as the first. ``skip`` still pages by
+    offset, which gets slower the deeper it goes.
+    """
+    if skip and cursor:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor")
+    if skip:
+        return await candidate_management.list_candidates(skip, limit)
+    try:
+        candidates, next_cursor = await candidate_management.list_candidates_page(cursor, limit)
+    except InvalidCursorError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return candidates
 
 
 @router.post("", response_model=CandidateRead, status_code=201)
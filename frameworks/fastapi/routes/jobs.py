@@ -1,10 +1,23 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from typing import Any, AsyncIterator, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import ValidationError
 
+from config import config
 from core.domain.job import Job
+from core.ports.repositories.pagination import InvalidCursorError
 from core.use_cases.job_management import JobManagement    
 from frameworks.fastapi.dependencies import get_job_management 
-from frameworks.fastapi.schemas.job import JobCreate, JobRead, JobUpdate
+from frameworks.fastapi.routes import NEXT_CURSOR_HEADER
+from frameworks.fastapi.schemas.job import (
+    BulkJobError,
+    BulkJobResponse,
+    JobCreate,
+    JobRead,
+    JobUpdate,
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 router = APIRouter(
     prefix="/jobs",
@@ -15,12 +28,30 @@ router = APIRouter(
 
 @router.get("", response_model=List[JobRead])
 async def list_jobs(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     job_management: JobManagement = Depends(get_job_management),
 ):
-    """List jobs."""
-    return await job_management.list_jobs(skip, limit)
+    """List jobs.
+
+    Pages are ordered by id. The ``X-Next-Cursor`` response header holds
+    the ``cursor`` of the next page and is left out on the last one; a
+    deep page costs the same as the first. ``skip`` still pages by
+    offset, which gets slower the deeper it goes.
+    """
+    if skip and cursor:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor")
+    if skip:
+        return await job_management.list_jobs(skip, limit)
+    try:
+        jobs, next_cursor = await job_management.list_jobs_page(cursor, limit)
+    except InvalidCursorError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return jobs
 
 
 @router.post("", response_model=JobRead, status_code=201)
@@ -33,6 +64,101 @@ async def create_job(
     return await job_management.create_job(job)
 
 
+@router.post("/bulk", response_model=BulkJobResponse)
+async def create_jobs_bulk(
+    request: Request,
+    job_management: JobManagement = Depends(get_job_management),
+):
+    """Create many jobs from a JSON array, or an NDJSON stream (one job per line).
+
+    Jobs are validated and inserted in chunks of JOB_BULK_CHUNK_SIZE, one
+    transaction per chunk; NDJSON is processed while it streams in. Jobs
+    that are invalid or rejected by the database are reported in
+    ``errors`` by position and don't stop the others.
+    """
+    if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+        items = _ndjson_items(request)
+    else:
+        try:
+            data = json.loads(await request.body())
+        except ValueError:
+            data = None
+        if not isinstance(data, list):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Expected a JSON array of jobs, or {NDJSON_MEDIA_TYPE}",
+            )
+        items = _array_items(data)
+
+    response = BulkJobResponse(created=0, failed=0, ids=[], errors=[])
+    chunk: List[Tuple[int, Job]] = []
+    async for index, item in items:
+        try:
+            job_data = (
+                JobCreate.model_validate_json(item)
+                if isinstance(item, bytes)
+                else JobCreate.model_validate(item)
+            )
+        except ValidationError as error:
+            response.errors.append(
+                BulkJobError(index=index, error=_validation_message(error))
+            )
+            continue
+        chunk.append((index, Job(**job_data.model_dump())))
+        if len(chunk) >= config.JOB_BULK_CHUNK_SIZE:
+            await _create_chunk(job_management, chunk, response)
+            chunk = []
+    if chunk:
+        await _create_chunk(job_management, chunk, response)
+
+    response.errors.sort(key=lambda error: error.index)
+    response.failed = len(response.errors)
+    return response
+
+
+async def _create_chunk(
+    job_management: JobManagement,
+    chunk: List[Tuple[int, Job]],
+    response: BulkJobResponse,
+) -> None:
+    """Create one chunk of validated jobs and record the outcome."""
+    _, errors = await job_management.create_jobs([job for _, job in chunk])
+    for position, (index, job) in enumerate(chunk):
+        if position in errors:
+            response.errors.append(BulkJobError(index=index, error=errors[position]))
+        else:
+            response.ids.append(job.id)
+    response.created += len(chunk) - len(errors)
+
+
+async def _array_items(data: List[Any]) -> AsyncIterator[Tuple[int, Any]]:
+    for index, item in enumerate(data):
+        yield index, item
+
+
+async def _ndjson_items(request: Request) -> AsyncIterator[Tuple[int, bytes]]:
+    """(index, line) for each non-empty line, as the body streams in."""
+    index = 0
+    buffer = b""
+    async for data in request.stream():
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield index, line
+                index += 1
+    if buffer.strip():
+        yield index, buffer
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Compact description of a job's validation errors."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'job'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
 @router.get("/{job_id}", response_model=JobRead)
 async def get_job(
     job_id: str, 
@@ -81,10 +207,14 @@ async def patch_job(
         
         # Update only provided fields
         if 'embedding' in update_data:
-            existing_job.embedding = update_data['embedding']
-        
-        # Save updated job
-        updated_job = await job_management.update_job(job_id, existing_job)
+            updated_job = await job_management.set_job_embedding(
+                job_id,
+                existing_job,
+                update_data['embedding'],
+                update_data.get('embedding_model'),
+            )
+        else:
+            updated_job = await job_management.update_job(job_id, existing_job)
         
         return {
                 "id": updated_job.id if updated_job else None,
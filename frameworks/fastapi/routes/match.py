@@ -1,11 +1,49 @@
-from typing import List
+import json
+from typing import Any, Dict, Iterator, List
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
 from core.use_cases.match_jobs import MatchJobs 
 from core.use_cases.candidate_management import CandidateManagement
-from frameworks.fastapi.dependencies import get_match_jobs, get_candidate_management
-from frameworks.fastapi.schemas.match import MatchRequest, MatchResponse, MatchResult
-from frameworks.fastapi.schemas.job import JobRead
+from frameworks.fastapi.dependencies import (
+    get_candidate_management,
+    get_fallback_match_jobs,
+    get_match_jobs,
+)
+from config import config
+from frameworks.fastapi.schemas.match import (
+    BatchMatchRequest,
+    BatchMatchResponse,
+    CandidateMatches,
+    MatchRequest,
+    MatchResponse,
+    MatchResult,
+)
+from frameworks.fastapi.schemas.job import JobRead, serialize_job
+
+def _to_match_results(match_results: List[Dict[str, Any]]) -> List[MatchResult]:
+    """Convert use case match dicts to response schemas."""
+    return [
+        MatchResult(
+            job=JobRead.from_orm(result["job"]),
+            score=result["score"],
+            match_reasons=result["match_reasons"],
+        )
+        for result in match_results
+    ]
+
+
+def _ndjson_lines(match_results: List[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize ranked matches one JSON line at a time."""
+    for result in match_results:
+        yield json.dumps(
+            {
+                "job": serialize_job(result["job"]),
+                "score": result["score"],
+                "match_reasons": result["match_reasons"],
+            }
+        ) + "\n"
+
 
 router = APIRouter(
     prefix="/match",
@@ -27,26 +65,89 @@ async def match_jobs(
         raise HTTPException(status_code=404, detail="Candidate not found")
 
     # Match jobs
-    match_results = await match_jobs_use_case.match_jobs_for_profile(candidate)
+    match_results = await match_jobs_use_case.match_jobs_for_profile(
+        candidate,
+        limit=match_request.limit,
+        n_probe=match_request.n_probe,
+        filters=match_request.to_filter(),
+    )
 
     # Convert domain entities to response schemas
-    matches = []
-    for result in match_results:
-        matches.append(
-            MatchResult(
-                job=JobRead.from_orm(result["job"]),
-                score=result["score"],
-                match_reasons=result["match_reasons"],
-            )
+    return MatchResponse(matches=_to_match_results(match_results))
+
+
+@router.post("/stream")
+async def stream_match_jobs(
+    match_request: MatchRequest,
+    match_jobs_use_case: MatchJobs = Depends(get_match_jobs),
+    candidate_management: CandidateManagement = Depends(get_candidate_management),
+):
+    """Match jobs for a candidate, streaming ranked results as NDJSON.
+
+    Each line is one MatchResult object, best match first. Suited to large
+    ``limit`` values, since results are sent as they are serialized.
+    """
+    # Get candidate
+    candidate = await candidate_management.get_candidate(match_request.candidate_id)
+    if candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    # Match jobs
+    match_results = await match_jobs_use_case.match_jobs_for_profile(
+        candidate,
+        limit=match_request.limit,
+        n_probe=match_request.n_probe,
+        filters=match_request.to_filter(),
+    )
+
+    return StreamingResponse(
+        _ndjson_lines(match_results), media_type="application/x-ndjson"
+    )
+
+
+@router.post("/batch", response_model=BatchMatchResponse)
+async def batch_match_jobs(
+    batch_request: BatchMatchRequest,
+    match_jobs_use_case: MatchJobs = Depends(get_match_jobs),
+    candidate_management: CandidateManagement = Depends(get_candidate_management),
+):
+    """Match jobs for many candidates, loading and scoring the job corpus once."""
+    # Get candidates, in request order
+    found = {
+        candidate.id: candidate
+        for candidate in await candidate_management.get_candidates(
+            batch_request.candidate_ids
         )
+    }
+    candidates = [
+        found[id] for id in dict.fromkeys(batch_request.candidate_ids) if id in found
+    ]
+    not_found = [id for id in batch_request.candidate_ids if id not in found]
 
-    return MatchResponse(matches=matches)
+    # Match jobs for all candidates at once
+    match_results = await match_jobs_use_case.match_jobs_for_profiles(
+        candidates,
+        limit=batch_request.limit,
+        filters=batch_request.to_filter(),
+        max_block_bytes=config.MATCH_BATCH_BLOCK_BYTES,
+    )
+
+    return BatchMatchResponse(
+        results=[
+            CandidateMatches(
+                candidate_id=candidate.id,
+                matches=_to_match_results(match_results[candidate.id]),
+            )
+            for candidate in candidates
+        ],
+        not_found=not_found,
+    )
 
 
 @router.post("/fallback", response_model=MatchResponse)
 async def fallback_match(
     match_request: MatchRequest,
-    match_jobs_use_case: MatchJobs = Depends(get_match_jobs),
+    match_jobs_use_case: MatchJobs = Depends(get_fallback_match_jobs),
     candidate_management: CandidateManagement = Depends(get_candidate_management),
 ):
     """Fallback match jobs for a candidate without embeddings."""
@@ -56,17 +157,9 @@ async def fallback_match(
         raise HTTPException(status_code=404, detail="Candidate not found")
 
     # Match jobs using fallback
-    match_results = await match_jobs_use_case.fallback_match(candidate)
+    match_results = await match_jobs_use_case.fallback_match(
+        candidate, limit=match_request.limit
+    )
 
     # Convert domain entities to response schemas
-    matches = []
-    for result in match_results:
-        matches.append(
-            MatchResult(
-                job=JobRead.from_orm(result["job"]),
-                score=result["score"],
-                match_reasons=result["match_reasons"],
-            )
-        )
-
-    return MatchResponse(matches=matches)
\ No newline at end of file
+    return MatchResponse(matches=_to_match_results(match_results))
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import date
 from pydantic import BaseModel
 
@@ -35,4 +35,28 @@ class JobRead(JobBase):
     id: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class BulkJobError(BaseModel):
+    index: int  # Position in the array, or non-empty line number from 0, of the job
+    error: str
+
+
+class BulkJobResponse(BaseModel):
+    created: int
+    failed: int
+    ids: List[str]  # Ids of the created jobs, in input order
+    errors: List[BulkJobError]
+
+
+def serialize_job(job) -> Dict[str, Any]:
+    """JSON-ready dict with JobRead's fields, without building a model.
+
+    Used where many jobs are written out and Pydantic validation per job
+    would dominate, e.g. streamed match results.
+    """
+    data = {field: getattr(job, field) for field in JobRead.model_fields}
+    if data["application_end_date"] is not None:
+        data["application_end_date"] = data["application_end_date"].isoformat()
+    return data
\ No newline at end of file
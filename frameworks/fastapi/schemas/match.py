@@ -1,10 +1,41 @@
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from core.domain.job_filter import JobFilter
 from frameworks.fastapi.schemas.job import JobRead
 
+# Upper bound on the matches a request may ask for
+MAX_MATCH_LIMIT = 1000
 
-class MatchRequest(BaseModel):
+
+class MatchFilters(BaseModel):
+    """Optional filters, applied before semantic scoring."""
+
+    category: Optional[str] = None
+    location: Optional[str] = None
+    company: Optional[str] = None
+    min_salary: Optional[float] = None
+    experience_level: Optional[str] = None
+
+    def to_filter(self) -> JobFilter:
+        """Build the domain filter from the request fields."""
+        return JobFilter(
+            category=self.category,
+            location=self.location,
+            company=self.company,
+            min_salary=self.min_salary,
+            experience_level=self.experience_level,
+        )
+
+
+class MatchRequest(MatchFilters):
     candidate_id: str
+    limit: int = Field(10, ge=1, le=MAX_MATCH_LIMIT)
+    n_probe: Optional[int] = None  # Job index lists to search; higher = better recall, slower
+
+
+class BatchMatchRequest(MatchFilters):
+    candidate_ids: List[str]
+    limit: int = Field(10, ge=1, le=MAX_MATCH_LIMIT)
 
 
 class MatchResult(BaseModel):
@@ -14,4 +45,14 @@ class MatchResult(BaseModel):
 
 
 class MatchResponse(BaseModel):
-    matches: List[MatchResult]
\ No newline at end of file
+    matches: List[MatchResult]
+
+
+class CandidateMatches(BaseModel):
+    candidate_id: str
+    matches: List[MatchResult]
+
+
+class BatchMatchResponse(BaseModel):
+    results: List[CandidateMatches]
+    not_found: List[str] = []
@@ -1,14 +1,19 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 from config import config
+from infrastructure.db.pool import InstrumentedPool
 
-# Create async engine
+# The application's one async engine; every session shares its pool
 engine = create_async_engine(
     config.DATABASE_URL,
     echo=config.ENVIRONMENT == "development",
     future=True,
+    poolclass=InstrumentedPool,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_timeout=config.DB_POOL_TIMEOUT,
+    pool_recycle=config.DB_POOL_RECYCLE,
     pool_pre_ping=True,
-    pool_recycle=3600
 )
 
 # Create async session factory
@@ -32,4 +37,9 @@ async def init_db():
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get async database session."""
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Connection pool usage and checkout wait times, for metrics."""
+    return engine.sync_engine.pool.stats()
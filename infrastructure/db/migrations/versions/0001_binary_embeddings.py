@@ -0,0 +1,113 @@
+"""Store embeddings as binary float32 instead of JSON
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("jobs", "candidates")
+BATCH_SIZE = 1000
+# Rows embedded before this migration all came from the default model
+MODEL_TAG = "all-MiniLM-L6-v2"
+
+
+def _convert(table_name: str, source: str, target: str, encode) -> None:
+    """Copy every non-null embedding from one column to another, in batches."""
+    bind = op.get_bind()
+    table = sa.table(
+        table_name,
+        sa.column("id", sa.String),
+        sa.column(source),
+        sa.column(target),
+        sa.column("embedding_dim", sa.Integer),
+        sa.column("embedding_model", sa.String),
+    )
+    last_id = ""
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, table.c[source])
+            .where(table.c[source].isnot(None), table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        params = []
+        for row in rows:
+            value, dim = encode(row[1])
+            params.append({"_id": row.id, "_value": value, "_dim": dim})
+        bind.execute(
+            table.update()
+            .where(table.c.id == sa.bindparam("_id"))
+            .values({target: sa.bindparam("_value"), "embedding_dim": sa.bindparam("_dim")}),
+            params,
+        )
+        last_id = rows[-1].id
+
+
+def _to_binary(value):
+    values = json.loads(value) if isinstance(value, (str, bytes)) else value
+    vector = np.asarray(values, dtype="<f4")
+    return vector.tobytes(), len(vector)
+
+
+def _to_json(value):
+    vector = np.frombuffer(value, dtype="<f4")
+    return json.dumps(vector.tolist()), len(vector)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in TABLES:
+        op.add_column(table_name, sa.Column("embedding_blob", sa.LargeBinary(), nullable=True))
+        op.add_column(table_name, sa.Column("embedding_dim", sa.Integer(), nullable=True))
+        op.add_column(table_name, sa.Column("embedding_model", sa.String(100), nullable=True))
+
+        _convert(table_name, "embedding", "embedding_blob", _to_binary)
+        op.execute(
+            sa.text(
+                f"UPDATE {table_name} SET embedding_model = :model "
+                "WHERE embedding_blob IS NOT NULL"
+            ).bindparams(model=MODEL_TAG)
+        )
+
+        op.drop_column(table_name, "embedding")
+        op.alter_column(
+            table_name,
+            "embedding_blob",
+            new_column_name="embedding",
+            existing_type=sa.LargeBinary(),
+            existing_nullable=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in TABLES:
+        op.add_column(table_name, sa.Column("embedding_json", sa.JSON(), nullable=True))
+
+        _convert(table_name, "embedding", "embedding_json", _to_json)
+
+        op.drop_column(table_name, "embedding")
+        op.drop_column(table_name, "embedding_dim")
+        op.drop_column(table_name, "embedding_model")
+        op.alter_column(
+            table_name,
+            "embedding_json",
+            new_column_name="embedding",
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+        )
@@ -0,0 +1,66 @@
+"""Keep normalized keyword tokens with each job
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from core.services.keyword_matcher import tokenize
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("jobs", sa.Column("keywords", sa.Text(), nullable=True))
+
+    # Backfill keywords for existing jobs, in batches
+    bind = op.get_bind()
+    jobs = sa.table(
+        "jobs",
+        sa.column("id", sa.String),
+        sa.column("title", sa.String),
+        sa.column("description", sa.Text),
+        sa.column("keywords", sa.Text),
+    )
+    last_id = ""
+    while True:
+        rows = bind.execute(
+            sa.select(jobs.c.id, jobs.c.title, jobs.c.description)
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        bind.execute(
+            jobs.update()
+            .where(jobs.c.id == sa.bindparam("_id"))
+            .values(keywords=sa.bindparam("_keywords")),
+            [
+                {
+                    "_id": row.id,
+                    "_keywords": " ".join(
+                        sorted(set(tokenize(f"{row.title} {row.description}")))
+                    ),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("jobs", "keywords")
@@ -0,0 +1,46 @@
+"""Track which job embeddings need to be recomputed
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "jobs", sa.Column("embedding_fingerprint", sa.String(length=64), nullable=True)
+    )
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "embedding_stale", sa.Boolean(), nullable=False, server_default=sa.false()
+        ),
+    )
+    op.create_index("ix_jobs_embedding_stale", "jobs", ["embedding_stale"])
+
+    # Jobs without an embedding are picked up by the embedding worker
+    jobs = sa.table(
+        "jobs", sa.column("embedding", sa.LargeBinary), sa.column("embedding_stale", sa.Boolean)
+    )
+    op.execute(
+        jobs.update().where(jobs.c.embedding.is_(None)).values(embedding_stale=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_jobs_embedding_stale", table_name="jobs")
+    op.drop_column("jobs", "embedding_stale")
+    op.drop_column("jobs", "embedding_fingerprint")
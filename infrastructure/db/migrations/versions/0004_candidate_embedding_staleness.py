@@ -0,0 +1,44 @@
+"""Track which candidate embeddings need to be recomputed
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "candidates",
+        sa.Column("embedding_fingerprint", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "candidates",
+        sa.Column(
+            "embedding_stale", sa.Boolean(), nullable=False, server_default=sa.false()
+        ),
+    )
+    op.create_index("ix_candidates_embedding_stale", "candidates", ["embedding_stale"])
+
+    # Existing embeddings may predate profile edits, so every candidate is
+    # (re)embedded once by the embedding worker
+    candidates = sa.table("candidates", sa.column("embedding_stale", sa.Boolean))
+    op.execute(candidates.update().values(embedding_stale=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_candidates_embedding_stale", table_name="candidates")
+    op.drop_column("candidates", "embedding_stale")
+    op.drop_column("candidates", "embedding_fingerprint")
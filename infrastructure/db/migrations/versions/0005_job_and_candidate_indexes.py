@@ -0,0 +1,79 @@
+"""Index the columns the repositories filter on
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Open-ended jobs get 9999-12-31, so availability is one range condition
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "available_until",
+            sa.Date(),
+            sa.Computed("coalesce(application_end_date, '9999-12-31')", persisted=True),
+        ),
+    )
+    # The hot requirements keys, lower-cased for case-insensitive filters
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "experience_level",
+            sa.String(length=100),
+            sa.Computed(
+                "lower(substr(requirements ->> '$.experience', 1, 100))", persisted=True
+            ),
+        ),
+    )
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "work_type",
+            sa.String(length=100),
+            sa.Computed(
+                "lower(substr(requirements ->> '$.work_type', 1, 100))", persisted=True
+            ),
+        ),
+    )
+
+    op.create_index("ix_jobs_available_until", "jobs", ["available_until"])
+    op.create_index(
+        "ix_jobs_category_available_until", "jobs", ["category", "available_until"]
+    )
+    op.create_index(
+        "ix_jobs_experience_level_available_until",
+        "jobs",
+        ["experience_level", "available_until"],
+    )
+    op.create_index(
+        "ix_jobs_work_type_available_until", "jobs", ["work_type", "available_until"]
+    )
+    op.create_index("ix_jobs_company", "jobs", ["company"])
+    op.create_index("ix_candidates_location", "candidates", ["location"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_candidates_location", table_name="candidates")
+    op.drop_index("ix_jobs_company", table_name="jobs")
+    op.drop_index("ix_jobs_work_type_available_until", table_name="jobs")
+    op.drop_index("ix_jobs_experience_level_available_until", table_name="jobs")
+    op.drop_index("ix_jobs_category_available_until", table_name="jobs")
+    op.drop_index("ix_jobs_available_until", table_name="jobs")
+    op.drop_column("jobs", "work_type")
+    op.drop_column("jobs", "experience_level")
+    op.drop_column("jobs", "available_until")
@@ -0,0 +1,38 @@
+"""Record when each job was last written
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing jobs stay NULL: API processes read them all when they start
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "updated_at",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_jobs_updated_at", "jobs", ["updated_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_jobs_updated_at", table_name="jobs")
+    op.drop_column("jobs", "updated_at")
@@ -1,14 +1,71 @@
-from datetime import date
-from typing import Dict, List, Optional
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional
 import json
 
-from sqlalchemy import Column, String, Float, Integer, JSON, ForeignKey, Date, Text
+from sqlalchemy import (
+    and_,
+    or_,
+    Boolean,
+    Column,
+    Computed,
+    String,
+    Float,
+    Integer,
+    JSON,
+    ForeignKey,
+    Date,
+    DateTime,
+    Index,
+    Text,
+)
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
+from infrastructure.db.types import Float32Vector
+
 Base = declarative_base()
 
 
+def embedding_metadata(
+    embedding: Optional[List[float]], model_name: Optional[str]
+) -> Dict[str, Any]:
+    """Dimension and model tag stored next to an embedding.
+
+    ``model_name`` is the name of the backend that produced the embedding,
+    so vectors of different backends can be told apart.
+    """
+    if embedding is None:
+        return {"embedding_dim": None, "embedding_model": None}
+    return {"embedding_dim": len(embedding), "embedding_model": model_name}
+
+
+def incompatible_embedding(model_class, model_name: str, dimension: int):
+    """SQL condition for rows whose embedding another backend produced.
+
+    The SQL form of ``is_compatible_embedding``: tagged with another
+    backend, or untagged with another dimension.
+    """
+    return and_(
+        model_class.embedding.isnot(None),
+        or_(
+            and_(
+                model_class.embedding_model.isnot(None),
+                model_class.embedding_model != model_name,
+            ),
+            and_(
+                model_class.embedding_model.is_(None),
+                model_class.embedding_dim != dimension,
+            ),
+        ),
+    )
+
+
+def utc_now() -> datetime:
+    """Current UTC time as the naive datetime the database stores."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class CandidateModel(Base):
     """SQLAlchemy model for Candidate."""
 
@@ -18,11 +75,15 @@ class CandidateModel(Base):
     name = Column(String(255), nullable=False, default="")
     email = Column(String(255), nullable=False, default="")
     education = Column(String(100), nullable=True)
-    location = Column(String(100), nullable=True)
+    location = Column(String(100), nullable=True, index=True)
     skills = Column(JSON, nullable=False, default=list)
     experience = Column(String(100), nullable=True)
     answers = Column(JSON, nullable=False, default=dict)
-    embedding = Column(JSON, nullable=True)  # ← NY RAD!
+    embedding = Column(Float32Vector, nullable=True)
+    embedding_dim = Column(Integer, nullable=True)
+    embedding_model = Column(String(100), nullable=True)
+    embedding_fingerprint = Column(String(64), nullable=True)
+    embedding_stale = Column(Boolean, nullable=False, default=False, index=True)
 
     def to_domain(self):
         """Convert to domain model."""
@@ -37,7 +98,10 @@ class CandidateModel(Base):
             skills=self.skills,
             experience=self.experience,
             answers=self.answers,
-            embedding=self.embedding,  # ← NY RAD!
+            embedding=self.embedding,
+            embedding_fingerprint=self.embedding_fingerprint,
+            embedding_stale=self.embedding_stale,
+            embedding_model=self.embedding_model,
         )
 
     @classmethod
@@ -52,7 +116,10 @@ class CandidateModel(Base):
             skills=candidate.skills,
             experience=candidate.experience,
             answers=candidate.answers,
-            embedding=candidate.embedding,  # ← NY RAD!
+            embedding=candidate.embedding,
+            **embedding_metadata(candidate.embedding, candidate.embedding_model),
+            embedding_fingerprint=candidate.embedding_fingerprint,
+            embedding_stale=candidate.embedding_stale,
         )
 
 
@@ -71,7 +138,43 @@ class JobModel(Base):
     company = Column(String(255), nullable=True)
     category = Column(String(100), nullable=True)
     location = Column(String(100), nullable=True)
-    embedding = Column(JSON, nullable=True)  # ← NY RAD!
+    embedding = Column(Float32Vector, nullable=True)
+    embedding_dim = Column(Integer, nullable=True)
+    embedding_model = Column(String(100), nullable=True)
+    keywords = Column(Text, nullable=True)  # Space-separated normalized tokens
+    embedding_fingerprint = Column(String(64), nullable=True)
+    embedding_stale = Column(Boolean, nullable=False, default=False, index=True)
+    # Set on every insert and update (with microseconds on MySQL), so other
+    # processes can find the jobs written since they last looked
+    updated_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=True,
+        default=utc_now,
+        onupdate=utc_now,
+    )
+
+    # Generated by the database, so availability and the hot requirements
+    # keys can be filtered with plain comparisons on indexed columns
+    available_until = Column(
+        Date, Computed("coalesce(application_end_date, '9999-12-31')", persisted=True)
+    )
+    experience_level = Column(
+        String(100),
+        Computed("lower(substr(requirements ->> '$.experience', 1, 100))", persisted=True),
+    )
+    work_type = Column(
+        String(100),
+        Computed("lower(substr(requirements ->> '$.work_type', 1, 100))", persisted=True),
+    )
+
+    __table_args__ = (
+        Index("ix_jobs_available_until", "available_until"),
+        Index("ix_jobs_category_available_until", "category", "available_until"),
+        Index("ix_jobs_experience_level_available_until", "experience_level", "available_until"),
+        Index("ix_jobs_work_type_available_until", "work_type", "available_until"),
+        Index("ix_jobs_company", "company"),
+        Index("ix_jobs_updated_at", "updated_at"),
+    )
 
     def to_domain(self):
         """Convert to domain model."""
@@ -88,12 +191,18 @@ class JobModel(Base):
             company=self.company,
             category=self.category,
             location=self.location,
-            embedding=self.embedding,  # ← NY RAD!
+            embedding=self.embedding,
+            keywords=frozenset(self.keywords.split()) if self.keywords else None,
+            embedding_fingerprint=self.embedding_fingerprint,
+            embedding_stale=self.embedding_stale,
+            embedding_model=self.embedding_model,
         )
 
     @classmethod
     def from_domain(cls, job):
         """Create from domain model."""
+        from core.services.keyword_matcher import job_keywords
+
         return cls(
             id=job.id,
             title=job.title,
@@ -105,7 +214,11 @@ class JobModel(Base):
             company=job.company,
             category=job.category,
             location=job.location,
-            embedding=job.embedding,  # ← NY RAD!
+            embedding=job.embedding,
+            **embedding_metadata(job.embedding, job.embedding_model),
+            keywords=" ".join(sorted(job_keywords(job))),
+            embedding_fingerprint=job.embedding_fingerprint,
+            embedding_stale=job.embedding_stale,
         )
 
 
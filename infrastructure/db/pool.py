@@ -0,0 +1,58 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait times.
+
+    The wait of a checkout covers queueing for a free connection, opening
+    a new one and the pre-ping, i.e. everything a request waits for before
+    it can run a query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool usage and checkout wait counters, for metrics."""
+        capacity = self.size() + max(0, self._max_overflow)
+        checked_out = self.checkedout()
+        with self._stats_lock:
+            return {
+                "size": self.size(),
+                "max_overflow": self._max_overflow,
+                "checked_out": checked_out,
+                "idle": self.checkedin(),
+                "overflow": max(0, self.overflow()),
+                "utilization": checked_out / capacity if capacity else 0.0,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": (
+                    self.wait_seconds / self.checkouts * 1000 if self.checkouts else 0.0
+                ),
+                "max_wait_ms": self.max_wait_seconds * 1000,
+            }
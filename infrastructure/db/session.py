@@ -1,19 +1,9 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config import config
+from infrastructure.db.database import AsyncSessionLocal
 
-# Create engine
-engine = create_async_engine(
-    config.DATABASE_URL,
-    echo=config.ENVIRONMENT == "development",
-    future=True,
-)
-
-# Create session factory
-async_session_factory = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
-)
+# Sessions come from the application's single engine and connection pool
+async_session_factory = AsyncSessionLocal
 
 
 async def get_session() -> AsyncSession:
@@ -0,0 +1,31 @@
+from typing import Optional, Sequence
+
+import numpy as np
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+# Embeddings are stored as raw little-endian float32, 4 bytes per dimension
+EMBEDDING_DTYPE = np.dtype("<f4")
+
+
+class Float32Vector(TypeDecorator):
+    """Embedding column stored as a raw little-endian float32 BLOB.
+
+    Reads decode zero-copy with ``numpy.frombuffer``, so the returned
+    array is read-only and shares memory with the fetched bytes.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[Sequence[float]], dialect
+    ) -> Optional[bytes]:
+        if value is None:
+            return None
+        return np.asarray(value, dtype=EMBEDDING_DTYPE).tobytes()
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype=EMBEDDING_DTYPE)
@@ -9,6 +9,11 @@ from core.ports.repositories.requirement_repository import RequirementRepository
 T = TypeVar("T")
 R = TypeVar("R", bound=BaseRepository)
 
+# Repository lifetimes
+REQUEST = "request"  # A new instance per get, bound to e.g. the request's session
+SINGLETON = "singleton"  # One instance shared by all requests, e.g. in-memory storage
+SCOPES = (REQUEST, SINGLETON)
+
 
 class RepositoryFactory:
     """Factory for creating repository instances based on configuration."""
@@ -29,17 +34,31 @@ class RepositoryFactory:
             JobRepository: {},
             RequirementRepository: {},
         }
+        self._scopes: Dict[Type[R], Dict[str, str]] = {
+            CandidateRepository: {},
+            JobRepository: {},
+            RequirementRepository: {},
+        }
 
     def register(
         self,
         interface_type: Type[R],
         implementation_type_or_factory: Type[R] | Callable[..., R],
         name: str = "default",
+        scope: str = REQUEST,
     ) -> None:
-        """Register an implementation for a repository interface."""
+        """Register an implementation for a repository interface.
+
+        ``scope`` is REQUEST (a new instance on every ``get``) or SINGLETON
+        (one shared instance).
+        """
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown repository scope '{scope}'")
         if interface_type not in self._repositories:
             self._repositories[interface_type] = {}
             self._factories[interface_type] = {}
+        self._scopes.setdefault(interface_type, {})[name] = scope
+        self._instances.get(interface_type, {}).pop(name, None)
 
         if callable(implementation_type_or_factory) and not isinstance(
             implementation_type_or_factory, type
@@ -51,13 +70,22 @@ class RepositoryFactory:
             self._repositories[interface_type][name] = implementation_type_or_factory
 
     def get(self, interface_type: Type[R], name: str = "default", **kwargs) -> R:
-        """Get an instance of a repository."""
-        # Check if we already have an instance
-        if (
-            interface_type in self._instances
-            and name in self._instances[interface_type]
-        ):
-            return self._instances[interface_type][name]
+        """Get an instance of a repository.
+
+        Request-scoped repositories are created on every call, with
+        ``kwargs`` (such as the request's session). Singletons are created
+        once, without ``kwargs`` since they outlive any one request, and
+        then reused.
+        """
+        scope = self._scopes.get(interface_type, {}).get(name, REQUEST)
+        if scope == SINGLETON:
+            # Check if we already have an instance
+            if (
+                interface_type in self._instances
+                and name in self._instances[interface_type]
+            ):
+                return self._instances[interface_type][name]
+            kwargs = {}
 
         # Check if we have a registered factory
         if (
@@ -66,12 +94,8 @@ class RepositoryFactory:
         ):
             factory = self._factories[interface_type][name]
             instance = factory(**kwargs)
-
-            # Save the instance for reuse
-            if interface_type not in self._instances:
-                self._instances[interface_type] = {}
-            self._instances[interface_type][name] = instance
-
+            if scope == SINGLETON:
+                self._save_instance(interface_type, name, instance)
             return instance
 
         # Check if we have a registered implementation
@@ -86,14 +110,16 @@ class RepositoryFactory:
         # Create a new instance
         implementation = self._repositories[interface_type][name]
         instance = implementation(**kwargs)
+        if scope == SINGLETON:
+            self._save_instance(interface_type, name, instance)
+        return instance
 
-        # Save the instance for reuse
+    def _save_instance(self, interface_type: Type[R], name: str, instance: R) -> None:
+        """Save a singleton instance for reuse."""
         if interface_type not in self._instances:
             self._instances[interface_type] = {}
         self._instances[interface_type][name] = instance
 
-        return instance
-
     def get_factory(
         self, interface_type: Type[R], name: str = "default"
     ) -> Callable[..., R]:
@@ -0,0 +1,152 @@
+"""
+Benchmark the heap size and load time of job entities.
+
+Builds N jobs from database-like rows (text fields plus a float32
+embedding BLOB) the way the repositories do, comparing:
+
+- a plain class with a per-instance __dict__ and the embedding as a list
+  of Python floats (how Job used to be held),
+- the same plain class with a float32 array embedding,
+- the slotted Job entity with its float32 array embedding.
+
+Heap size counts the objects each entity owns: the instance, its
+__dict__ and its embedding (list and float objects, or array header and
+data). Field values shared by all variants are left out. Runs without a
+database.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.abspath('.'))
+
+import numpy as np
+
+from core.domain.job import Job
+
+
+class PlainJob:
+    """The job entity as a plain class, for comparison."""
+
+    def __init__(self, id=None, title="", description="", responsibilities=None,
+                 requirements=None, salary=None, application_end_date=None,
+                 company=None, category=None, location=None, embedding=None,
+                 keywords=None, embedding_fingerprint=None, embedding_stale=False):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.responsibilities = responsibilities
+        self.requirements = requirements or {}
+        self.salary = salary
+        self.application_end_date = application_end_date
+        self.company = company
+        self.category = category
+        self.location = location
+        self.embedding = embedding
+        self.keywords = keywords
+        self.embedding_fingerprint = embedding_fingerprint
+        self.embedding_stale = embedding_stale
+
+
+def make_rows(n: int, dim: int, seed: int = 0):
+    """Rows shaped like the jobs table, embeddings as float32 BLOBs."""
+    rng = np.random.default_rng(seed)
+    embeddings = rng.normal(size=(n, dim)).astype("<f4")
+    return [
+        (
+            f"{i:08d}-0000-0000-0000-000000000000",
+            f"Job title {i}",
+            "Job description " * 20,
+            {"education": "Bachelor"},
+            date(2030, 1, 1),
+            "IT",
+            "Stockholm",
+            embeddings[i].tobytes(),
+        )
+        for i in range(n)
+    ]
+
+
+def plain_with_list(row):
+    id, title, description, requirements, end_date, category, location, blob = row
+    return PlainJob(
+        id=id, title=title, description=description, requirements=requirements,
+        application_end_date=end_date, category=category, location=location,
+        embedding=np.frombuffer(blob, dtype="<f4").tolist(),
+    )
+
+
+def plain_with_array(row):
+    id, title, description, requirements, end_date, category, location, blob = row
+    return PlainJob(
+        id=id, title=title, description=description, requirements=requirements,
+        application_end_date=end_date, category=category, location=location,
+        embedding=np.frombuffer(blob, dtype="<f4"),
+    )
+
+
+def slotted(row):
+    id, title, description, requirements, end_date, category, location, blob = row
+    return Job(
+        id=id, title=title, description=description, requirements=requirements,
+        application_end_date=end_date, category=category, location=location,
+        embedding=np.frombuffer(blob, dtype="<f4"),
+    )
+
+
+def entity_bytes(entity) -> int:
+    """Heap bytes owned by one entity."""
+    size = sys.getsizeof(entity)
+    if hasattr(entity, "__dict__"):
+        size += sys.getsizeof(entity.__dict__)
+    embedding = entity.embedding
+    if isinstance(embedding, list):
+        size += sys.getsizeof(embedding) + sum(sys.getsizeof(x) for x in embedding)
+    else:
+        # Arrays decoded from a BLOB don't own their data but keep it alive
+        size += sys.getsizeof(embedding) + (0 if embedding.base is None else embedding.nbytes)
+    return size
+
+
+def measure(build, rows):
+    """Seconds to build the entities, and the heap bytes they own."""
+    gc.collect()
+    gc.disable()  # Keep collections of earlier runs' garbage out of the timing
+    start = time.perf_counter()
+    entities = [build(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    size = sum(entity_bytes(entity) for entity in entities)
+    del entities
+    return elapsed, size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=384)
+    args = parser.parse_args()
+
+    print(f"📊 Building {args.jobs} rows ({args.dim} dims)...")
+    rows = make_rows(args.jobs, args.dim)
+
+    results = []
+    for name, build in [
+        ("plain, List[float]", plain_with_list),
+        ("plain, float32 array", plain_with_array),
+        ("slotted, float32 array", slotted),
+    ]:
+        elapsed, size = measure(build, rows)
+        results.append((name, elapsed, size))
+
+    _, base_elapsed, base_size = results[0]
+    print("=" * 70)
+    print(f"{'entities':>24} | {'load s':>7} | {'heap MB':>8} | "
+          f"{'bytes/job':>9} | {'heap':>6} | {'load':>6}")
+    for name, elapsed, size in results:
+        print(f"{name:>24} | {elapsed:>7.2f} | {size / 2**20:>8.1f} | "
+              f"{size / args.jobs:>9.0f} | {base_size / size:>5.1f}x | "
+              f"{base_elapsed / elapsed:>5.1f}x")
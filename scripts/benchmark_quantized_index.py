@@ -0,0 +1,97 @@
+"""
+Benchmark the quantized job index: memory per job and ranking change.
+
+Compares the memory a job's embedding costs as a Python list of floats,
+as a float32 row and in the index (int8 codes and a scale per vector on
+the heap, float32 vectors memory-mapped), and measures how the top-k of
+the int8 first pass with float32 rescoring differs from exact float32
+search. Uses synthetic clustered embeddings, so it runs without a
+database or model.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath('.'))
+
+import numpy as np
+
+from core.services.ann_index import IVFIndex
+from core.services.scoring_engine import normalize_rows, top_k
+from scripts.benchmark_ann import make_corpus
+
+
+def list_bytes(dim: int) -> int:
+    """Heap size of one embedding held as a Python list of floats."""
+    embedding = [float(i) + 0.5 for i in range(dim)]
+    return sys.getsizeof(embedding) + sum(sys.getsizeof(x) for x in embedding)
+
+
+def run_benchmark(n: int, dim: int, queries: int, k: int, rescore_sizes, n_probe):
+    clusters = max(8, n // 500)
+    corpus = make_corpus(n, dim, clusters)
+    query_vectors = normalize_rows(make_corpus(queries, dim, clusters, seed=1))
+    exact_matrix = normalize_rows(corpus.copy())
+
+    print(f"📊 Building index over {n} vectors ({dim} dims)...")
+    index = IVFIndex()
+    index.add_many([(str(i), vector) for i, vector in enumerate(corpus)])
+    stats = index.stats()
+
+    print("=" * 70)
+    print(f"{'representation':>28} | {'bytes/job':>10} | {'vs list':>8}")
+    per_list = list_bytes(dim)
+    for name, size in [
+        ("List[float]", per_list),
+        ("float32 row", dim * 4),
+        ("index heap (int8 + scale)", stats["heap_bytes"] / n),
+        ("index memory-mapped float32", stats["mapped_bytes"] / n),
+    ]:
+        print(f"{name:>28} | {size:>10.0f} | {per_list / size:>7.1f}x")
+
+    exact = [
+        top_k(exact_matrix @ query, k) for query in query_vectors
+    ]
+
+    print("=" * 70)
+    probe = "all" if n_probe is None else n_probe
+    print(f"n_probe {probe} | top-{k} against exact float32 search")
+    print(f"{'rescore':>8} | {'recall@' + str(k):>10} | {'same order':>10} | "
+          f"{'max score err':>13} | {'ms/query':>9}")
+    for rescore_size in rescore_sizes:
+        index.rescore_size = rescore_size
+        start = time.perf_counter()
+        found = [index.search(query, k, n_probe=n_probe) for query in query_vectors]
+        ms = (time.perf_counter() - start) / queries * 1000
+
+        recall = np.mean([
+            len({int(id) for id, _ in f} & set(e.tolist())) / k
+            for f, e in zip(found, exact)
+        ])
+        same_order = np.mean([
+            [int(id) for id, _ in f] == e.tolist() for f, e in zip(found, exact)
+        ])
+        error = max(
+            abs(score - float(exact_matrix[int(id)] @ query))
+            for f, query in zip(found, query_vectors)
+            for id, score in f
+        )
+        print(f"{rescore_size:>8} | {recall:>10.3f} | {same_order:>10.3f} | "
+              f"{error:>13.2e} | {ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--rescore", type=int, nargs="+", default=[10, 64, 256, 512])
+    parser.add_argument("--n-probe", type=int, default=None,
+                        help="Lists scanned per query (default: all)")
+    args = parser.parse_args()
+
+    run_benchmark(
+        args.jobs, args.dim, args.queries, args.k, args.rescore, args.n_probe
+    )
@@ -0,0 +1,123 @@
+"""
+Compare embedding backends: encoding throughput and drift from a reference.
+
+Encodes the same job texts with each backend and reports texts/s, the
+cosine similarity of each text's embedding to the reference backend's
+(same dimension only) and how many of each job's nearest neighbours are
+preserved. Texts come from the jobs table, or are synthetic with
+--synthetic N.
+
+Example:
+    python scripts/compare_backends.py sentence-transformers quantized \\
+        --model-path models/all-MiniLM-L6-v2 --limit 2000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath('.'))
+
+import numpy as np
+
+from adapters.services.embedding_backend_factory import (
+    BACKENDS,
+    QUANTIZED,
+    create_embedding_backend,
+)
+from config import config
+from core.services.embedding_service import build_job_text
+
+WORDS = (
+    "python java sql data analyst engineer developer nurse teacher sales "
+    "manager remote stockholm london marketing finance design support cloud "
+    "senior junior intern machine learning customer service logistics"
+).split()
+
+
+def synthetic_texts(n: int, seed: int = 0):
+    """Random job-like texts, for runs without a database."""
+    rng = np.random.default_rng(seed)
+    return [" ".join(rng.choice(WORDS, size=rng.integers(8, 40))) for _ in range(n)]
+
+
+async def load_job_texts(limit: int):
+    """Embedding texts of the first ``limit`` jobs in the database."""
+    from infrastructure.db.database import AsyncSessionLocal, engine
+    from adapters.repositories.mysql.mysql_job_repository import MySQLJobRepository
+
+    async with AsyncSessionLocal() as session:
+        jobs = await MySQLJobRepository(session).list(limit=limit)
+    await engine.dispose()
+    return [build_job_text(job) for job in jobs]
+
+
+def neighbours(embeddings: np.ndarray, k: int) -> np.ndarray:
+    """Indices of each row's k nearest other rows by cosine similarity."""
+    similarities = embeddings @ embeddings.T
+    np.fill_diagonal(similarities, -np.inf)
+    return np.argsort(-similarities, axis=1)[:, :k]
+
+
+def compare(backend_names, texts, model_path, batch_size, k):
+    results = []
+    for name in backend_names:
+        print(f"🤖 Loading backend: {name}...")
+        backend = create_embedding_backend(name, config.EMBEDDING_MODEL, model_path)
+        backend.encode(texts[:batch_size], batch_size)  # warm-up
+
+        start = time.perf_counter()
+        embeddings = np.asarray(backend.encode(texts, batch_size), dtype=np.float32)
+        elapsed = time.perf_counter() - start
+        results.append((name, embeddings, len(texts) / elapsed))
+
+    reference_name, reference, _ = results[0]
+    reference_neighbours = neighbours(reference, k)
+
+    print("=" * 70)
+    print(f"Reference: {reference_name} | {len(texts)} texts | batch size {batch_size}")
+    print(f"{'backend':>22} | {'texts/s':>9} | {'mean cos':>8} | {'min cos':>8} | "
+          f"{'recall@' + str(k):>9}")
+    for name, embeddings, rate in results:
+        if embeddings.shape == reference.shape:
+            cosines = np.sum(embeddings * reference, axis=1)
+            mean_cos, min_cos = f"{cosines.mean():.4f}", f"{cosines.min():.4f}"
+        else:
+            mean_cos = min_cos = "n/a"
+        found = neighbours(embeddings, k)
+        recall = np.mean([
+            len(set(a) & set(b)) / k for a, b in zip(found, reference_neighbours)
+        ])
+        print(f"{name:>22} | {rate:>9.1f} | {mean_cos:>8} | {min_cos:>8} | {recall:>9.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare embedding backends")
+    parser.add_argument("backends", nargs="*",
+                        help=f"Backends to compare, the first is the reference "
+                             f"(default: {' '.join(BACKENDS)}, quantized only "
+                             f"with a model path)")
+    parser.add_argument("--model-path", default=config.EMBEDDING_MODEL_PATH or None,
+                        help="Local model directory (required by quantized)")
+    parser.add_argument("--limit", type=int, default=1000,
+                        help="Number of jobs to load from the database")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Use N synthetic texts instead of the database")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    backends = args.backends or [
+        name for name in BACKENDS if name != QUANTIZED or args.model_path
+    ]
+
+    if args.synthetic:
+        texts = synthetic_texts(args.synthetic)
+    else:
+        texts = asyncio.run(load_job_texts(args.limit))
+    if len(texts) <= args.k:
+        print(f"❌ Need more than {args.k} texts, found {len(texts)}")
+        sys.exit(1)
+
+    compare(backends, texts, args.model_path, args.batch_size, args.k)
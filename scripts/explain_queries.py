@@ -0,0 +1,183 @@
+"""
+Print the query plan of every repository query.
+
+Runs the queries of the job, candidate and requirement repositories on
+the configured database with EXPLAIN in front of each statement, and
+flags full table scans. Writes target an id that doesn't exist, so no
+data changes. Exits with status 1 if a query that should use an index
+scans a whole table, so plan regressions can be caught; run it against a
+database with realistic data, since the optimizer may prefer a scan on
+tiny tables.
+
+Example:
+    python scripts/explain_queries.py
+"""
+import argparse
+import asyncio
+import os
+import sys
+from typing import Any, List, Optional, Tuple
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import event
+
+from adapters.repositories.mysql.mysql_candidate_repository import MySQLCandidateRepository
+from adapters.repositories.mysql.mysql_job_repository import MySQLJobRepository
+from adapters.repositories.mysql.mysql_requirement_repository import (
+    MySQLRequirementRepository,
+)
+from core.domain.candidate import Candidate
+from core.domain.job import Job
+from core.domain.job_filter import JobFilter
+from infrastructure.db.database import AsyncSessionLocal, engine
+
+MISSING_ID = "00000000-0000-0000-0000-000000000000"
+
+# Queries that read (most of) a table by design
+FULL_SCAN_EXPECTED = {
+    "jobs.find_available",
+    "jobs.find_available_for_scoring",
+    "requirements.find_by_order",
+}
+
+
+class PlanRecorder:
+    """Runs EXPLAIN for each statement the engine executes."""
+
+    def __init__(self):
+        self.label: Optional[str] = None
+        self.plans: List[Tuple[str, str, List[Tuple[str, bool]]]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.label is None or executemany:
+            return
+        if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            return
+        if conn.dialect.name == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            steps = [_sqlite_step(row) for row in cursor.fetchall()]
+        else:
+            cursor.execute("EXPLAIN " + statement, parameters)
+            columns = [column[0] for column in cursor.description]
+            steps = [_mysql_step(dict(zip(columns, row))) for row in cursor.fetchall()]
+        self.plans.append((self.label, statement, steps))
+
+
+def _mysql_step(row: dict) -> Tuple[str, bool]:
+    """Description of one EXPLAIN row, and whether it's a full table scan."""
+    description = (
+        f"{row.get('table')}: type={row.get('type')} key={row.get('key')} "
+        f"rows={row.get('rows')} {row.get('Extra') or ''}"
+    )
+    return description.strip(), row.get("type") == "ALL"
+
+
+def _sqlite_step(row: Any) -> Tuple[str, bool]:
+    detail = row[-1]
+    return detail, detail.startswith("SCAN") and "USING" not in detail
+
+
+async def run_queries(recorder: PlanRecorder) -> None:
+    """Call each repository query once, labelled for the recorder."""
+    async with AsyncSessionLocal() as session:
+        jobs = MySQLJobRepository(session)
+        candidates = MySQLCandidateRepository(session)
+        requirements = MySQLRequirementRepository(session)
+        filters = JobFilter(category="IT", company="Acme", experience_level="Senior")
+        embedding = np.zeros(4, dtype=np.float32)
+
+        queries = [
+            ("jobs.get", lambda: jobs.get(MISSING_ID)),
+            ("jobs.get_many", lambda: jobs.get_many([MISSING_ID])),
+            ("jobs.list_after", lambda: jobs.list_after(MISSING_ID, 100)),
+            ("jobs.find_by_category", lambda: jobs.find_by_category("IT")),
+            ("jobs.find_available", lambda: jobs.find_available()),
+            (
+                "jobs.find_available (filtered)",
+                lambda: jobs.find_available(filters=filters),
+            ),
+            ("jobs.find_available_for_scoring", lambda: jobs.find_available_for_scoring()),
+            (
+                "jobs.find_available_for_scoring (filtered)",
+                lambda: jobs.find_available_for_scoring(filters=filters),
+            ),
+            (
+                "jobs.find_available_for_scoring (ids)",
+                lambda: jobs.find_available_for_scoring(ids=[MISSING_ID]),
+            ),
+            ("jobs.corpus_state", lambda: jobs.corpus_state()),
+            ("jobs.find_index_embeddings", lambda: jobs.find_index_embeddings(MISSING_ID)),
+            (
+                "jobs.find_index_embeddings (since)",
+                lambda: jobs.find_index_embeddings(updated_since=datetime(2100, 1, 1)),
+            ),
+            ("jobs.list_ids_after", lambda: jobs.list_ids_after(MISSING_ID)),
+            ("jobs.find_stale_embeddings", lambda: jobs.find_stale_embeddings(100)),
+            (
+                "jobs.save_embeddings",
+                lambda: jobs.save_embeddings([(MISSING_ID, "", embedding)]),
+            ),
+            ("jobs.update", lambda: jobs.update(MISSING_ID, Job(title="Job"))),
+            ("jobs.delete", lambda: jobs.delete(MISSING_ID)),
+            ("candidates.get", lambda: candidates.get(MISSING_ID)),
+            ("candidates.get_many", lambda: candidates.get_many([MISSING_ID])),
+            ("candidates.list_after", lambda: candidates.list_after(MISSING_ID, 100)),
+            ("candidates.find_by_location", lambda: candidates.find_by_location("Stockholm")),
+            ("candidates.find_stale_embeddings", lambda: candidates.find_stale_embeddings(100)),
+            (
+                "candidates.save_embeddings",
+                lambda: candidates.save_embeddings([(MISSING_ID, "", embedding)]),
+            ),
+            ("candidates.update", lambda: candidates.update(MISSING_ID, Candidate())),
+            ("candidates.delete", lambda: candidates.delete(MISSING_ID)),
+            ("requirements.find_by_order", lambda: requirements.find_by_order()),
+            ("requirements.delete", lambda: requirements.delete(MISSING_ID)),
+        ]
+        for label, query in queries:
+            recorder.label = label
+            await query()
+        recorder.label = None
+
+
+def report(recorder: PlanRecorder, show_sql: bool) -> int:
+    """Print the plans; returns the number of unexpected full table scans."""
+    regressions = 0
+    for label, statement, steps in recorder.plans:
+        scans = any(full_scan for _, full_scan in steps)
+        unexpected = scans and label not in FULL_SCAN_EXPECTED
+        regressions += unexpected
+        print(f"{'❌' if unexpected else '✅'} {label}")
+        if show_sql:
+            print(f"   {' '.join(statement.split())}")
+        for description, full_scan in steps:
+            print(f"   {'⚠️ ' if full_scan else '  '} {description}")
+    return regressions
+
+
+async def main(show_sql: bool) -> int:
+    recorder = PlanRecorder()
+    event.listen(engine.sync_engine, "before_cursor_execute", recorder)
+    try:
+        await run_queries(recorder)
+    finally:
+        await engine.dispose()
+
+    regressions = report(recorder, show_sql)
+    print("=" * 70)
+    if regressions:
+        print(f"❌ {regressions} queries scan a whole table")
+    else:
+        print(f"✅ {len(recorder.plans)} statements, no unexpected full table scans")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sql", action="store_true", help="Print each statement")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.sql)))
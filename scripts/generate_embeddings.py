@@ -3,10 +3,15 @@ import os
 sys.path.insert(0, os.path.abspath('.'))
 
 from core.services.embedding_service import EmbeddingService
+import argparse
+import asyncio
+import json
 import requests
 import time
 
 API_BASE_URL = "http://localhost:8000/v1"
+BATCH_SIZE = 64
+CHECKPOINT_PATH = "data/embedding_backfill.json"
 
 def generate_embeddings_for_all_jobs(limit=None):
     """Generate embeddings for all jobs in the database."""
@@ -33,52 +38,63 @@ def generate_embeddings_for_all_jobs(limit=None):
     failed = 0
     start_time = time.time()
     
-    for i, job in enumerate(jobs):
+    # Create simple job objects
+    class SimpleJob:
+        def __init__(self, data):
+            self.title = data.get('title', '')
+            self.description = data.get('description', '')
+            self.responsibilities = data.get('responsibilities')
+            self.requirements = data.get('requirements', {})
+            self.category = data.get('category')
+            self.location = data.get('location')
+    
+    for batch_start in range(0, total, BATCH_SIZE):
+        batch = jobs[batch_start:batch_start + BATCH_SIZE]
+        
         try:
-            # Create a simple job object
-            class SimpleJob:
-                def __init__(self, data):
-                    self.title = data.get('title', '')
-                    self.description = data.get('description', '')
-                    self.responsibilities = data.get('responsibilities')
-                    self.requirements = data.get('requirements', {})
-                    self.category = data.get('category')
-                    self.location = data.get('location')
-            
-            job_obj = SimpleJob(job)
-            
-            # Generate embedding
-            embedding = embedding_service.generate_job_embedding(job_obj)
-            
-            # Update job via API
-            job_id = job['id']
-            update_data = {"embedding": embedding}
-            
-            update_response = requests.patch(
-                f"{API_BASE_URL}/jobs/{job_id}",
-                json=update_data
+            # Generate embeddings for the whole batch in one model call
+            embeddings = embedding_service.encode_jobs(
+                [SimpleJob(job) for job in batch], batch_size=BATCH_SIZE
             )
+        except Exception as e:
+            failed += len(batch)
+            print(f"❌ Error encoding jobs {batch_start + 1}-{batch_start + len(batch)}: {e}")
+            continue
+        
+        for job, embedding in zip(batch, embeddings):
+            try:
+                # Update job via API
+                job_id = job['id']
+                update_data = {
+                    "embedding": embedding.tolist(),
+                    "embedding_model": embedding_service.backend_name,
+                }
+                
+                update_response = requests.patch(
+                    f"{API_BASE_URL}/jobs/{job_id}",
+                    json=update_data
+                )
+                
+                if update_response.status_code == 200:
+                    successful += 1
+                else:
+                    failed += 1
+                    print(f"⚠️  Failed to update job {job_id}: {update_response.status_code}")
             
-            if update_response.status_code == 200:
-                successful += 1
-            else:
+            except Exception as e:
                 failed += 1
-                print(f"⚠️  Failed to update job {job_id}: {update_response.status_code}")
-            
-            # Progress update every 50 jobs
-            if (i + 1) % 50 == 0:
-                elapsed = time.time() - start_time
-                rate = (i + 1) / elapsed if elapsed > 0 else 0
-                eta = (total - (i + 1)) / rate if rate > 0 else 0
-                
-                progress = (i + 1) / total * 100
-                print(f"📊 Progress: {i + 1}/{total} ({progress:.1f}%) | "
-                      f"✅ {successful} | ❌ {failed} | "
-                      f"⏱️  {rate:.1f} jobs/s | ETA: {eta/60:.1f}min")
+                print(f"❌ Error processing job {job.get('id')}: {e}")
         
-        except Exception as e:
-            failed += 1
-            print(f"❌ Error processing job {job.get('id')}: {e}")
+        # Progress update every batch
+        done = batch_start + len(batch)
+        elapsed = time.time() - start_time
+        rate = done / elapsed if elapsed > 0 else 0
+        eta = (total - done) / rate if rate > 0 else 0
+        
+        progress = done / total * 100
+        print(f"📊 Progress: {done}/{total} ({progress:.1f}%) | "
+              f"✅ {successful} | ❌ {failed} | "
+              f"⏱️  {rate:.1f} jobs/s | ETA: {eta/60:.1f}min")
     
     elapsed = time.time() - start_time
     
@@ -88,12 +104,229 @@ def generate_embeddings_for_all_jobs(limit=None):
     print(f"❌ Failed: {failed}")
     print(f"📊 Success rate: {(successful/total*100):.1f}%")
 
+def load_checkpoint(path):
+    """Read the last committed job id and counters of an interrupted backfill."""
+    if not os.path.exists(path):
+        return {"last_id": None, "processed": 0}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, checkpoint):
+    """Atomically record backfill progress after a committed batch."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+async def backfill_embeddings(limit=None, batch_size=BATCH_SIZE,
+                              checkpoint_path=CHECKPOINT_PATH, reset=False,
+                              workers=1):
+    """Embed jobs with a missing, stale or other-backend embedding, reading and writing the database directly.
+
+    Jobs are streamed in id order through a server-side cursor, encoded a
+    batch at a time and written back with one executemany UPDATE per
+    batch. After each committed batch the last job id is checkpointed, so
+    an interrupted run resumes after it; once every pending job is done
+    the checkpoint is removed, so the next run starts from the first job.
+
+    Like the API's embedding worker, a job is only updated if its
+    fingerprint is still the one read, so a job edited through the API
+    while its batch was encoded stays stale and is embedded again. Running
+    APIs pick the new embeddings up with their next job index sync.
+
+    With ``workers`` > 1, encoding runs on a process pool and each batch
+    holds ``batch_size`` rows per worker.
+    """
+    from functools import partial
+
+    from sqlalchemy import bindparam, func, or_, select, update
+
+    from adapters.services.embedding_backend_factory import create_embedding_backend
+    from config import config
+    from core.services.embedding_cache import EmbeddingCache
+    from core.services.embedding_service import job_embedding_fingerprint
+    from infrastructure.db.database import engine
+    from infrastructure.db.models import (
+        JobModel,
+        embedding_metadata,
+        incompatible_embedding,
+    )
+
+    checkpoint = {"last_id": None, "processed": 0}
+    if not reset:
+        checkpoint = load_checkpoint(checkpoint_path)
+        if checkpoint["last_id"] is not None:
+            print(f"↩️  Resuming after job {checkpoint['last_id']} "
+                  f"({checkpoint['processed']} already processed)")
+
+    backend_factory = partial(create_embedding_backend, config.EMBEDDING_BACKEND,
+                              config.EMBEDDING_MODEL, config.EMBEDDING_MODEL_PATH or None)
+    if workers > 1:
+        from core.services.embedding_pool import EmbeddingPool
+
+        print(f"🤖 Initializing embedding pool with {workers} workers...")
+        encoder = EmbeddingPool(config.EMBEDDING_MODEL, workers=workers,
+                                batch_size=batch_size, shard_size=batch_size,
+                                backend_factory=backend_factory)
+        chunk_size = batch_size * workers
+    else:
+        print("🤖 Initializing embedding service...")
+        encoder = EmbeddingService(
+            config.EMBEDDING_MODEL,
+            batch_size=batch_size,
+            cache=EmbeddingCache(config.EMBEDDING_CACHE_PATH or None),
+            backend=backend_factory(),
+        )
+        chunk_size = batch_size
+
+    try:
+        # Embeddings another backend produced are pending too, so switching the
+        # model and running the backfill re-embeds the whole corpus
+        model_name = encoder.backend_name
+        pending = [or_(
+            JobModel.embedding.is_(None),
+            JobModel.embedding_stale.is_(True),
+            incompatible_embedding(JobModel, model_name, encoder.dimension),
+        )]
+        if checkpoint["last_id"] is not None:
+            pending.append(JobModel.id > checkpoint["last_id"])
+
+        jobs_table = JobModel.__table__
+        update_statement = (
+            update(jobs_table)
+            .where(
+                jobs_table.c.id == bindparam("job_id"),
+                or_(
+                    jobs_table.c.embedding_fingerprint == bindparam("embedding_fingerprint"),
+                    jobs_table.c.embedding_fingerprint.is_(None),
+                ),
+            )
+            .values(
+                embedding=bindparam("embedding"),
+                embedding_dim=bindparam("embedding_dim"),
+                embedding_model=bindparam("embedding_model"),
+                embedding_fingerprint=bindparam("embedding_fingerprint"),
+                embedding_stale=False,
+            )
+        )
+
+        async with engine.connect() as read_conn:
+            total = await read_conn.scalar(
+                select(func.count()).select_from(JobModel).where(*pending)
+            )
+            # Only a run that reaches the end of the pending jobs drops the checkpoint
+            exhausts = not limit or total <= limit
+            if limit:
+                total = min(total, limit)
+            print(f"✅ Found {total} jobs without an up-to-date embedding")
+            print("=" * 70)
+
+            query = (
+                select(
+                    JobModel.id,
+                    JobModel.title,
+                    JobModel.description,
+                    JobModel.responsibilities,
+                    JobModel.requirements,
+                    JobModel.category,
+                    JobModel.location,
+                    JobModel.embedding_fingerprint,
+                )
+                .where(*pending)
+                .order_by(JobModel.id)
+                .limit(total)
+                .execution_options(yield_per=chunk_size)
+            )
+
+            done = 0
+            start_time = time.time()
+            result = await read_conn.stream(query)
+            async for rows in result.partitions(chunk_size):
+                embeddings = encoder.encode_jobs(rows)
+                metadata = embedding_metadata(embeddings[0], model_name)
+
+                # Writes go through their own connection: the read connection is
+                # busy with the open cursor
+                async with engine.begin() as write_conn:
+                    await write_conn.execute(
+                        update_statement,
+                        [
+                            {
+                                "job_id": row.id,
+                                "embedding": embedding,
+                                # Saved against the fingerprint read, as the worker does
+                                "embedding_fingerprint": (
+                                    row.embedding_fingerprint
+                                    or job_embedding_fingerprint(row)
+                                ),
+                                **metadata,
+                            }
+                            for row, embedding in zip(rows, embeddings)
+                        ],
+                    )
+
+                done += len(rows)
+                checkpoint = {
+                    "last_id": rows[-1].id,
+                    "processed": checkpoint["processed"] + len(rows),
+                }
+                save_checkpoint(checkpoint_path, checkpoint)
+
+                elapsed = time.time() - start_time
+                rate = done / elapsed if elapsed > 0 else 0
+                eta = (total - done) / rate if rate > 0 else 0
+                print(f"📊 Progress: {done}/{total} ({done / total * 100:.1f}%) | "
+                      f"⏱️  {rate:.1f} jobs/s | ETA: {eta/60:.1f}min")
+    finally:
+        await engine.dispose()
+        if workers > 1:
+            encoder.close()
+
+    elapsed = time.time() - start_time
+
+    print("\n" + "=" * 70)
+    print(f"🎉 Backfill complete: {done} jobs in {elapsed/60:.1f} minutes "
+          f"({done / elapsed if elapsed > 0 else 0:.1f} jobs/s)")
+    if exhausts:
+        # Jobs that become stale later may sort before the last id
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+    else:
+        print(f"💾 Checkpoint: {checkpoint_path} (use --reset to start over)")
+
+
 if __name__ == "__main__":
-    limit = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    parser = argparse.ArgumentParser(description="Generate job embeddings")
+    parser.add_argument("limit", nargs="?", type=int, default=None,
+                        help="Maximum number of jobs to process")
+    parser.add_argument("--direct", action="store_true",
+                        help="Backfill missing and stale embeddings directly in the database")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH,
+                        help="Progress file used to resume a direct backfill")
+    parser.add_argument("--reset", action="store_true",
+                        help="Ignore the checkpoint and start from the first job")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Encoding processes for a direct backfill")
+    args = parser.parse_args()
     
-    if limit:
-        print(f"🧪 TEST MODE: Processing {limit} jobs")
+    if args.limit:
+        print(f"🧪 TEST MODE: Processing {args.limit} jobs")
     else:
         print(f"🚀 FULL MODE: Processing all jobs")
     
-    generate_embeddings_for_all_jobs(limit=limit)
\ No newline at end of file
+    if args.direct:
+        asyncio.run(backfill_embeddings(
+            limit=args.limit,
+            batch_size=args.batch_size,
+            checkpoint_path=args.checkpoint,
+            reset=args.reset,
+            workers=args.workers,
+        ))
+    else:
+        generate_embeddings_for_all_jobs(limit=args.limit)
@@ -3,12 +3,12 @@ import requests
 import json
 from datetime import datetime, timedelta
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import sys
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000/v1"
-BATCH_SIZE = 100
+BATCH_SIZE = 1000  # Jobs per bulk request
 
 def load_linkedin_data(file_path: str) -> pd.DataFrame:
     """Load LinkedIn job postings."""
@@ -76,19 +76,22 @@ def generate_end_date() -> str:
     end_date = datetime.now() + timedelta(days=days_ahead)
     return end_date.strftime('%Y-%m-%d')
 
-def create_job_via_api(job_data: Dict[str, Any]) -> bool:
-    """Create job via LaunchPad API."""
+def create_jobs_via_api(jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create a batch of jobs via the LaunchPad bulk endpoint, sent as NDJSON."""
+    body = "\n".join(json.dumps(job) for job in jobs)
     try:
         response = requests.post(
-            f"{API_BASE_URL}/jobs",
-            json=job_data,
-            timeout=10
+            f"{API_BASE_URL}/jobs/bulk",
+            data=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
+            timeout=300
         )
-        
-        return response.status_code == 201
-            
+        response.raise_for_status()
+        return response.json()
+
     except Exception as e:
-        return False
+        print(f"⚠️  Bulk request failed: {e}")
+        return {"created": 0, "failed": len(jobs), "ids": [], "errors": []}
 
 def import_jobs(csv_path: str, limit: Optional[int] = None):
     """Import jobs from CSV to LaunchPad."""
@@ -117,32 +120,34 @@ def import_jobs(csv_path: str, limit: Optional[int] = None):
     
     start_time = time.time()
     
+    batch = []
     for i, (idx, row) in enumerate(df.iterrows()):
         job_data = transform_to_launchpad_format(row)
         
         if job_data is None:
             failed += 1
+        else:
+            batch.append(job_data)
+        
+        if len(batch) < BATCH_SIZE and i + 1 < total:
             continue
         
-        if create_job_via_api(job_data):
-            successful += 1
-        else:
-            failed += 1
+        if batch:
+            result = create_jobs_via_api(batch)
+            successful += result["created"]
+            failed += result["failed"]
+            for error in result["errors"][:3]:
+                print(f"⚠️  Job {error['index']} of batch rejected: {error['error']}")
+            batch = []
         
-        # Progress update every 10 jobs
-        if (i + 1) % 10 == 0:
-            elapsed = time.time() - start_time
-            rate = successful / elapsed if elapsed > 0 else 0
-            eta = (total - (i + 1)) / rate if rate > 0 else 0
-            
-            progress = (i + 1) / total * 100
-            print(f"📊 Progress: {i + 1}/{total} ({progress:.1f}%) | "
-                f"✅ {successful} | ❌ {failed} | "
-                f"⏱️  {rate:.1f} jobs/s | ETA: {eta/60:.1f}min")
+        elapsed = time.time() - start_time
+        rate = successful / elapsed if elapsed > 0 else 0
+        eta = (total - (i + 1)) / rate if rate > 0 else 0
         
-        # Rate limiting
-        if (i + 1) % BATCH_SIZE == 0:
-            time.sleep(1)
+        progress = (i + 1) / total * 100
+        print(f"📊 Progress: {i + 1}/{total} ({progress:.1f}%) | "
+            f"✅ {successful} | ❌ {failed} | "
+            f"⏱️  {rate:.1f} jobs/s | ETA: {eta/60:.1f}min")
     
     elapsed = time.time() - start_time
     
@@ -0,0 +1,34 @@
+import pytest
+
+from adapters.repositories.memory.memory_job_repository import MemoryJobRepository
+from core.domain.job import Job
+from core.ports.repositories.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+
+
+@pytest.mark.asyncio
+async def test_list_after_walks_all_entities_in_id_order():
+    repository = MemoryJobRepository()
+    await repository.create_many([Job(id=f"job-{i}", title="Job") for i in (3, 1, 4, 0)])
+    await repository.create(Job(id="job-2", title="Job"))
+    await repository.delete("job-4")
+
+    ids, cursor = [], None
+    while True:
+        page = await repository.list_after(decode_cursor(cursor) if cursor else None, 2)
+        ids += [job.id for job in page]
+        cursor = next_cursor(page, 2)
+        if cursor is None:
+            break
+
+    assert ids == ["job-0", "job-1", "job-2", "job-3"]
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor("job-1")) == "job-1"
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not a cursor")
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from adapters.repositories.mysql.mysql_job_repository import MySQLJobRepository
+from core.domain.job import Job
+from infrastructure.db.models import Base
+
+
+@pytest.mark.asyncio
+async def test_update_writes_only_changed_columns_and_delete_uses_rowcount(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repository = MySQLJobRepository(session)
+            await repository.create(Job(id="job-1", title="Job", description="Long text"))
+
+            job = await repository.get("job-1")
+            job.embedding = np.ones(4, dtype=np.float32)
+            job.embedding_model = "hashing-4"
+            statements.clear()
+            assert await repository.update("job-1", job) is job
+            assert statements == [
+                "UPDATE jobs SET embedding=?, embedding_dim=?, embedding_model=?, "
+                "updated_at=? WHERE jobs.id = ?"
+            ]
+
+            statements.clear()
+            assert await repository.update("job-1", job) is job
+            assert statements == []
+            assert (await repository.get("job-1")).embedding_model == "hashing-4"
+
+            assert await repository.update("missing", Job(title="Job")) is None
+            assert await repository.delete("job-1") is True
+            assert await repository.delete("job-1") is False
+    finally:
+        await engine.dispose()
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+from adapters.services.hashing_backend import HashingBackend
+
+
+def test_hashing_backend_is_deterministic():
+    backend = HashingBackend(dimension=64)
+
+    embeddings = backend.encode(
+        ["Python developer in Stockholm", "Python developer in Stockholm", "Nurse", ""],
+        batch_size=32,
+    )
+
+    assert embeddings.shape == (4, 64)
+    assert np.array_equal(embeddings[0], embeddings[1])
+    assert np.array_equal(embeddings[0], HashingBackend(dimension=64).encode(
+        ["Python developer in Stockholm"], batch_size=32
+    )[0])
+    assert np.isclose(np.linalg.norm(embeddings[0]), 1.0)
+    assert not embeddings[3].any()
+    assert embeddings[0] @ embeddings[0] > embeddings[0] @ embeddings[2]
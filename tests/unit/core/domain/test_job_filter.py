@@ -0,0 +1,26 @@
+from core.domain.job import Job
+from core.domain.job_filter import JobFilter
+
+
+def test_job_filter_matches():
+    job = Job(
+        category="Internship",
+        company="Acme",
+        location="Stockholm, Sweden",
+        salary=30000.0,
+        requirements={"experience": "Entry level"},
+    )
+
+    assert JobFilter().is_empty()
+    assert JobFilter().matches(job)
+    assert JobFilter(
+        category="internship",
+        company="ACME",
+        location="stockholm",
+        min_salary=25000,
+        experience_level="entry level",
+    ).matches(job)
+    assert not JobFilter(location="Gothenburg").matches(job)
+    assert not JobFilter(min_salary=40000).matches(job)
+    assert not JobFilter(experience_level="Mid-Senior level").matches(job)
+    assert not JobFilter(min_salary=1).matches(Job())
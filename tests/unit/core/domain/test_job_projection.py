@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from core.domain.job import Job
+from core.domain.job_projection import JobProjection
+
+
+def test_job_projection_from_job():
+    job = Job(
+        id="job-1",
+        title="Python Developer",
+        description="Build services with Python and SQL",
+        location="Stockholm",
+        category="IT",
+        requirements={"experience": "Entry level", "languages": "Swedish"},
+        embedding=[0.1, 0.2],
+    )
+
+    projection = JobProjection.from_job(job)
+
+    assert projection.id == "job-1"
+    assert projection.embedding.dtype == np.float32
+    np.testing.assert_allclose(projection.embedding, [0.1, 0.2], rtol=1e-6)
+    assert projection.location == "Stockholm"
+    assert projection.requirements == {"experience": "Entry level"}
+    assert {"python", "sql"} <= projection.keywords
+    assert not hasattr(projection, "description")
@@ -0,0 +1,102 @@
+import numpy as np
+from core.services.ann_index import IVFIndex
+from core.services.quantization import quantize_int8
+
+
+def _clustered(n, dim=16, clusters=8, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    return centers[rng.integers(clusters, size=n)] + rng.normal(scale=0.3, size=(n, dim))
+
+
+def test_untrained_search_is_exact():
+    vectors = _clustered(50)
+    index = IVFIndex(train_threshold=1000)
+    for i, vector in enumerate(vectors):
+        index.add(str(i), vector)
+
+    results = index.search(vectors[7], k=1, n_probe=1)
+
+    assert not index.is_trained
+    assert results[0][0] == "7"
+    assert abs(results[0][1] - 1.0) < 1e-5
+
+
+def test_trained_search_finds_itself_and_supports_updates():
+    vectors = _clustered(600)
+    index = IVFIndex(train_threshold=500)
+    index.add_many([(str(i), vector) for i, vector in enumerate(vectors)])
+
+    assert index.is_trained
+    assert index.search(vectors[42], k=1, n_probe=2)[0][0] == "42"
+
+    assert index.remove("42")
+    assert not index.remove("42")
+    assert "42" not in [id for id, _ in index.search(vectors[42], k=5)]
+
+    index.add("1", vectors[42])
+    assert index.search(vectors[42], k=1)[0][0] == "1"
+    assert len(index) == 599
+
+
+def test_save_and_load_round_trip(tmp_path):
+    vectors = _clustered(300)
+    index = IVFIndex(train_threshold=100)
+    index.add_many([(str(i), vector) for i, vector in enumerate(vectors)])
+    path = str(tmp_path / "index.npz")
+
+    index.save(path)
+    loaded = IVFIndex()
+    loaded.load(path)
+
+    assert len(loaded) == len(index)
+    assert loaded.is_trained
+    assert loaded.search(vectors[3], k=5, n_probe=3) == index.search(
+        vectors[3], k=5, n_probe=3
+    )
+    assert [file.name for file in tmp_path.iterdir()] == ["index.npz"]
+
+
+def test_sync_adds_changed_and_removes_missing_ids():
+    vectors = _clustered(300)
+    index = IVFIndex(train_threshold=100)
+    index.add_many([(str(i), vector) for i, vector in enumerate(vectors[:200])])
+    centroids = index.centroids
+
+    # 0-99 unchanged, 100 changed, 101-199 deleted, 200-299 new
+    items = [(str(i), vectors[i]) for i in range(100)]
+    items.append(("100", vectors[250]))
+    items += [(str(i), vectors[i]) for i in range(200, 300)]
+    added, removed = index.sync(items)
+
+    assert (added, removed) == (101, 99)
+    assert len(index) == 201
+    assert "150" not in index and "250" in index
+    assert index.search(vectors[250], k=2, n_probe=8)[0][0] in {"100", "250"}
+    assert index.centroids is centroids
+
+
+def test_quantized_first_pass_is_rescored_exactly():
+    vectors = _clustered(400, dim=384)
+    index = IVFIndex(train_threshold=100, rescore_size=20)
+    index.add_many([(str(i), vector) for i, vector in enumerate(vectors)])
+
+    query = vectors[11] + 0.1
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    exact = unit @ (query / np.linalg.norm(query))
+
+    results = index.search(query, k=10)
+    assert [id for id, _ in results] == [str(i) for i in np.argsort(-exact)[:10]]
+    for id, score in results:
+        assert abs(score - exact[int(id)]) < 1e-5
+
+    # int8 codes, a scale and a store row per vector instead of float32
+    assert index.stats()["heap_bytes"] < 400 * 384 * 4 / 2
+
+
+def test_quantize_int8_round_trip():
+    vectors = _clustered(100, dim=32).astype(np.float32)
+    codes, scales = quantize_int8(vectors)
+
+    assert codes.dtype == np.int8
+    assert np.abs(codes * scales[:, None] - vectors).max() <= scales.max() / 2 + 1e-6
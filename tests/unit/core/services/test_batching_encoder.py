@@ -0,0 +1,36 @@
+import asyncio
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from core.services.batching_encoder import BatchingEncoder
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    service = MagicMock()
+    service.encode_texts.side_effect = lambda texts: np.array(
+        [[len(text), 1.0] for text in texts], dtype=np.float32
+    )
+    encoder = BatchingEncoder(lambda: service, max_batch_size=8, max_wait_ms=50)
+
+    embeddings = await asyncio.gather(
+        *(encoder.encode_text("x" * n) for n in range(1, 6))
+    )
+
+    service.encode_texts.assert_called_once()
+    assert [embedding[0] for embedding in embeddings] == [1, 2, 3, 4, 5]
+    assert encoder.stats()["batches"] == 1
+    assert encoder.stats()["max_batch_size"] == 5
+    await encoder.close()
+
+
+@pytest.mark.asyncio
+async def test_encode_errors_reach_every_caller():
+    service = MagicMock()
+    service.encode_texts.side_effect = RuntimeError("model unavailable")
+    encoder = BatchingEncoder(lambda: service, max_wait_ms=1)
+
+    with pytest.raises(RuntimeError):
+        await encoder.encode_text("python")
+    await encoder.close()
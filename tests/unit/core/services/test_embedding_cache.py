@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from core.services.embedding_cache import EmbeddingCache
+
+
+def test_embedding_cache_memory_and_disk(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    cache = EmbeddingCache(path, max_entries=1)
+    cache.put_many({"a": np.array([1.0, 2.0]), "b": np.array([3.0, 4.0])})
+
+    # "a" was evicted from memory but is still on disk
+    found = cache.get_many(["a", "b", "c"])
+    assert sorted(found) == ["a", "b"]
+    assert found["a"].dtype == np.float32
+    assert np.array_equal(found["a"], [1.0, 2.0])
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["misses"] == 1
+    cache.close()
+
+    # A new process sees the stored vectors
+    reopened = EmbeddingCache(path)
+    assert np.array_equal(reopened.get_many(["b"])["b"], [3.0, 4.0])
+    reopened.close()
+
+
+def test_embedding_cache_in_memory_only():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put_many({"a": [1.0], "b": [2.0], "c": [3.0]})
+
+    assert sorted(cache.get_many(["a", "b", "c"])) == ["b", "c"]
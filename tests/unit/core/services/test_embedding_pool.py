@@ -0,0 +1,21 @@
+from functools import partial
+
+import numpy as np
+from adapters.services.hashing_backend import HashingBackend
+from core.services.embedding_pool import EmbeddingPool
+from core.services.embedding_service import EmbeddingService
+
+
+def test_pool_encodes_like_a_single_service():
+    texts = [f"python developer {i}" for i in range(10)]
+    expected = EmbeddingService(backend=HashingBackend()).encode_texts(texts)
+
+    # Shards of 3 texts: every worker writes several slices of the output
+    with EmbeddingPool(
+        "hashing", workers=2, shard_size=3, backend_factory=partial(HashingBackend)
+    ) as pool:
+        embeddings = pool.encode_texts(texts)
+        assert pool.backend_name == HashingBackend().name
+
+    assert embeddings.shape == expected.shape
+    np.testing.assert_allclose(embeddings, expected, rtol=1e-6)
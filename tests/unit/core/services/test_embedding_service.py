@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from core.domain.candidate import Candidate
+from core.domain.job import Job
+from core.services.embedding_cache import EmbeddingCache
+from core.services.embedding_service import EmbeddingService, build_job_text
+
+
+def test_encode_jobs_in_batches():
+    backend = MagicMock()
+    backend.name = "test-model"
+    backend.encode.return_value = np.ones((2, 3), dtype=np.float64)
+    service = EmbeddingService(batch_size=16, backend=backend)
+
+    jobs = [
+        Job(title="Python Developer", location="Stockholm"),
+        Job(title="Data Analyst", requirements={"experience": "Entry level"}),
+    ]
+    embeddings = service.encode_jobs(jobs)
+
+    texts, batch_size = backend.encode.call_args.args
+    assert texts == [build_job_text(job) for job in jobs]
+    assert "experience: Entry level" in texts[1]
+    assert batch_size == 16
+    assert embeddings.dtype == np.float32
+    assert embeddings.flags["C_CONTIGUOUS"]
+
+    backend.encode.return_value = np.ones((1, 3), dtype=np.float32)
+    assert service.generate_candidate_embedding(Candidate(name="Ada")) == [1.0, 1.0, 1.0]
+
+
+def test_encode_texts_reuses_cached_embeddings():
+    backend = MagicMock()
+    backend.name = "test-model"
+    backend.encode.side_effect = lambda texts, batch_size: np.array(
+        [[len(text), 1.0] for text in texts]
+    )
+    service = EmbeddingService(cache=EmbeddingCache(), backend=backend)
+
+    first = service.encode_texts(["python", "sql", "python"])
+    assert backend.encode.call_args.args[0] == ["python", "sql"]
+
+    second = service.encode_texts(["sql", "java"])
+    assert backend.encode.call_args.args[0] == ["java"]
+    assert np.array_equal(second[0], first[1])
+    assert np.array_equal(first[0], first[2])
@@ -0,0 +1,125 @@
+from contextlib import asynccontextmanager
+
+import numpy as np
+import pytest
+from adapters.repositories.memory.memory_candidate_repository import MemoryCandidateRepository
+from adapters.repositories.memory.memory_job_repository import MemoryJobRepository
+from adapters.services.hashing_backend import HashingBackend
+from core.domain.candidate import Candidate
+from core.domain.job import Job
+from core.services.ann_index import IVFIndex
+from core.services.embedding_service import EmbeddingService
+from core.services.embedding_worker import CandidateEmbeddingWorker, EmbeddingWorker
+from core.use_cases.candidate_management import CandidateManagement
+from core.use_cases.job_management import JobManagement
+from core.use_cases.match_jobs import MatchJobs
+
+
+@pytest.mark.asyncio
+async def test_worker_embeds_new_and_edited_jobs():
+    repository = MemoryJobRepository()
+    job_index = IVFIndex()
+    service = EmbeddingService(backend=HashingBackend(dimension=32))
+    worker = EmbeddingWorker(
+        lambda: service,
+        job_index=job_index,
+        batch_size=2,
+        repository_scope=asynccontextmanager(lambda: _yield(repository)),
+    )
+    job_management = JobManagement(repository, job_index, embedding_worker=worker)
+
+    jobs = [
+        await job_management.create_job(Job(title=f"Python developer {i}"))
+        for i in range(3)
+    ]
+    assert all(job.embedding_stale for job in jobs)
+
+    assert await worker.run_once() == 3
+    assert not any(job.embedding_stale for job in jobs)
+    assert {job.embedding_model for job in jobs} == {service.backend_name}
+    assert len(job_index) == 3
+
+    # Only a change to the embedded text makes the embedding stale
+    jobs[0].salary = 50000.0
+    await job_management.update_job(jobs[0].id, jobs[0])
+    assert not jobs[0].embedding_stale
+
+    old_embedding = jobs[0].embedding
+    jobs[0].title = "Java developer"
+    await job_management.update_job(jobs[0].id, jobs[0])
+    assert jobs[0].embedding_stale
+
+    assert await worker.run_once() == 1
+    assert not np.array_equal(jobs[0].embedding, old_embedding)
+
+
+async def _yield(value):
+    yield value
+
+
+@pytest.mark.asyncio
+async def test_candidate_worker_recomputes_edited_profiles():
+    repository = MemoryCandidateRepository()
+    service = EmbeddingService(backend=HashingBackend(dimension=32))
+    worker = CandidateEmbeddingWorker(
+        lambda: service,
+        repository_scope=asynccontextmanager(lambda: _yield(repository)),
+    )
+    candidate_management = CandidateManagement(repository, embedding_worker=worker)
+
+    candidate = await candidate_management.create_candidate(
+        Candidate(name="Ada", skills=["python"])
+    )
+    assert candidate.embedding_stale
+    assert await worker.run_once() == 1
+    old_embedding = candidate.embedding
+
+    candidate.email = "ada@example.com"
+    await candidate_management.update_candidate(candidate.id, candidate)
+    assert not candidate.embedding_stale
+
+    candidate.skills = ["java"]
+    await candidate_management.update_candidate(candidate.id, candidate)
+    assert candidate.embedding_stale
+
+    # Matching uses an up-to-date embedding without saving it
+    match_jobs = MatchJobs(MemoryJobRepository(), repository, embedding_service=service)
+    [current] = await match_jobs._with_current_embeddings([candidate])
+    assert current is not candidate
+    assert candidate.embedding is old_embedding
+
+    assert await worker.run_once() == 1
+    assert not candidate.embedding_stale
+    np.testing.assert_allclose(candidate.embedding, current.embedding, rtol=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_worker_reembeds_jobs_of_another_backend():
+    repository = MemoryJobRepository()
+    old_service = EmbeddingService(backend=HashingBackend(dimension=16))
+    service = EmbeddingService(backend=HashingBackend(dimension=32))
+    [old_embedding] = old_service.encode_texts(["python developer"])
+    await repository.create_many(
+        [
+            Job(
+                id="tagged",
+                title="Python developer",
+                embedding=old_embedding,
+                embedding_model=old_service.backend_name,
+            ),
+            # Untagged, but of another dimension
+            Job(id="untagged", title="Java developer", embedding=old_embedding),
+        ]
+    )
+    worker = EmbeddingWorker(
+        lambda: service,
+        repository_scope=asynccontextmanager(lambda: _yield(repository)),
+    )
+
+    assert await worker.run_once() == 2
+    for job in await repository.list():
+        assert job.embedding_model == service.backend_name
+        assert len(job.embedding) == service.dimension
+
+    # The table is only checked again once the backend changes
+    assert await worker.run_once() == 0
@@ -0,0 +1,154 @@
+from contextlib import asynccontextmanager
+
+import numpy as np
+import pytest
+
+from adapters.repositories.memory.memory_job_repository import MemoryJobRepository
+from adapters.services.hashing_backend import HashingBackend
+from core.domain.candidate import Candidate
+from core.domain.job import Job
+from core.services.ann_index import IVFIndex
+from core.services.embedding_service import EmbeddingService
+from core.services.job_index_sync import JobIndexSync
+from core.services.match_cache import CorpusVersion
+from core.use_cases.match_jobs import MatchJobs
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _vector(seed, dim=8):
+    return np.random.default_rng(seed).normal(size=dim).astype(np.float32)
+
+
+async def _yield(value):
+    yield value
+
+
+@pytest.mark.asyncio
+async def test_sync_picks_up_writes_made_outside_the_process():
+    repository = MemoryJobRepository()
+    # Written by "another process": straight to the repository
+    await repository.create_many(
+        [
+            Job(id="a", title="A", embedding=_vector(1)),
+            Job(id="b", title="B", embedding=_vector(2)),
+            Job(id="c", title="C"),
+        ]
+    )
+    index = IVFIndex()
+    index.add("gone", _vector(9))  # From an outdated saved index
+    version = CorpusVersion()
+    clock = FakeClock()
+    sync = JobIndexSync(
+        index,
+        corpus_version=version,
+        interval=10,
+        chunk_size=2,
+        repository_scope=asynccontextmanager(lambda: _yield(repository)),
+        clock=clock,
+    )
+    assert not sync.is_current()
+
+    assert await sync.run_once()
+    assert sorted(index._positions) == ["a", "b"]
+    assert sync.is_current()
+    first_version = version.value
+
+    assert not await sync.run_once()
+    assert version.value == first_version
+
+    job_b = await repository.get("b")
+    job_b.embedding = _vector(3)
+    await repository.update("b", job_b)
+    await repository.create(Job(id="d", title="D", embedding=_vector(4)))
+    await repository.delete("a")
+
+    assert await sync.run_once()
+    assert sorted(index._positions) == ["b", "d"]
+    np.testing.assert_allclose(
+        index.search(_vector(3), 1)[0][1], 1.0, rtol=1e-5
+    )
+    assert version.value != first_version
+
+    clock.now = 25
+    assert not sync.is_current()
+
+
+@pytest.mark.asyncio
+async def test_match_scores_the_database_while_the_index_is_behind():
+    repository = MemoryJobRepository()
+    service = EmbeddingService(backend=HashingBackend(dimension=32))
+    [embedding] = service.encode_texts(["python developer"])
+    await repository.create(Job(id="new", title="Python developer", embedding=embedding))
+
+    index = IVFIndex()
+    index.add("old", _vector(5, dim=32))
+    sync = JobIndexSync(
+        index, repository_scope=asynccontextmanager(lambda: _yield(repository))
+    )
+    match_jobs = MatchJobs(
+        repository,
+        repository,
+        embedding_service=service,
+        job_index=index,
+        job_index_sync=sync,
+    )
+    candidate = Candidate(id="c", skills=["python"], embedding=embedding)
+
+    matches = await match_jobs.match_jobs_for_profile(candidate)
+    assert [match["job"].id for match in matches] == ["new"]
+
+    await sync.run_once()
+    assert "new" in index and "old" not in index
+
+
+@pytest.mark.asyncio
+async def test_jobs_of_another_backend_are_left_out_of_matches():
+    repository = MemoryJobRepository()
+    service = EmbeddingService(backend=HashingBackend(dimension=32))
+    [embedding] = service.encode_texts(["python developer"])
+    # Same dimension, another vector space
+    other_embedding = _vector(7, dim=32)
+    await repository.create_many(
+        [
+            Job(
+                id="current",
+                title="Python developer",
+                embedding=embedding,
+                embedding_model=service.backend_name,
+            ),
+            Job(
+                id="other",
+                title="Python developer",
+                embedding=other_embedding,
+                embedding_model="another-model",
+            ),
+        ]
+    )
+
+    index = IVFIndex()
+    sync = JobIndexSync(
+        index,
+        repository_scope=asynccontextmanager(lambda: _yield(repository)),
+        service_factory=lambda: service,
+    )
+    await sync.run_once()
+    assert "current" in index and "other" not in index
+
+    match_jobs = MatchJobs(repository, repository, embedding_service=service)
+    # Embedded by another backend: re-encoded for the request
+    candidate = Candidate(
+        id="c", skills=["python"], embedding=other_embedding, embedding_model="another-model"
+    )
+    matches = await match_jobs.match_jobs_for_profile(candidate)
+    assert [match["job"].id for match in matches] == ["current"]
+    [expected] = await match_jobs.match_jobs_for_profile(
+        Candidate(id="c", skills=["python"])
+    )
+    assert matches[0]["score"] == pytest.approx(expected["score"])
@@ -0,0 +1,49 @@
+from core.domain.candidate import Candidate
+from core.domain.job import Job
+from core.services.keyword_matcher import KeywordMatcher, job_keywords, tokenize
+
+
+def test_tokenize_keeps_skill_punctuation():
+    assert tokenize("Senior C++ / C# dev, Node.js and SQL.") == [
+        "senior", "c++", "c#", "dev", "node.js", "and", "sql",
+    ]
+
+
+def test_match_finds_all_hits_in_one_pass():
+    job = Job(
+        title="Data Engineer",
+        description="Python, SQL and machine learning pipelines",
+        location="Stockholm, Sweden",
+        requirements={"education": "Bachelor in CS", "experience": "Entry level"},
+    )
+    candidate = Candidate(
+        skills=["python", "Machine Learning", "java", "sql"],
+        location="stockholm",
+        education="bachelor",
+        experience="entry",
+    )
+
+    hits = KeywordMatcher(candidate).match(job)
+
+    assert hits.skills == ["python", "Machine Learning", "sql"]
+    assert hits.location and hits.education and hits.experience
+    assert hits.score == 10 + 3 * 5 + 8 + 6
+    assert KeywordMatcher(candidate).max_score == 10 + 4 * 5 + 8 + 6
+
+
+def test_skills_match_whole_tokens_only():
+    job = Job(title="JavaScript developer", description="")
+
+    hits = KeywordMatcher(Candidate(skills=["java"])).match(job)
+
+    assert hits.skills == []
+    assert hits.score == 0
+
+
+def test_job_keywords_are_computed_once():
+    job = Job(title="Python developer", description="")
+
+    keywords = job_keywords(job)
+    job.title = "Rust developer"
+
+    assert job_keywords(job) is keywords
@@ -0,0 +1,53 @@
+from core.domain.candidate import Candidate
+from core.services.match_cache import CorpusVersion, MatchCache, match_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hit_miss_and_ttl():
+    clock = FakeClock()
+    cache = MatchCache(ttl_seconds=10, clock=clock)
+
+    assert cache.get("a") is None
+    cache.put("a", [1], size=10)
+    assert cache.get("a") == [1]
+
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_eviction_by_count_and_bytes():
+    cache = MatchCache(max_entries=2, max_bytes=100)
+    cache.put("a", "A", size=10)
+    cache.put("b", "B", size=10)
+    cache.get("a")
+    cache.put("c", "C", size=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+
+    cache.put("d", "D", size=95)
+    assert len(cache) == 1
+    assert cache.stats()["bytes"] == 95
+    assert cache.stats()["evictions"] == 3
+
+
+def test_key_changes_with_profile_and_corpus_version():
+    version = CorpusVersion()
+    candidate = Candidate(skills=["python"], embedding=[0.1, 0.2])
+    key = match_cache_key(candidate, version.value, limit=10)
+
+    assert match_cache_key(candidate, version.value, limit=10) == key
+    assert match_cache_key(candidate, version.bump(), limit=10) != key
+    assert match_cache_key(candidate, 0, limit=5) != key
+    candidate.skills.append("sql")
+    assert match_cache_key(candidate, 0, limit=10) != key
@@ -0,0 +1,26 @@
+from adapters.services.hashing_backend import HashingBackend
+from core.services.embedding_cache import EmbeddingCache
+from core.services.model_registry import ModelRegistry
+
+
+class CountingBackend(HashingBackend):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def encode(self, texts, batch_size):
+        self.calls += 1
+        return super().encode(texts, batch_size)
+
+
+def test_warm_up_runs_the_model_even_when_the_text_is_cached():
+    backend = CountingBackend()
+    registry = ModelRegistry(
+        "test-model", embedding_cache=EmbeddingCache(), backend_factory=lambda name: backend
+    )
+    registry.get().encode_texts(["warm-up"])
+
+    registry.warm_up()
+
+    assert backend.calls == 2
+    assert registry.is_ready()
@@ -0,0 +1,41 @@
+import numpy as np
+from core.domain.job import Job
+from core.services.scoring_engine import ScoringEngine, top_k
+
+
+def test_score_matches_cosine_similarity():
+    rng = np.random.default_rng(0)
+    jobs = [Job(id=str(i), embedding=rng.normal(size=8).tolist()) for i in range(20)]
+    query = rng.normal(size=8)
+
+    engine = ScoringEngine.from_items(jobs)
+    scores = engine.score(query)
+
+    for i, job in enumerate(jobs):
+        vec = np.array(job.embedding)
+        expected = vec @ query / (np.linalg.norm(vec) * np.linalg.norm(query))
+        assert abs(scores[i] - expected) < 1e-5
+    assert engine.ids.tolist() == [job.id for job in jobs]
+
+
+def test_jobs_without_embeddings_are_skipped():
+    jobs = [Job(id="1", embedding=[1.0, 0.0]), Job(id="2"), Job(id="3", embedding=[])]
+
+    engine = ScoringEngine.from_items(jobs)
+
+    assert len(engine) == 1
+    assert engine.items[0].id == "1"
+
+
+def test_top_k_returns_best_first():
+    scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3])
+
+    assert top_k(scores, 3).tolist() == [1, 3, 2]
+    assert top_k(scores, 10).tolist() == [1, 3, 2, 4, 0]
+    assert top_k(scores, 0).tolist() == []
+
+
+def test_score_blocks_yields_nothing_for_no_embeddings():
+    engine = ScoringEngine.from_items([Job(id="1", embedding=[1.0, 0.0])])
+
+    assert list(engine.score_blocks([], max_block_bytes=1024)) == []
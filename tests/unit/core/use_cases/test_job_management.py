@@ -47,3 +47,38 @@ async def test_get_available_jobs():
     assert len(jobs) == 1
     assert jobs[0].id == "123"
     assert jobs[0].title == "Research Job"
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_in_one_batch():
+    mock_repo = AsyncMock()
+    jobs = [Job(title="Research Job"), Job(title="Data Job")]
+    mock_repo.create_many.side_effect = lambda batch: batch
+
+    use_case = JobManagement(mock_repo)
+    created, errors = await use_case.create_jobs(jobs)
+
+    mock_repo.create_many.assert_called_once_with(jobs)
+    mock_repo.create.assert_not_called()
+    assert created == jobs
+    assert errors == {}
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_falls_back_to_one_by_one():
+    mock_repo = AsyncMock()
+    jobs = [Job(title="Research Job"), Job(title="Bad Job"), Job(title="Data Job")]
+    mock_repo.create_many.side_effect = ValueError("batch failed")
+
+    async def create(job):
+        if job.title == "Bad Job":
+            raise ValueError("Duplicate entry\nmore details")
+        return job
+
+    mock_repo.create.side_effect = create
+
+    use_case = JobManagement(mock_repo)
+    created, errors = await use_case.create_jobs(jobs)
+
+    assert [job.title for job in created] == ["Research Job", "Data Job"]
+    assert errors == {1: "Duplicate entry"}
@@ -73,3 +73,12 @@ async def test_fallback_match():
     assert len(matches) > 0  # Should match at least one Job
     assert matches[0]["Job"].id == "123"  # Science Job should match
     assert len(matches[0]["match_reasons"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_match_jobs_for_profiles_without_candidates():
+    job_repo = AsyncMock()
+    use_case = MatchJobs(job_repo, AsyncMock())
+
+    assert await use_case.match_jobs_for_profiles([]) == {}
+    job_repo.find_available_for_scoring.assert_not_called()
@@ -0,0 +1,68 @@
+import json
+from datetime import date
+from unittest.mock import AsyncMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.domain.candidate import Candidate
+from core.domain.job import Job
+from frameworks.fastapi.dependencies import get_candidate_management, get_match_jobs
+from frameworks.fastapi.routes.match import router
+
+
+def _client(match_results):
+    candidate_management = AsyncMock()
+    candidate_management.get_candidate.return_value = Candidate(id="c1", name="Ada")
+    match_jobs = AsyncMock()
+    match_jobs.match_jobs_for_profile.return_value = match_results
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_candidate_management] = lambda: candidate_management
+    app.dependency_overrides[get_match_jobs] = lambda: match_jobs
+    return TestClient(app), match_jobs
+
+
+def test_stream_match_jobs_writes_one_ranked_match_per_line():
+    results = [
+        {
+            "job": Job(
+                id="j1",
+                title="Python developer",
+                description="Build APIs",
+                application_end_date=date(2026, 12, 31),
+            ),
+            "score": 91.5,
+            "match_reasons": ["💡 Matching skills: python"],
+        },
+        {
+            "job": Job(id="j2", title="Java developer", description="Build services"),
+            "score": 64.0,
+            "match_reasons": [],
+        },
+    ]
+    client, match_jobs = _client(results)
+
+    response = client.post("/match/stream", json={"candidate_id": "c1", "limit": 2})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert len(lines) == 2
+    first, second = (json.loads(line) for line in lines)
+    assert [first["job"]["id"], second["job"]["id"]] == ["j1", "j2"]
+    assert first["score"] == 91.5
+    assert first["match_reasons"] == ["💡 Matching skills: python"]
+    assert first["job"]["application_end_date"] == "2026-12-31"
+    assert second["job"]["application_end_date"] is None
+    assert match_jobs.match_jobs_for_profile.await_args.kwargs["limit"] == 2
+
+
+def test_match_limit_is_bounded():
+    client, match_jobs = _client([])
+
+    for limit in (0, 100000):
+        response = client.post("/match/stream", json={"candidate_id": "c1", "limit": limit})
+        assert response.status_code == 422
+    match_jobs.match_jobs_for_profile.assert_not_called()
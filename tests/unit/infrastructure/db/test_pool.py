@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.db.pool import InstrumentedPool
+
+
+@pytest.mark.asyncio
+async def test_pool_records_checkouts_and_utilization(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedPool,
+        pool_size=2,
+        max_overflow=2,
+    )
+    pool = engine.sync_engine.pool
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            stats = pool.stats()
+            assert stats["checked_out"] == 1
+            assert stats["utilization"] == 0.25
+
+        stats = pool.stats()
+        assert stats["checkouts"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["max_wait_ms"] >= stats["avg_wait_ms"] > 0
+    finally:
+        await engine.dispose()
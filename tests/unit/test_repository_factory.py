@@ -0,0 +1,36 @@
+import pytest
+from adapters.repositories.memory.memory_job_repository import MemoryJobRepository
+from core.ports.repositories.job_repository import JobRepository
+from repository_factory import SINGLETON, RepositoryFactory
+
+
+class SessionRepository(MemoryJobRepository):
+    def __init__(self, session=None):
+        super().__init__()
+        self.session = session
+
+
+def test_request_scoped_repositories_are_created_per_session():
+    factory = RepositoryFactory()
+    factory.register(JobRepository, SessionRepository)
+
+    first = factory.get(JobRepository, session="first")
+    second = factory.get(JobRepository, session="second")
+
+    assert first is not second
+    assert (first.session, second.session) == ("first", "second")
+
+
+def test_singletons_are_shared_and_not_bound_to_a_session():
+    factory = RepositoryFactory()
+    factory.register(JobRepository, SessionRepository, scope=SINGLETON)
+
+    first = factory.get(JobRepository, session="first")
+
+    assert factory.get(JobRepository, session="second") is first
+    assert first.session is None
+
+
+def test_unknown_scope_is_rejected():
+    with pytest.raises(ValueError):
+        RepositoryFactory().register(JobRepository, SessionRepository, scope="thread")